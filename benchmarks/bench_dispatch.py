@@ -0,0 +1,122 @@
+"""Compare type dispatch of flat_tax and discounts with the isinstance chains.
+
+The previous implementations are reproduced here, they checked the type of
+the value with a chain of isinstance calls and dispatched range endpoints
+through the public functions again.
+
+Usage: python benchmarks/bench_dispatch.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import timeit
+from decimal import ROUND_DOWN, Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prices import (  # noqa: E402 pylint: disable=wrong-import-position
+    Money, MoneyRange, TaxedMoney, TaxedMoneyRange, fixed_discount, flat_tax,
+    fractional_discount)
+
+
+def chain_flat_tax(base, tax_rate, *, keep_gross=False):
+    fraction = Decimal(1) + tax_rate
+    if isinstance(base, (MoneyRange, TaxedMoneyRange)):
+        return TaxedMoneyRange(
+            chain_flat_tax(base.start, tax_rate, keep_gross=keep_gross),
+            chain_flat_tax(base.stop, tax_rate, keep_gross=keep_gross))
+    if isinstance(base, TaxedMoney):
+        if keep_gross:
+            new_net = (base.net / fraction).quantize()
+            return TaxedMoney._create(new_net, base.gross)
+        new_gross = (base.gross * fraction).quantize()
+        return TaxedMoney._create(base.net, new_gross)
+    if isinstance(base, Money):
+        if keep_gross:
+            net = (base / fraction).quantize()
+            return TaxedMoney._create(net, base)
+        gross = (base * fraction).quantize()
+        return TaxedMoney._create(base, gross)
+    raise TypeError('Unknown base for flat_tax: %r' % (base,))
+
+
+def chain_fixed_discount(base, discount):
+    if isinstance(base, MoneyRange):
+        return MoneyRange(
+            chain_fixed_discount(base.start, discount),
+            chain_fixed_discount(base.stop, discount))
+    if isinstance(base, TaxedMoneyRange):
+        return TaxedMoneyRange(
+            chain_fixed_discount(base.start, discount),
+            chain_fixed_discount(base.stop, discount))
+    if isinstance(base, TaxedMoney):
+        return TaxedMoney._create(
+            chain_fixed_discount(base.net, discount),
+            chain_fixed_discount(base.gross, discount))
+    if isinstance(base, Money):
+        return max(base - discount, Money(0, base.currency))
+    raise TypeError('Unknown base for fixed_discount: %r' % (base,))
+
+
+def chain_fractional_discount(base, fraction, *, from_gross=True, rounding=ROUND_DOWN):
+    if isinstance(base, MoneyRange):
+        return MoneyRange(
+            chain_fractional_discount(
+                base.start, fraction, from_gross=from_gross, rounding=rounding),
+            chain_fractional_discount(
+                base.stop, fraction, from_gross=from_gross, rounding=rounding))
+    if isinstance(base, TaxedMoneyRange):
+        return TaxedMoneyRange(
+            chain_fractional_discount(
+                base.start, fraction, from_gross=from_gross, rounding=rounding),
+            chain_fractional_discount(
+                base.stop, fraction, from_gross=from_gross, rounding=rounding))
+    if isinstance(base, TaxedMoney):
+        if from_gross:
+            discount = (base.gross * fraction).quantize(rounding=rounding)
+        else:
+            discount = (base.net * fraction).quantize(rounding=rounding)
+        return chain_fixed_discount(base, discount)
+    if isinstance(base, Money):
+        discount = (base * fraction).quantize(rounding=rounding)
+        return chain_fixed_discount(base, discount)
+    raise TypeError('Unknown base for fractional_discount: %r' % (base,))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+    money = Money('10.00', 'USD')
+    taxed_money = TaxedMoney(money, Money('12.30', 'USD'))
+    values = [
+        ('Money', money),
+        ('TaxedMoney', taxed_money),
+        ('MoneyRange', MoneyRange(money, money)),
+        ('TaxedMoneyRange', TaxedMoneyRange(taxed_money, taxed_money))]
+    rate = Decimal('0.23')
+    fraction = Decimal('0.15')
+    discount = Money('1.00', 'USD')
+    functions = [
+        ('flat_tax', chain_flat_tax, flat_tax, (rate,)),
+        ('fixed_discount', chain_fixed_discount, fixed_discount, (discount,)),
+        ('fractional_discount', chain_fractional_discount,
+         fractional_discount, (fraction,))]
+    print('%-20s %-16s %10s %10s %8s' % (
+        'function', 'type', 'chain (us)', 'table (us)', 'speedup'))
+    for function_name, before, after, arguments in functions:
+        for type_name, value in values:
+            timings = []
+            for function in [before, after]:
+                best = min(timeit.repeat(
+                    lambda: function(value, *arguments),  # pylint: disable=cell-var-from-loop
+                    number=args.number, repeat=args.repeat))
+                timings.append(best / args.number * 1e6)
+            print('%-20s %-16s %10.2f %10.2f %7.2fx' % (
+                function_name, type_name, timings[0], timings[1],
+                timings[0] / timings[1]))
+
+
+if __name__ == '__main__':
+    main()
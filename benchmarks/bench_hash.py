@@ -0,0 +1,45 @@
+"""Compare keying sets and dicts on prices with keying them on tuples.
+
+Usage: python benchmarks/bench_hash.py [--size N]
+"""
+import argparse
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prices import Money, TaxedMoney  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    money = [
+        Money(Decimal(i % 500).scaleb(-2), 'USD') for i in range(args.size)]
+    taxed_money = [
+        TaxedMoney(value, value * Decimal('1.23')) for value in money]
+    cases = [
+        ('Money set()', lambda: set(money)),
+        ('Money tuple-key set()', lambda: {
+            (value.amount, value.currency) for value in money}),
+        ('Money dict lookup', lambda: [money_dict[value] for value in money]),
+        ('TaxedMoney set()', lambda: set(taxed_money)),
+        ('TaxedMoney tuple-key set()', lambda: {
+            (value.net.amount, value.gross.amount, value.currency)
+            for value in taxed_money}),
+        ('TaxedMoney dict lookup', lambda: [
+            taxed_dict[value] for value in taxed_money])]
+    money_dict = dict.fromkeys(money, 1)
+    taxed_dict = dict.fromkeys(taxed_money, 1)
+    for name, function in cases:
+        best = min(timeit.repeat(function, number=10, repeat=args.repeat))
+        print('%-28s %8.1f us per %d values' % (
+            name, best / 10 * 1e6, args.size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Measure the time it takes to import prices in a fresh interpreter.
+
+Usage: python benchmarks/bench_import.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    'import prices',
+    'from prices import Money',
+    'from prices import Money; Money(1, "USD").quantize()',
+    'import prices.tax, prices.discount']
+
+
+def measure(statement, runs):
+    code = (
+        'import time; start = time.perf_counter(); %s; '
+        'print(time.perf_counter() - start)' % (statement,))
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], env=env)
+        timings.append(float(output))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+    for statement in STATEMENTS:
+        timings = measure(statement, args.runs)
+        print('%-60s median %7.2f ms  min %7.2f ms' % (
+            statement, statistics.median(timings) * 1000,
+            min(timings) * 1000))
+
+
+if __name__ == '__main__':
+    main()
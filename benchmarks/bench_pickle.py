@@ -0,0 +1,74 @@
+"""Compare pickle size and round-trip time of prices with the previous format.
+
+The previous format pickled every nested object through its constructor, it
+is reproduced here with a pickler dispatch table.
+
+Usage: python benchmarks/bench_pickle.py [--size N]
+"""
+import argparse
+import io
+import os
+import pickle
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prices import (  # noqa: E402 pylint: disable=wrong-import-position
+    Money, MoneyRange, TaxedMoney, TaxedMoneyRange)
+
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+NESTED_REDUCERS = {
+    Money: lambda value: (Money, (value.amount, value.currency)),
+    TaxedMoney: lambda value: (TaxedMoney, (value.net, value.gross)),
+    MoneyRange: lambda value: (MoneyRange, (value.start, value.stop)),
+    TaxedMoneyRange: lambda value: (
+        TaxedMoneyRange, (value.start, value.stop))}
+
+
+def dumps_nested(value):
+    stream = io.BytesIO()
+    pickler = pickle.Pickler(stream, PROTOCOL)
+    pickler.dispatch_table = NESTED_REDUCERS
+    pickler.dump(value)
+    return stream.getvalue()
+
+
+def dumps_compact(value):
+    return pickle.dumps(value, PROTOCOL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    money = [
+        Money(Decimal(i % 5000).scaleb(-2), 'USD') for i in range(args.size)]
+    taxed_money = [
+        TaxedMoney(value, value * Decimal('1.23')) for value in money]
+    samples = [
+        ('Money', money),
+        ('TaxedMoney', taxed_money),
+        ('MoneyRange', [
+            MoneyRange(value, value + value) for value in money]),
+        ('TaxedMoneyRange', [
+            TaxedMoneyRange(value, value + value) for value in taxed_money])]
+    print('%-16s %-8s %12s %12s %14s' % (
+        'type', 'format', 'single (B)', 'list (B)', 'round-trip (ms)'))
+    for name, values in samples:
+        for format_name, dumps in [
+                ('nested', dumps_nested), ('compact', dumps_compact)]:
+            single = len(dumps(values[0]))
+            data = dumps(values)
+            best = min(timeit.repeat(
+                lambda: pickle.loads(dumps(values)),  # pylint: disable=cell-var-from-loop
+                number=1, repeat=args.repeat))
+            print('%-16s %-8s %12d %12d %14.1f' % (
+                name, format_name, single, len(data), best * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Measure how catalog repricing scales with the number of worker processes.
+
+Every run reprices the same catalog of Money, TaxedMoney and MoneyRange
+values with a discount followed by a flat tax and is compared with
+`PricingPipeline.apply_many` in the current process. Pool startup is
+included in the timings, as it is for a single call of `reprice`.
+
+Usage: python benchmarks/bench_repricing.py [--size N] [--processes 1,2,4]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prices import (  # noqa: E402 pylint: disable=wrong-import-position
+    Money, MoneyRange, PricingPipeline, TaxedMoney, flat_tax,
+    percentage_discount, reprice)
+
+STEPS = (
+    partial(percentage_discount, percentage=15),
+    partial(flat_tax, tax_rate=Decimal('0.23')))
+
+
+def catalog(size, seed=0):
+    rng = random.Random(seed)
+    values = []
+    for index in range(size):
+        amount = Decimal(rng.randint(1, 10 ** 6)).scaleb(-2)
+        money = Money(amount, 'USD')
+        kind = index % 3
+        if kind == 0:
+            values.append(money)
+        elif kind == 1:
+            values.append(TaxedMoney(money, money * Decimal('1.08')))
+        else:
+            values.append(MoneyRange(money, money * 2))
+    return values
+
+
+def best_of(repeat, function):
+    timings = []
+    for _attempt in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    default_processes = sorted({
+        1, 2, 4, os.cpu_count() or 1})
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200000)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--processes', default=','.join(map(str, default_processes)),
+        help='comma separated numbers of processes to try')
+    args = parser.parse_args()
+    values = catalog(args.size)
+    pipeline = PricingPipeline(*STEPS)
+    serial = best_of(args.repeat, lambda: pipeline.apply_many(values))
+    print('%-12s %10s %12s %8s' % ('processes', 'time (s)', 'prices/s', 'speedup'))
+    print('%-12s %10.3f %12d %7.2fx' % (
+        'serial', serial, args.size / serial, 1))
+    for processes in map(int, args.processes.split(',')):
+        elapsed = best_of(args.repeat, lambda: list(reprice(  # pylint: disable=cell-var-from-loop
+            values, *STEPS, processes=processes,  # pylint: disable=cell-var-from-loop
+            chunk_size=args.chunk_size)))
+        print('%-12d %10.3f %12d %7.2fx' % (
+            processes, elapsed, args.size / elapsed, serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
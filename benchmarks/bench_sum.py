@@ -0,0 +1,41 @@
+"""Compare prices.sum with summing through the + operator.
+
+Usage: python benchmarks/bench_sum.py [--size N]
+"""
+import argparse
+import functools
+import operator
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prices import Money, TaxedMoney, sum  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def reduce_sum(values):
+    return functools.reduce(operator.add, values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    money = [
+        Money(Decimal(i % 10000).scaleb(-2), 'USD') for i in range(args.size)]
+    taxed_money = [
+        TaxedMoney(value, value * Decimal('1.23')) for value in money]
+    for label, values in [('Money', money), ('TaxedMoney', taxed_money)]:
+        for name, function in [('reduce', reduce_sum), ('prices.sum', sum)]:
+            number = max(1, 100000 // args.size)
+            best = min(timeit.repeat(
+                lambda: function(values), number=number, repeat=args.repeat))
+            print('%-10s %-10s %8.1f us per %d values' % (
+                label, name, best / number * 1e6, args.size))
+
+
+if __name__ == '__main__':
+    main()
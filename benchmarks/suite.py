@@ -0,0 +1,649 @@
+"""Run the microbenchmark suite of prices and compare results between runs.
+
+Every public class and function has at least one benchmark, along with
+workloads such as cart totals and catalog repricing. Inputs are generated
+from fixed seeds so runs are reproducible.
+
+Usage:
+    python benchmarks/suite.py list
+    python benchmarks/suite.py run [-o results.json] [--filter 'money.*']
+    python benchmarks/suite.py run --compare baseline.json
+    python benchmarks/suite.py compare baseline.json results.json
+"""
+import argparse
+import fnmatch
+import json
+import os
+import pickle
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+from decimal import Decimal
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import prices  # noqa: E402 pylint: disable=wrong-import-position
+from prices import (  # noqa: E402 pylint: disable=wrong-import-position
+    CurrencyConverter, IntegerMoney, Money, MoneyAccumulator, MoneyArray,
+    MoneyBag, MoneyRange, PriceCache, PricingPipeline, RangeIndex, RateTable,
+    TaxRate, TaxedMoney, TaxedMoneyAccumulator, TaxedMoneyBag,
+    TaxedMoneyRange, allocate, allocate_many, build_ranges, fixed_discount,
+    flat_tax, flat_tax_many, fractional_discount, get_currency_exponent,
+    percentage_discount, sort_prices)
+from prices import binary  # noqa: E402 pylint: disable=wrong-import-position
+from prices import json as prices_json  # noqa: E402 pylint: disable=wrong-import-position
+
+BENCHMARKS = {}
+SIZE = 1000
+TAX_RATE = Decimal('0.23')
+
+
+def benchmark(name):
+    """Register a factory returning the callable to time under `name`."""
+    def decorator(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return decorator
+
+
+def amounts(size=SIZE, seed=0):
+    rng = random.Random(seed)
+    return [Decimal(rng.randint(1, 100000)).scaleb(-2) for _ in range(size)]
+
+
+def money_values(size=SIZE, currency='USD'):
+    return [Money(amount, currency) for amount in amounts(size)]
+
+
+def taxed_money_values(size=SIZE):
+    return [flat_tax(value, TAX_RATE) for value in money_values(size)]
+
+
+USD_10 = Money('10.00', 'USD')
+USD_3 = Money('3.50', 'USD')
+TAXED_10 = TaxedMoney(Money('10.00', 'USD'), Money('12.30', 'USD'))
+TAXED_3 = TaxedMoney(Money('3.50', 'USD'), Money('4.31', 'USD'))
+RANGE = MoneyRange(Money('3.50', 'USD'), Money('10.00', 'USD'))
+TAXED_RANGE = TaxedMoneyRange(TAXED_3, TAXED_10)
+
+
+# Money
+
+@benchmark('money.init')
+def _money_init():
+    amount = Decimal('9.99')
+    return lambda: Money(amount, 'USD')
+
+
+@benchmark('money.add')
+def _money_add():
+    return lambda: USD_10 + USD_3
+
+
+@benchmark('money.sub')
+def _money_sub():
+    return lambda: USD_10 - USD_3
+
+
+@benchmark('money.mul')
+def _money_mul():
+    return lambda: USD_10 * 3
+
+
+@benchmark('money.truediv')
+def _money_truediv():
+    return lambda: USD_10 / 3
+
+
+@benchmark('money.lt')
+def _money_lt():
+    return lambda: USD_3 < USD_10
+
+
+@benchmark('money.gt')
+def _money_gt():
+    return lambda: USD_10 > USD_3
+
+
+@benchmark('money.eq')
+def _money_eq():
+    other = Money('10.00', 'USD')
+    return lambda: USD_10 == other
+
+
+@benchmark('money.hash')
+def _money_hash():
+    return lambda: hash(USD_10)
+
+
+@benchmark('money.quantize')
+def _money_quantize():
+    value = Money('9.999', 'USD')
+    return value.quantize
+
+
+@benchmark('money.from_rows[1000]')
+def _money_from_rows():
+    rows = [(amount, 'USD') for amount in amounts()]
+    return lambda: Money.from_rows(rows)
+
+
+# TaxedMoney
+
+@benchmark('taxed_money.init')
+def _taxed_money_init():
+    return lambda: TaxedMoney(USD_10, USD_3)
+
+
+@benchmark('taxed_money.add')
+def _taxed_money_add():
+    return lambda: TAXED_10 + TAXED_3
+
+
+@benchmark('taxed_money.mul')
+def _taxed_money_mul():
+    return lambda: TAXED_10 * 3
+
+
+@benchmark('taxed_money.tax')
+def _taxed_money_tax():
+    return lambda: TAXED_10.tax
+
+
+@benchmark('taxed_money.quantize')
+def _taxed_money_quantize():
+    return TAXED_10.quantize
+
+
+@benchmark('taxed_money.from_rows[1000]')
+def _taxed_money_from_rows():
+    rows = [(amount, amount * 2, 'USD') for amount in amounts()]
+    return lambda: TaxedMoney.from_rows(rows)
+
+
+# Ranges
+
+@benchmark('money_range.init')
+def _money_range_init():
+    return lambda: MoneyRange(USD_3, USD_10)
+
+
+@benchmark('money_range.add')
+def _money_range_add():
+    return lambda: RANGE + USD_3
+
+
+@benchmark('money_range.contains')
+def _money_range_contains():
+    price = Money(5, 'USD')
+    return lambda: price in RANGE
+
+
+@benchmark('money_range.quantize')
+def _money_range_quantize():
+    return RANGE.quantize
+
+
+@benchmark('taxed_money_range.init')
+def _taxed_money_range_init():
+    return lambda: TaxedMoneyRange(TAXED_3, TAXED_10)
+
+
+@benchmark('taxed_money_range.add')
+def _taxed_money_range_add():
+    return lambda: TAXED_RANGE + TAXED_3
+
+
+@benchmark('taxed_money_range.contains')
+def _taxed_money_range_contains():
+    price = TaxedMoney(Money(5, 'USD'), Money(6, 'USD'))
+    return lambda: price in TAXED_RANGE
+
+
+@benchmark('taxed_money_range.quantize')
+def _taxed_money_range_quantize():
+    return TAXED_RANGE.quantize
+
+
+# IntegerMoney and MoneyArray
+
+@benchmark('integer_money.add')
+def _integer_money_add():
+    first = IntegerMoney(1000, 'USD')
+    second = IntegerMoney(350, 'USD')
+    return lambda: first + second
+
+
+@benchmark('integer_money.quantize')
+def _integer_money_quantize():
+    value = IntegerMoney(9999, 'USD', 3)
+    return value.quantize
+
+
+@benchmark('integer_money.from_money')
+def _integer_money_from_money():
+    return lambda: IntegerMoney.from_money(USD_10)
+
+
+@benchmark('money_array.from_money[1000]')
+def _money_array_from_money():
+    values = money_values()
+    return lambda: MoneyArray.from_money(values)
+
+
+@benchmark('money_array.mul_sum[1000]')
+def _money_array_mul_sum():
+    values = MoneyArray.from_money(money_values())
+    return lambda: (values * Decimal('1.23')).sum()
+
+
+@benchmark('money_array.quantize[1000]')
+def _money_array_quantize():
+    values = MoneyArray.from_money(money_values()) * Decimal('1.23')
+    return values.quantize
+
+
+# Taxes and discounts
+
+@benchmark('tax.flat_tax.money')
+def _flat_tax_money():
+    return lambda: flat_tax(USD_10, TAX_RATE)
+
+
+@benchmark('tax.flat_tax.keep_gross')
+def _flat_tax_keep_gross():
+    return lambda: flat_tax(TAXED_10, TAX_RATE, keep_gross=True)
+
+
+@benchmark('tax.tax_rate.money')
+def _tax_rate_money():
+    tax_rate = TaxRate(TAX_RATE)
+    return lambda: flat_tax(USD_10, tax_rate)
+
+
+@benchmark('tax.tax_rate.keep_gross')
+def _tax_rate_keep_gross():
+    tax_rate = TaxRate('0.25')
+    return lambda: flat_tax(TAXED_10, tax_rate, keep_gross=True)
+
+
+@benchmark('tax.flat_tax.range')
+def _flat_tax_range():
+    return lambda: flat_tax(RANGE, TAX_RATE)
+
+
+@benchmark('tax.flat_tax_many[1000]')
+def _flat_tax_many():
+    values = money_values()
+    return lambda: flat_tax_many(values, TAX_RATE)
+
+
+@benchmark('discount.fixed')
+def _fixed_discount():
+    return lambda: fixed_discount(TAXED_10, USD_3)
+
+
+@benchmark('discount.fractional')
+def _fractional_discount():
+    fraction = Decimal('0.15')
+    return lambda: fractional_discount(TAXED_10, fraction)
+
+
+@benchmark('discount.percentage')
+def _percentage_discount():
+    return lambda: percentage_discount(USD_10, 15)
+
+
+@benchmark('discount.percentage.range')
+def _percentage_discount_range():
+    return lambda: percentage_discount(TAXED_RANGE, 15)
+
+
+@benchmark('utils.sum.money[1000]')
+def _sum_money():
+    values = money_values()
+    return lambda: prices.sum(values)
+
+
+@benchmark('utils.sum.taxed_money[1000]')
+def _sum_taxed_money():
+    values = taxed_money_values()
+    return lambda: prices.sum(values)
+
+
+@benchmark('accumulator.money[1000]')
+def _money_accumulator():
+    values = money_values()
+    return lambda: MoneyAccumulator().update(values).result()
+
+
+@benchmark('accumulator.taxed_money[1000]')
+def _taxed_money_accumulator():
+    values = taxed_money_values()
+    return lambda: TaxedMoneyAccumulator().update(values).result()
+
+
+@benchmark('money_bag.update[1000]')
+def _money_bag_update():
+    values = [
+        value for pair in zip(money_values(SIZE // 2, 'USD'),
+                              money_values(SIZE // 2, 'EUR'))
+        for value in pair]
+    return lambda: MoneyBag(values)
+
+
+@benchmark('taxed_money_bag.update[1000]')
+def _taxed_money_bag_update():
+    values = taxed_money_values()
+    return lambda: TaxedMoneyBag(values)
+
+
+@benchmark('allocation.allocate[1000]')
+def _allocate():
+    weights = amounts()
+    return lambda: allocate(USD_10, weights)
+
+
+@benchmark('allocation.allocate_many[3x1000]')
+def _allocate_many():
+    weights = amounts()
+    values = [USD_10, USD_3, TAXED_10]
+    return lambda: allocate_many(values, weights)
+
+
+@benchmark('sort.money.sorted[1000]')
+def _sort_money_sorted():
+    values = money_values()
+    return lambda: sorted(values)
+
+
+@benchmark('sort.money.sort_prices[1000]')
+def _sort_money_sort_prices():
+    values = money_values()
+    return lambda: sort_prices(values)
+
+
+@benchmark('sort.taxed_money.sorted[1000]')
+def _sort_taxed_money_sorted():
+    values = taxed_money_values()
+    return lambda: sorted(values)
+
+
+@benchmark('sort.taxed_money.sort_prices[1000]')
+def _sort_taxed_money_sort_prices():
+    values = taxed_money_values()
+    return lambda: sort_prices(values)
+
+
+@benchmark('pipeline.apply')
+def _pipeline_apply():
+    pipeline = PricingPipeline(
+        partial(percentage_discount, percentage=10),
+        partial(flat_tax, tax_rate=TAX_RATE))
+    return lambda: pipeline(USD_10)
+
+
+@benchmark('pipeline.apply_many[1000]')
+def _pipeline_apply_many():
+    pipeline = PricingPipeline(
+        partial(percentage_discount, percentage=10),
+        partial(fixed_discount, discount=Money(1, 'USD')),
+        partial(flat_tax, tax_rate=TAX_RATE))
+    values = money_values()
+    return lambda: pipeline.apply_many(values)
+
+
+@benchmark('cache.flat_tax.hit')
+def _cache_hit():
+    cache = PriceCache()
+    cache.flat_tax(USD_10, TAX_RATE)
+    return lambda: cache.flat_tax(USD_10, TAX_RATE)
+
+
+# Indexing, grouping and conversion
+
+@benchmark('range_index.build[1000]')
+def _range_index_build():
+    ranges = [
+        (index, MoneyRange(value, value * 2))
+        for index, value in enumerate(money_values())]
+    return lambda: RangeIndex(ranges)
+
+
+@benchmark('range_index.containing[1000]')
+def _range_index_containing():
+    index = RangeIndex(
+        (index, MoneyRange(value, value + Money(10, 'USD')))
+        for index, value in enumerate(money_values()))
+    return lambda: index.containing(Money(500, 'USD'))
+
+
+@benchmark('range_builder.build_ranges[1000]')
+def _build_ranges():
+    pairs = [(index // 10, value) for index, value in enumerate(
+        money_values())]
+    return lambda: build_ranges(pairs)
+
+
+@benchmark('exchange.convert')
+def _convert():
+    converter = CurrencyConverter(RateTable('EUR', {'USD': '1.0850'}))
+    return lambda: converter.convert(USD_10, 'EUR')
+
+
+@benchmark('exchange.convert_many[1000]')
+def _convert_many():
+    converter = CurrencyConverter(RateTable('EUR', {'USD': '1.0850'}))
+    values = taxed_money_values()
+    return lambda: converter.convert_many(values, 'EUR')
+
+
+@benchmark('currency.get_exponent')
+def _get_exponent():
+    get_currency_exponent('USD')
+    return lambda: get_currency_exponent('USD')
+
+
+# Serialization
+
+@benchmark('binary.encode_many[1000]')
+def _binary_encode():
+    values = taxed_money_values()
+    return lambda: binary.encode_many(values)
+
+
+@benchmark('binary.decode_many[1000]')
+def _binary_decode():
+    data = binary.encode_many(taxed_money_values())
+    return lambda: binary.decode_many(data)
+
+
+@benchmark('json.iterencode[1000]')
+def _json_encode():
+    values = taxed_money_values()
+    return lambda: ''.join(prices_json.iterencode(values))
+
+
+@benchmark('json.iterdecode[1000]')
+def _json_decode():
+    text = ''.join(prices_json.iterencode(taxed_money_values()))
+    return lambda: list(prices_json.iterdecode([text]))
+
+
+@benchmark('pickle.round_trip[1000]')
+def _pickle_round_trip():
+    values = taxed_money_values()
+    return lambda: pickle.loads(
+        pickle.dumps(values, pickle.HIGHEST_PROTOCOL))
+
+
+# Workloads
+
+@benchmark('workload.cart_total[50]')
+def _cart_total():
+    rng = random.Random(1)
+    lines = [
+        (Money(amount, 'USD'), rng.randint(1, 5))
+        for amount in amounts(50, seed=1)]
+
+    def cart_total():
+        total = prices.sum(
+            percentage_discount(price * quantity, 10)
+            for price, quantity in lines)
+        return flat_tax(total, TAX_RATE).quantize()
+    return cart_total
+
+
+@benchmark('workload.catalog_repricing[1000]')
+def _catalog_repricing():
+    values = money_values()
+    discount = Money(1, 'USD')
+
+    def reprice():
+        return [
+            flat_tax(
+                fixed_discount(percentage_discount(value, 10), discount),
+                TAX_RATE).quantize()
+            for value in values]
+    return reprice
+
+
+def measure(function, repeat, min_time):
+    timer = timeit.Timer(function)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_time:
+            break
+        loops *= 2
+    samples = [
+        elapsed / loops for elapsed in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        'loops': loops,
+        'samples': samples,
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0}
+
+
+def metadata():
+    return {
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine()}
+
+
+def format_time(seconds):
+    for unit, scale in [('s', 1), ('ms', 1e-3), ('us', 1e-6)]:
+        if seconds >= scale:
+            return '%.2f %s' % (seconds / scale, unit)
+    return '%.0f ns' % (seconds / 1e-9,)
+
+
+def selected(patterns):
+    if not patterns:
+        return list(BENCHMARKS)
+    return [
+        name for name in BENCHMARKS
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)]
+
+
+def run(args):
+    results = {}
+    for name in selected(args.filter):
+        result = measure(BENCHMARKS[name](), args.repeat, args.min_time)
+        results[name] = result
+        print('%-40s %12s +- %s' % (
+            name, format_time(result['median']), format_time(result['stdev'])))
+    data = {'metadata': metadata(), 'benchmarks': results}
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(data, fp, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        print()
+        before = {
+            name: result for name, result in baseline['benchmarks'].items()
+            if name in results}
+        return report(before, results, args.threshold)
+    return 0
+
+
+def report(before, after, threshold):
+    """Print the change of each benchmark, return 1 if any regressed."""
+    regressions = []
+    for name in sorted(set(before) & set(after)):
+        ratio = after[name]['median'] / before[name]['median']
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            status = 'faster'
+        else:
+            status = ''
+        print('%-40s %12s -> %12s  %6.2fx %s' % (
+            name, format_time(before[name]['median']),
+            format_time(after[name]['median']), ratio, status))
+    for name in sorted(set(before) - set(after)):
+        print('%-40s missing from current results' % (name,))
+    for name in sorted(set(after) - set(before)):
+        print('%-40s missing from baseline' % (name,))
+    if regressions:
+        print('\n%d benchmarks slower by more than %d%%: %s' % (
+            len(regressions), threshold * 100, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+def compare(args):
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+    with open(args.current) as fp:
+        current = json.load(fp)
+    return report(
+        baseline['benchmarks'], current['benchmarks'], args.threshold)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    commands.add_parser('list', help='list benchmark names')
+    run_parser = commands.add_parser('run', help='run benchmarks')
+    run_parser.add_argument(
+        '--filter', action='append',
+        help='glob pattern of benchmark names to run, can be repeated')
+    run_parser.add_argument('--repeat', type=int, default=7)
+    run_parser.add_argument(
+        '--min-time', type=float, default=0.05,
+        help='minimum duration of a single sample in seconds')
+    run_parser.add_argument('-o', '--output', help='file to store results in')
+    run_parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help='compare results against a stored baseline')
+    compare_parser = commands.add_parser(
+        'compare', help='compare two stored results')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    for command_parser in [run_parser, compare_parser]:
+        command_parser.add_argument(
+            '--threshold', type=float, default=0.1,
+            help='relative slowdown reported as a regression')
+    args = parser.parse_args()
+    if args.command == 'list':
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+    if args.command == 'run':
+        return run(args)
+    return compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
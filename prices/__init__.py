@@ -2,16 +2,94 @@
 
 Provides a Pythonic interface to deal with money types such as money amounts,
 prices, discounts and taxes.
+
+Public names are imported from their submodules on first access so that
+`import prices` stays cheap.
 """
-from .discount import (
-    fixed_discount, fractional_discount, percentage_discount)
-from .money import Money
-from .money_range import MoneyRange
-from .tax import flat_tax
-from .taxed_money import TaxedMoney
-from .taxed_money_range import TaxedMoneyRange
-from .utils import sum
-
-__all__ = [
-    'Money', 'MoneyRange', 'TaxedMoney', 'TaxedMoneyRange', 'fixed_discount',
-    'flat_tax', 'fractional_discount', 'percentage_discount', 'sum']
+from importlib import import_module
+
+# Spelled out instead of imported from `typing` to keep the import cheap,
+# type checkers recognize the name either way.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .accumulator import MoneyAccumulator, TaxedMoneyAccumulator
+    from .allocation import allocate, allocate_many
+    from .cache import PriceCache
+    from .currency import (
+        currency_cache_info, get_currency_exponent, get_currency_precision,
+        register_currency, unregister_currency, warm_currency_cache)
+    from .discount import (
+        fixed_discount, fractional_discount, percentage_discount)
+    from .exchange import CurrencyConverter, RateTable
+    from .integer_money import IntegerMoney
+    from .money import Money
+    from .money_array import MoneyArray
+    from .money_bag import MoneyBag, TaxedMoneyBag
+    from .money_range import MoneyRange
+    from .pipeline import PricingPipeline
+    from .range_builder import RangeBuilder, build_ranges
+    from .range_index import RangeIndex
+    from .repricing import Repricer, reprice
+    from .sorting import sort_by_currency, sort_key, sort_prices
+    from .tax import TaxRate, flat_tax, flat_tax_many
+    from .taxed_money import TaxedMoney
+    from .taxed_money_range import TaxedMoneyRange
+    from .utils import sum
+
+_EXPORTS = {
+    'CurrencyConverter': 'exchange',
+    'IntegerMoney': 'integer_money',
+    'Money': 'money',
+    'MoneyAccumulator': 'accumulator',
+    'MoneyArray': 'money_array',
+    'MoneyBag': 'money_bag',
+    'MoneyRange': 'money_range',
+    'PriceCache': 'cache',
+    'PricingPipeline': 'pipeline',
+    'RangeBuilder': 'range_builder',
+    'RangeIndex': 'range_index',
+    'RateTable': 'exchange',
+    'Repricer': 'repricing',
+    'TaxRate': 'tax',
+    'TaxedMoney': 'taxed_money',
+    'TaxedMoneyAccumulator': 'accumulator',
+    'TaxedMoneyBag': 'money_bag',
+    'TaxedMoneyRange': 'taxed_money_range',
+    'allocate': 'allocation',
+    'allocate_many': 'allocation',
+    'build_ranges': 'range_builder',
+    'currency_cache_info': 'currency',
+    'fixed_discount': 'discount',
+    'flat_tax': 'tax',
+    'flat_tax_many': 'tax',
+    'fractional_discount': 'discount',
+    'get_currency_exponent': 'currency',
+    'get_currency_precision': 'currency',
+    'percentage_discount': 'discount',
+    'register_currency': 'currency',
+    'reprice': 'repricing',
+    'sort_by_currency': 'sorting',
+    'sort_key': 'sorting',
+    'sort_prices': 'sorting',
+    'sum': 'utils',
+    'unregister_currency': 'currency',
+    'warm_currency_cache': 'currency'}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import public names from their submodules on first access."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            'module %r has no attribute %r' % (__name__, name)) from None
+    value = getattr(import_module('.' + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,148 @@
+from decimal import Decimal
+from typing import Iterable, Optional, Tuple, Union
+
+from .money import Money
+from .taxed_money import TaxedMoney
+
+Numeric = Union[int, Decimal]
+
+
+class MoneyAccumulator:
+    """Adds up `Money` in place.
+
+    The first amount added sets the currency unless it was given upfront,
+    the total is kept as a decimal and turned into `Money` by `result`:
+
+        total = MoneyAccumulator()
+        for price, quantity in lines:
+            total.add(price, quantity)
+        total.result()
+    """
+
+    __slots__ = ('currency', 'amount')
+
+    def __init__(self, currency: Optional[str] = None) -> None:
+        self.currency = currency
+        self.amount = None  # type: Optional[Decimal]
+
+    def __repr__(self) -> str:
+        return 'MoneyAccumulator(%r, amount=%r)' % (
+            self.currency, self.amount)
+
+    def add(self, money: Money, quantity: Numeric = 1) -> 'MoneyAccumulator':
+        """Add `quantity` times the given amount to the total."""
+        if not isinstance(money, Money):
+            raise TypeError(
+                'MoneyAccumulator can only add Money, got %r' % (money,))
+        currency = self.currency
+        if money.currency != currency:
+            if currency is not None:
+                raise ValueError(
+                    'Cannot add amount in %r to %r' % (
+                        currency, money.currency))
+            self.currency = money.currency
+        amount = money.amount
+        # Multiplying by a decimal one could still change the exponent
+        if quantity != 1 or type(quantity) is not int:  # pylint: disable=unidiomatic-typecheck
+            amount = amount * quantity
+        self.amount = amount if self.amount is None else self.amount + amount
+        return self
+
+    __iadd__ = add
+
+    def update(self, values: Iterable[Money]) -> 'MoneyAccumulator':
+        """Add each of the given amounts to the total."""
+        for money in values:
+            self.add(money)
+        return self
+
+    def result(self) -> Money:
+        """Return the total as `Money`.
+
+        Raises `ValueError` if nothing was added and no currency was given.
+        """
+        amount = self.amount
+        currency = self.currency
+        if currency is None:
+            raise ValueError('Cannot tell the currency of an empty total')
+        if amount is None:
+            return Money(0, currency)
+        return Money._create(amount, currency)  # pylint: disable=protected-access
+
+
+class TaxedMoneyAccumulator:
+    """Adds up `TaxedMoney` and `Money` in place.
+
+    `Money` is added to both the net and gross totals, like with the `+`
+    operator. The result is built once by `result`.
+    """
+
+    __slots__ = ('currency', 'net', 'gross')
+
+    def __init__(self, currency: Optional[str] = None) -> None:
+        self.currency = currency
+        self.net = None  # type: Optional[Decimal]
+        self.gross = None  # type: Optional[Decimal]
+
+    def __repr__(self) -> str:
+        return 'TaxedMoneyAccumulator(%r, net=%r, gross=%r)' % (
+            self.currency, self.net, self.gross)
+
+    def _amounts(self, price: Union[Money, TaxedMoney]) -> Tuple[Decimal, Decimal]:
+        if isinstance(price, TaxedMoney):
+            return price.net.amount, price.gross.amount
+        if isinstance(price, Money):
+            return price.amount, price.amount
+        raise TypeError(
+            'TaxedMoneyAccumulator can only add TaxedMoney or Money, got %r' % (
+                price,))
+
+    def add(
+            self, price: Union[Money, TaxedMoney],
+            quantity: Numeric = 1) -> 'TaxedMoneyAccumulator':
+        """Add `quantity` times the given price to the totals."""
+        net, gross = self._amounts(price)
+        currency = self.currency
+        if price.currency != currency:
+            if currency is not None:
+                raise ValueError(
+                    'Cannot add amount in %r to %r' % (
+                        currency, price.currency))
+            self.currency = price.currency
+        if quantity != 1 or type(quantity) is not int:  # pylint: disable=unidiomatic-typecheck
+            net = net * quantity
+            gross = gross * quantity
+        total_net = self.net
+        total_gross = self.gross
+        if total_net is None or total_gross is None:
+            self.net = net
+            self.gross = gross
+        else:
+            self.net = total_net + net
+            self.gross = total_gross + gross
+        return self
+
+    __iadd__ = add
+
+    def update(self, values: Iterable[Union[Money, TaxedMoney]]) -> 'TaxedMoneyAccumulator':
+        """Add each of the given prices to the totals."""
+        for price in values:
+            self.add(price)
+        return self
+
+    def result(self) -> TaxedMoney:
+        """Return the totals as `TaxedMoney`.
+
+        Raises `ValueError` if nothing was added and no currency was given.
+        """
+        currency = self.currency
+        net = self.net
+        gross = self.gross
+        if currency is None:
+            raise ValueError('Cannot tell the currency of an empty total')
+        if net is None or gross is None:
+            zero = Money(0, currency)
+            return TaxedMoney._create(zero, zero)  # pylint: disable=protected-access
+        create_money = Money._create  # pylint: disable=protected-access
+        return TaxedMoney._create(  # pylint: disable=protected-access
+            create_money(net, currency), create_money(gross, currency))
@@ -0,0 +1,127 @@
+from decimal import Decimal
+from heapq import nlargest
+from math import gcd
+from typing import Iterable, List, Sequence, Tuple, TypeVar, Union
+
+from .currency import registry
+from .integer_money import IntegerMoney, decimal_to_units, units_to_decimal
+from .money import Money
+from .taxed_money import TaxedMoney
+
+Numeric = Union[int, Decimal]
+
+T = TypeVar('T', Money, TaxedMoney)
+
+
+def _integer_weights(weights: Iterable[Numeric]) -> Tuple[List[int], int]:
+    """Scale weights to integers keeping their ratios, return them and their sum."""
+    ratios = []
+    denominator = 1
+    for weight in weights:
+        if isinstance(weight, Decimal):
+            if not weight.is_finite():
+                raise ValueError('Weights must be finite, got %r' % (weight,))
+            ratio = weight.as_integer_ratio()
+            if denominator % ratio[1]:
+                denominator = denominator * ratio[1] // gcd(
+                    denominator, ratio[1])
+        elif isinstance(weight, int):
+            ratio = weight, 1
+        else:
+            raise TypeError(
+                'Weights must be integers or decimals, got %r' % (weight,))
+        if ratio[0] < 0:
+            raise ValueError('Weights cannot be negative, got %r' % (weight,))
+        ratios.append(ratio)
+    if not ratios:
+        raise ValueError('Cannot allocate to an empty list of weights')
+    integer_weights = []
+    total = 0
+    for numerator, weight_denominator in ratios:
+        weight = numerator * (denominator // weight_denominator)
+        integer_weights.append(weight)
+        total += weight
+    if not total:
+        raise ValueError('Cannot allocate to weights adding up to zero')
+    return integer_weights, total
+
+
+def _split_units(units: int, weights: List[int], total: int) -> List[int]:
+    """Split units in proportion to weights using the largest remainder method.
+
+    Every part gets the floor of its exact share, the units left over go one
+    each to the parts with the largest remainders, earlier parts win ties.
+    """
+    if units < 0:
+        return [-part for part in _split_units(-units, weights, total)]
+    parts = []
+    remainders = []
+    allocated = 0
+    for weight in weights:
+        part, remainder = divmod(units * weight, total)
+        parts.append(part)
+        remainders.append(remainder)
+        allocated += part
+    leftover = units - allocated
+    if leftover:
+        for index in nlargest(
+                leftover, range(len(parts)), key=remainders.__getitem__):
+            parts[index] += 1
+    return parts
+
+
+def _allocate_money(money: Money, weights: List[int], total: int) -> List[Money]:
+    currency = money.currency
+    if isinstance(money, IntegerMoney):
+        precision = money.precision
+        return [
+            IntegerMoney._from_units(part, currency, precision)  # pylint: disable=protected-access
+            for part in _split_units(money.units, weights, total)]
+    units, precision = decimal_to_units(
+        money.amount, registry.get_precision(currency))
+    create = Money._create  # pylint: disable=protected-access
+    return [
+        create(units_to_decimal(part, precision), currency)
+        for part in _split_units(units, weights, total)]
+
+
+def _allocate(value: T, weights: List[int], total: int) -> List[T]:
+    if isinstance(value, TaxedMoney):
+        # Splitting gross and tax keeps the tax of every part on the same
+        # side of zero as the total tax
+        grosses = _allocate_money(value.gross, weights, total)
+        taxes = _allocate_money(value.tax, weights, total)
+        return [
+            TaxedMoney._create(gross - tax, gross)  # pylint: disable=protected-access
+            for gross, tax in zip(grosses, taxes)]
+    if isinstance(value, Money):
+        return _allocate_money(value, weights, total)
+    raise TypeError('Cannot allocate %r' % (value,))
+
+
+def allocate(value: T, weights: Iterable[Numeric]) -> List[T]:
+    """Split a price into parts proportional to the given weights.
+
+    Parts are quantized to the precision of the currency, or to that of the
+    amount if it has more decimal places, and always add up to `value`
+    exactly. The cents left over after rounding every part down go to the
+    parts that lost the most to rounding:
+
+        allocate(Money(10, 'USD'), [1, 1, 1])
+        # [Money('3.34', 'USD'), Money('3.33', 'USD'), Money('3.33', 'USD')]
+
+    `TaxedMoney` is split by gross and tax amount.
+    """
+    integer_weights, total = _integer_weights(weights)
+    return _allocate(value, integer_weights, total)
+
+
+def allocate_many(values: Sequence[T], weights: Iterable[Numeric]) -> List[List[T]]:
+    """Split each of the given prices across the same weights.
+
+    Equivalent to calling `allocate` for every value, the weights are
+    validated and scaled once. Useful to spread discounts, shipping and
+    taxes of a cart across its lines.
+    """
+    integer_weights, total = _integer_weights(weights)
+    return [_allocate(value, integer_weights, total) for value in values]
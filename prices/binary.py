@@ -0,0 +1,224 @@
+"""Compact binary encoding of prices.
+
+Every value starts with a type tag byte followed by its currency and the
+amounts it holds. The currency is a single byte indexing `CURRENCIES` or, for
+codes outside that table, a zero byte followed by the length-prefixed ASCII
+code. Each amount is a varint of its coefficient shifted left by one with the
+sign in the lowest bit, followed by a zigzag varint of its exponent, which
+keeps the exact decimal including its exponent and the sign of zero.
+
+A batch is a varint count followed by that many values. Currency codes must
+only ever be appended to `CURRENCIES` to keep encoded data readable.
+"""
+from decimal import Decimal
+from typing import Iterable, List, Tuple, Union
+
+from .money import Money
+from .money_range import MoneyRange
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+Price = Union[Money, TaxedMoney, MoneyRange, TaxedMoneyRange]
+Buffer = Union[bytes, bytearray, memoryview]
+
+MONEY = 1
+TAXED_MONEY = 2
+MONEY_RANGE = 3
+TAXED_MONEY_RANGE = 4
+
+CURRENCIES = (
+    'USD', 'EUR', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD', 'NZD', 'CNY', 'HKD',
+    'SGD', 'SEK', 'NOK', 'DKK', 'PLN', 'CZK', 'HUF', 'RON', 'BGN', 'TRY',
+    'RUB', 'UAH', 'INR', 'IDR', 'KRW', 'THB', 'MYR', 'PHP', 'VND', 'TWD',
+    'BRL', 'MXN', 'ARS', 'CLP', 'COP', 'PEN', 'ZAR', 'NGN', 'EGP', 'KES',
+    'ILS', 'AED', 'SAR', 'QAR', 'KWD', 'BHD', 'OMR', 'JOD', 'ISK', 'BTC')
+
+_CURRENCY_CODES = {
+    currency: index for index, currency in enumerate(CURRENCIES, 1)}
+
+
+def _write_varint(out: bytearray, number: int) -> None:
+    while number > 0x7f:
+        out.append((number & 0x7f) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _write_currency(out: bytearray, currency: str) -> None:
+    code = _CURRENCY_CODES.get(currency)
+    if code is not None:
+        out.append(code)
+        return
+    data = currency.encode('ascii')
+    if len(data) > 0xff:
+        raise ValueError('Currency code %r is too long' % (currency,))
+    out.append(0)
+    out.append(len(data))
+    out += data
+
+
+def _write_amount(out: bytearray, amount: Decimal) -> None:
+    sign, digits, exponent = amount.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError('Cannot encode %r' % (amount,))
+    coefficient = 0
+    for digit in digits:
+        coefficient = coefficient * 10 + digit
+    _write_varint(out, coefficient << 1 | sign)
+    _write_varint(out, exponent << 1 if exponent >= 0 else ~exponent << 1 | 1)
+
+
+def _write_value(out: bytearray, value: Price) -> None:
+    if isinstance(value, Money):
+        out.append(MONEY)
+        _write_currency(out, value.currency)
+        _write_amount(out, value.amount)
+    elif isinstance(value, TaxedMoney):
+        out.append(TAXED_MONEY)
+        _write_currency(out, value.currency)
+        _write_amount(out, value.net.amount)
+        _write_amount(out, value.gross.amount)
+    elif isinstance(value, TaxedMoneyRange):
+        out.append(TAXED_MONEY_RANGE)
+        _write_currency(out, value.currency)
+        _write_amount(out, value.start.net.amount)
+        _write_amount(out, value.start.gross.amount)
+        _write_amount(out, value.stop.net.amount)
+        _write_amount(out, value.stop.gross.amount)
+    elif isinstance(value, MoneyRange):
+        out.append(MONEY_RANGE)
+        _write_currency(out, value.currency)
+        _write_amount(out, value.start.amount)
+        _write_amount(out, value.stop.amount)
+    else:
+        raise TypeError('Cannot encode %s' % (type(value),))
+
+
+def _read_varint(view: memoryview, position: int) -> Tuple[int, int]:
+    byte = view[position]
+    position += 1
+    number = byte & 0x7f
+    shift = 7
+    while byte & 0x80:
+        byte = view[position]
+        position += 1
+        number |= (byte & 0x7f) << shift
+        shift += 7
+    return number, position
+
+
+def _read_currency(view: memoryview, position: int) -> Tuple[str, int]:
+    code = view[position]
+    if code:
+        if code > len(CURRENCIES):
+            raise ValueError(
+                'Unknown currency code %r at offset %d' % (code, position))
+        return CURRENCIES[code - 1], position + 1
+    length = view[position + 1]
+    start = position + 2
+    end = start + length
+    if end > len(view):
+        raise IndexError(end)
+    return str(view[start:end], 'ascii'), end
+
+
+def _read_amount(view: memoryview, position: int) -> Tuple[Decimal, int]:
+    coefficient, position = _read_varint(view, position)
+    exponent = view[position]
+    if exponent & 0x80:
+        exponent, position = _read_varint(view, position)
+    else:
+        position += 1
+    if exponent & 1:
+        exponent = ~(exponent >> 1)
+    else:
+        exponent >>= 1
+    return Decimal('%s%dE%d' % (
+        '-' if coefficient & 1 else '', coefficient >> 1, exponent)), position
+
+
+def _read_value(view: memoryview, position: int) -> Tuple[Price, int]:
+    tag = view[position]
+    if not MONEY <= tag <= TAXED_MONEY_RANGE:
+        raise ValueError('Unknown type tag %r at offset %d' % (tag, position))
+    currency, position = _read_currency(view, position + 1)
+    if tag == MONEY:
+        amount, position = _read_amount(view, position)
+        return Money._create(amount, currency), position  # pylint: disable=protected-access
+    create_money = Money._create  # pylint: disable=protected-access
+    create_taxed_money = TaxedMoney._create  # pylint: disable=protected-access
+    if tag == TAXED_MONEY:
+        net, position = _read_amount(view, position)
+        gross, position = _read_amount(view, position)
+        return create_taxed_money(
+            create_money(net, currency), create_money(gross, currency)), position
+    if tag == TAXED_MONEY_RANGE:
+        amounts = []
+        for _index in range(4):
+            amount, position = _read_amount(view, position)
+            amounts.append(create_money(amount, currency))
+        return TaxedMoneyRange._create(  # pylint: disable=protected-access
+            create_taxed_money(amounts[0], amounts[1]),
+            create_taxed_money(amounts[2], amounts[3])), position
+    start, position = _read_amount(view, position)
+    stop, position = _read_amount(view, position)
+    return MoneyRange._create(  # pylint: disable=protected-access
+        create_money(start, currency), create_money(stop, currency)), position
+
+
+def encode(value: Price) -> bytes:
+    """Encode a single price.
+
+    Instances of `Money` subclasses are encoded, and decoded, as `Money`.
+    """
+    out = bytearray()
+    _write_value(out, value)
+    return bytes(out)
+
+
+def encode_many(values: Iterable[Price]) -> bytes:
+    """Encode a sequence of prices into a single buffer."""
+    out = bytearray()
+    body = bytearray()
+    number = 0
+    for value in values:
+        _write_value(body, value)
+        number += 1
+    _write_varint(out, number)
+    out += body
+    return bytes(out)
+
+
+def decode(data: Buffer) -> Price:
+    """Decode a single price encoded with `encode`."""
+    view = memoryview(data).cast('B')
+    try:
+        value, position = _read_value(view, 0)
+    except IndexError:
+        raise ValueError('Truncated price data') from None
+    if position != len(view):
+        raise ValueError(
+            'Unexpected %d bytes after the encoded price' % (
+                len(view) - position,))
+    return value
+
+
+def decode_many(data: Buffer) -> List[Price]:
+    """Decode a buffer produced by `encode_many`.
+
+    The buffer is read in place through a `memoryview`.
+    """
+    view = memoryview(data).cast('B')
+    try:
+        number, position = _read_varint(view, 0)
+        values = []
+        for _index in range(number):
+            value, position = _read_value(view, position)
+            values.append(value)
+    except IndexError:
+        raise ValueError('Truncated price data') from None
+    if position != len(view):
+        raise ValueError(
+            'Unexpected %d bytes after the encoded prices' % (
+                len(view) - position,))
+    return values
@@ -0,0 +1,135 @@
+from collections import OrderedDict, namedtuple
+from decimal import ROUND_DOWN, Decimal
+from threading import Lock
+from typing import Callable, Hashable, Optional
+
+from .discount import fractional_discount, percentage_discount
+from .money import Money
+from .money_range import MoneyRange
+from .tax import flat_tax
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+def _amount_key(amount: Decimal) -> str:
+    # Equal decimals can differ in exponent and sign of zero, both of which
+    # carry over to the results. The string form keeps both and is cheaper to
+    # build than `as_tuple`.
+    return str(amount)
+
+
+def _price_key(value) -> Optional[Hashable]:
+    """Return a key identifying a price exactly, or None if it's unsupported."""
+    value_type = type(value)
+    if value_type is Money:
+        return value.currency, _amount_key(value.amount)
+    if value_type is TaxedMoney:
+        return (
+            value.currency, _amount_key(value.net.amount),
+            _amount_key(value.gross.amount))
+    if value_type is MoneyRange or value_type is TaxedMoneyRange:
+        start = _price_key(value.start)
+        stop = _price_key(value.stop)
+        if start is None or stop is None:
+            return None
+        return value_type, start, stop
+    return None
+
+
+def _number_key(value) -> Hashable:
+    if isinstance(value, Decimal):
+        return _amount_key(value)
+    return type(value), value
+
+
+class PriceCache:
+    """A bounded, thread-safe LRU cache of tax and discount results.
+
+    Results are keyed on the exact amounts, currency, rate and flags, so a
+    hit returns the same object the function would have computed. Values of
+    types other than the four price classes are passed through uncached.
+
+        cache = PriceCache(maxsize=4096)
+        cache.flat_tax(Money('9.99', 'EUR'), Decimal('0.23'))
+    """
+
+    __slots__ = ('maxsize', '_entries', '_lock', 'hits', 'misses', 'evictions')
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(
+                'Cache size must be a positive integer, got %r' % (maxsize,))
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, key: Hashable, compute: Callable):
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def flat_tax(self, base, tax_rate, *, keep_gross=False):
+        """Return `flat_tax` of the arguments, computing it on a miss."""
+        base_key = _price_key(base)
+        if base_key is None:
+            return flat_tax(base, tax_rate, keep_gross=keep_gross)
+        key = (flat_tax, base_key, _number_key(tax_rate), keep_gross)
+        return self._get(
+            key, lambda: flat_tax(base, tax_rate, keep_gross=keep_gross))
+
+    def fractional_discount(self, base, fraction, *, from_gross=True, rounding=ROUND_DOWN):
+        """Return `fractional_discount` of the arguments, computing it on a miss."""
+        base_key = _price_key(base)
+        if base_key is None:
+            return fractional_discount(
+                base, fraction, from_gross=from_gross, rounding=rounding)
+        key = (
+            fractional_discount, base_key, _number_key(fraction), from_gross,
+            rounding)
+        return self._get(key, lambda: fractional_discount(
+            base, fraction, from_gross=from_gross, rounding=rounding))
+
+    def percentage_discount(self, base, percentage, *, from_gross=True, rounding=ROUND_DOWN):
+        """Return `percentage_discount` of the arguments, computing it on a miss."""
+        base_key = _price_key(base)
+        if base_key is None:
+            return percentage_discount(
+                base, percentage, from_gross=from_gross, rounding=rounding)
+        key = (
+            percentage_discount, base_key, _number_key(percentage),
+            from_gross, rounding)
+        return self._get(key, lambda: percentage_discount(
+            base, percentage, from_gross=from_gross, rounding=rounding))
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize,
+            len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
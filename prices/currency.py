@@ -0,0 +1,145 @@
+from collections import namedtuple
+from decimal import Decimal
+from threading import Lock
+from typing import Dict, Iterable, Optional
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize'])
+
+
+class CurrencyRegistry:
+    """Caches the quantization exponent of each currency.
+
+    Precision is looked up in babel the first time a currency is seen and
+    reused afterwards, babel itself is only imported at that point.
+    Precision registered explicitly takes priority over babel's data, which
+    makes it possible to support custom currencies.
+    """
+
+    __slots__ = ('_exponents', '_precisions', '_overrides', '_lock', 'hits', 'misses')
+
+    def __init__(self) -> None:
+        self._exponents = {}  # type: Dict[str, Decimal]
+        self._precisions = {}  # type: Dict[str, int]
+        self._overrides = {}  # type: Dict[str, int]
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_exponent(self, currency: str) -> Decimal:
+        """Return the exponent to quantize amounts in the given currency."""
+        try:
+            exponent = self._exponents[currency]
+        except KeyError:
+            self.misses += 1
+            return self._load(currency)
+        self.hits += 1
+        return exponent
+
+    def get_precision(self, currency: str) -> int:
+        """Return the number of decimal places used by the given currency."""
+        try:
+            precision = self._precisions[currency]
+        except KeyError:
+            self.misses += 1
+            self._load(currency)
+            return self._precisions[currency]
+        self.hits += 1
+        return precision
+
+    def register(self, currency: str, precision: int) -> None:
+        """Set the precision of a currency, overriding babel's data."""
+        if precision < 0:
+            raise ValueError(
+                'Currency precision cannot be negative, got %r' % (precision,))
+        with self._lock:
+            self._overrides[currency] = precision
+            self._store(currency, precision)
+
+    def unregister(self, currency: str) -> None:
+        """Remove precision registered for a currency."""
+        with self._lock:
+            del self._overrides[currency]
+            self._exponents.pop(currency, None)
+            self._precisions.pop(currency, None)
+
+    def warm(self, currencies: Iterable[str]) -> None:
+        """Precompute exponents of the given currencies."""
+        for currency in currencies:
+            if currency not in self._exponents:
+                self._load(currency)
+
+    def clear(self) -> None:
+        """Forget cached exponents and reset the counters.
+
+        Precision registered with `register` is kept.
+        """
+        with self._lock:
+            self._exponents.clear()
+            self._precisions.clear()
+            for currency, precision in self._overrides.items():
+                self._store(currency, precision)
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics."""
+        return CacheInfo(self.hits, self.misses, len(self._exponents))
+
+    def _load(self, currency: str) -> Decimal:
+        precision = self._overrides.get(currency)
+        if precision is None:
+            precision = _babel_precision(currency)
+        with self._lock:
+            return self._store(currency, precision)
+
+    def _store(self, currency: str, precision: int) -> Decimal:
+        exponent = Decimal(1).scaleb(-precision)
+        self._precisions[currency] = precision
+        self._exponents[currency] = exponent
+        return exponent
+
+
+def _babel_precision(currency: str) -> int:
+    from babel.numbers import (  # pylint: disable=import-outside-toplevel
+        get_currency_precision as babel_currency_precision)
+    return babel_currency_precision(currency)
+
+
+registry = CurrencyRegistry()
+
+
+def get_currency_exponent(currency: str) -> Decimal:
+    """Return the exponent to quantize amounts in the given currency."""
+    return registry.get_exponent(currency)
+
+
+def get_currency_precision(currency: str) -> int:
+    """Return the number of decimal places used by the given currency."""
+    return registry.get_precision(currency)
+
+
+def register_currency(currency: str, precision: int) -> None:
+    """Set the precision of a currency, overriding babel's data."""
+    registry.register(currency, precision)
+
+
+def unregister_currency(currency: str) -> None:
+    """Remove precision registered for a currency."""
+    registry.unregister(currency)
+
+
+def warm_currency_cache(currencies: Optional[Iterable[str]] = None) -> None:
+    """Precompute exponents of the given currencies.
+
+    If no currencies are given all currencies known to babel are loaded.
+    """
+    if currencies is None:
+        from babel.numbers import (  # pylint: disable=import-outside-toplevel
+            list_currencies)
+        currencies = list_currencies()
+    registry.warm(currencies)
+
+
+def currency_cache_info() -> CacheInfo:
+    """Report hits and misses of the currency cache."""
+    return registry.cache_info()
@@ -1,6 +1,8 @@
 from decimal import Decimal, ROUND_DOWN
 from typing import TypeVar, Union
 
+from . import instrumentation
+from .dispatch import Dispatcher
 from .money import Money
 from .money_range import MoneyRange
 from .taxed_money import TaxedMoney
@@ -12,47 +14,124 @@ T = TypeVar('T', Money, MoneyRange, TaxedMoney, TaxedMoneyRange)
 
 
 def fixed_discount(base: T, discount: Money) -> T:
-    """Apply a fixed discount to any price type."""
-    if isinstance(base, MoneyRange):
-        return MoneyRange(
-            fixed_discount(base.start, discount),
-            fixed_discount(base.stop, discount))
-    if isinstance(base, TaxedMoneyRange):
-        return TaxedMoneyRange(
-            fixed_discount(base.start, discount),
-            fixed_discount(base.stop, discount))
-    if isinstance(base, TaxedMoney):
-        return TaxedMoney(
-            net=fixed_discount(base.net, discount),
-            gross=fixed_discount(base.gross, discount))
-    if isinstance(base, Money):
-        return max(base - discount, Money(0, base.currency))
-    raise TypeError('Unknown base for fixed_discount: %r' % (base,))
+    """Apply a fixed discount to any price type.
+
+    Support for other price types is added with `fixed_discount.register`,
+    the handler is called with `base` and `discount`. Registrations are
+    undone with `fixed_discount.unregister`.
+    """
+    try:
+        handler = _fixed_discount.cache[type(base)]
+    except KeyError:
+        handler = _fixed_discount.resolve(base)
+    return handler(base, discount)
+
+
+_fixed_discount = Dispatcher('fixed_discount')
+fixed_discount.register = _fixed_discount.register  # type: ignore
+fixed_discount.unregister = _fixed_discount.unregister  # type: ignore
+fixed_discount.dispatcher = _fixed_discount  # type: ignore
+instrumentation.register_dispatcher(_fixed_discount)
+
+
+@_fixed_discount.register(Money)
+def _fixed_discount_money(base: Money, discount: Money) -> Money:
+    return max(base - discount, Money(0, base.currency))
+
+
+@_fixed_discount.register(TaxedMoney)
+def _fixed_discount_taxed_money(base: TaxedMoney, discount: Money) -> TaxedMoney:
+    return TaxedMoney._create(  # pylint: disable=protected-access
+        _fixed_discount_money(base.net, discount),
+        _fixed_discount_money(base.gross, discount))
+
+
+@_fixed_discount.register(MoneyRange)
+def _fixed_discount_money_range(base: MoneyRange, discount: Money) -> MoneyRange:
+    return MoneyRange(
+        _fixed_discount_money(base.start, discount),
+        _fixed_discount_money(base.stop, discount))
+
+
+@_fixed_discount.register(TaxedMoneyRange)
+def _fixed_discount_taxed_money_range(base: TaxedMoneyRange, discount: Money) -> TaxedMoneyRange:
+    return TaxedMoneyRange(
+        _fixed_discount_taxed_money(base.start, discount),
+        _fixed_discount_taxed_money(base.stop, discount))
+
+
+_fixed_discount.seal()
 
 
 def fractional_discount(base: T, fraction: Decimal, *, from_gross=True, rounding=ROUND_DOWN) -> T:
-    """Apply a fractional discount based on either gross or net amount."""
-    if isinstance(base, MoneyRange):
-        return MoneyRange(
-            fractional_discount(base.start, fraction, from_gross=from_gross),
-            fractional_discount(base.stop, fraction, from_gross=from_gross))
-    if isinstance(base, TaxedMoneyRange):
-        return TaxedMoneyRange(
-            fractional_discount(base.start, fraction, from_gross=from_gross),
-            fractional_discount(base.stop, fraction, from_gross=from_gross))
-    if isinstance(base, TaxedMoney):
-        if from_gross:
-            discount = (base.gross * fraction).quantize(rounding=rounding)
-        else:
-            discount = (base.net * fraction).quantize(rounding=rounding)
-        return fixed_discount(base, discount)
-    if isinstance(base, Money):
-        discount = (base * fraction).quantize(rounding=rounding)
-        return fixed_discount(base, discount)
-    raise TypeError('Unknown base for fractional_discount: %r' % (base,))
+    """Apply a fractional discount based on either gross or net amount.
+
+    The discount is quantized with `rounding`, for ranges too, where both
+    ends are discounted separately. Support for other price types is added
+    with `fractional_discount.register`, the handler is called with `base`,
+    `fraction`, `from_gross` and `rounding` as positional arguments.
+    Registrations are undone with `fractional_discount.unregister`.
+    """
+    try:
+        handler = _fractional_discount.cache[type(base)]
+    except KeyError:
+        handler = _fractional_discount.resolve(base)
+    return handler(base, fraction, from_gross, rounding)
+
+
+_fractional_discount = Dispatcher('fractional_discount')
+fractional_discount.register = _fractional_discount.register  # type: ignore
+fractional_discount.unregister = _fractional_discount.unregister  # type: ignore
+fractional_discount.dispatcher = _fractional_discount  # type: ignore
+instrumentation.register_dispatcher(_fractional_discount)
+
+
+@_fractional_discount.register(Money)
+def _fractional_discount_money(
+        base: Money, fraction: Decimal, _from_gross: bool, rounding) -> Money:
+    discount = (base * fraction).quantize(rounding=rounding)
+    return _fixed_discount_money(base, discount)
+
+
+@_fractional_discount.register(TaxedMoney)
+def _fractional_discount_taxed_money(
+        base: TaxedMoney, fraction: Decimal, from_gross: bool,
+        rounding) -> TaxedMoney:
+    if from_gross:
+        discount = (base.gross * fraction).quantize(rounding=rounding)
+    else:
+        discount = (base.net * fraction).quantize(rounding=rounding)
+    return _fixed_discount_taxed_money(base, discount)
+
+
+@_fractional_discount.register(MoneyRange)
+def _fractional_discount_money_range(
+        base: MoneyRange, fraction: Decimal, from_gross: bool,
+        rounding) -> MoneyRange:
+    return MoneyRange(
+        _fractional_discount_money(base.start, fraction, from_gross, rounding),
+        _fractional_discount_money(base.stop, fraction, from_gross, rounding))
+
+
+@_fractional_discount.register(TaxedMoneyRange)
+def _fractional_discount_taxed_money_range(
+        base: TaxedMoneyRange, fraction: Decimal, from_gross: bool,
+        rounding) -> TaxedMoneyRange:
+    return TaxedMoneyRange(
+        _fractional_discount_taxed_money(
+            base.start, fraction, from_gross, rounding),
+        _fractional_discount_taxed_money(
+            base.stop, fraction, from_gross, rounding))
+
+
+_fractional_discount.seal()
 
 
 def percentage_discount(base: T, percentage: Numeric, *, from_gross=True, rounding=ROUND_DOWN) -> T:
     """Apply a percentage discount based on either gross or net amount."""
     factor = Decimal(percentage) / 100
+    if instrumentation.enabled:
+        return instrumentation.timed(
+            'percentage_discount', fractional_discount, base, factor,
+            from_gross=from_gross, rounding=rounding)
     return fractional_discount(base, factor, from_gross=from_gross, rounding=rounding)
@@ -0,0 +1,70 @@
+from typing import Callable, Dict, Optional
+
+
+class Dispatcher:
+    """Maps price types to the handlers of a function.
+
+    Handlers are found with a single lookup on the exact type of the value,
+    subclasses resolve to the handler of their nearest registered base the
+    first time they are seen and are cached from then on.
+    """
+
+    __slots__ = ('name', 'handlers', 'builtins', 'cache', 'wrapper')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.handlers = {}  # type: Dict[type, Callable]
+        self.builtins = {}  # type: Dict[type, Callable]
+        self.cache = {}  # type: Dict[type, Callable]
+        self.wrapper = None  # type: Optional[Callable[[Callable], Callable]]
+
+    def register(self, cls: type, handler: Optional[Callable] = None):
+        """Register the handler of a type, can be used as a decorator."""
+        if handler is None:
+            return lambda function: self.register(cls, function)
+        self.handlers[cls] = handler
+        self._fill_cache()
+        return handler
+
+    def unregister(self, cls: type) -> None:
+        """Remove the handler registered for a type."""
+        del self.handlers[cls]
+        self._fill_cache()
+
+    def seal(self) -> None:
+        """Remember the handlers registered so far as the built-in ones."""
+        self.builtins = dict(self.handlers)
+
+    def is_builtin(self, cls: type) -> bool:
+        """Tell whether a type is still handled by its built-in handler.
+
+        Registering, unregistering and wrapping handlers replace `cache`, so
+        callers can keep a reference to it to tell when to check again.
+        """
+        handler = self.builtins.get(cls)
+        return handler is not None and self.handlers.get(cls) is handler
+
+    def wrap(self, wrapper: Optional[Callable[[Callable], Callable]]) -> None:
+        """Pass every handler through `wrapper` from now on, `None` stops it."""
+        self.wrapper = wrapper
+        self._fill_cache()
+
+    def _fill_cache(self) -> None:
+        wrapper = self.wrapper
+        if wrapper is None:
+            self.cache = dict(self.handlers)
+        else:
+            self.cache = {
+                cls: wrapper(handler) for cls, handler in self.handlers.items()}
+
+    def resolve(self, value: object) -> Callable:
+        """Return the handler of a value whose type is not cached yet."""
+        cls = type(value)
+        for base in cls.__mro__:
+            handler = self.handlers.get(base)
+            if handler is not None:
+                if self.wrapper is not None:
+                    handler = self.wrapper(handler)
+                self.cache[cls] = handler
+                return handler
+        raise TypeError('Unknown base for %s: %r' % (self.name, value))
@@ -0,0 +1,133 @@
+from decimal import ROUND_HALF_UP, Decimal
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
+
+from .currency import registry
+from .money import Money
+from .money_range import MoneyRange
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+Numeric = Union[int, str, Decimal]
+Price = Union[Money, TaxedMoney, MoneyRange, TaxedMoneyRange]
+
+
+class RateTable:
+    """An immutable set of exchange rates with all cross rates precomputed.
+
+    `rates` maps currencies to their value of one unit of the `base`
+    currency. The rate between every pair of currencies is computed once,
+    when the table is created.
+
+        table = RateTable('EUR', {'USD': '1.0850', 'PLN': '4.3210'})
+        table.get_rate('USD', 'PLN')
+    """
+
+    __slots__ = ('base', 'rates', '_cross_rates')
+
+    def __init__(self, base: str, rates: Mapping[str, Numeric]) -> None:
+        decimal_rates = {base: Decimal(1)}
+        for currency, rate in rates.items():
+            rate = Decimal(rate)
+            if not rate.is_finite() or rate <= 0:
+                raise ValueError(
+                    'Exchange rate of %r must be positive, got %r' % (
+                        currency, rate))
+            if currency == base and rate != 1:
+                raise ValueError(
+                    'Exchange rate of the base currency must be 1, got %r' % (
+                        rate,))
+            decimal_rates[currency] = rate
+        cross_rates = {}  # type: Dict[Tuple[str, str], Decimal]
+        for source, source_rate in decimal_rates.items():
+            for target, target_rate in decimal_rates.items():
+                cross_rates[source, target] = (
+                    Decimal(1) if source == target
+                    else target_rate / source_rate)
+        self.base = base
+        self.rates = MappingProxyType(decimal_rates)
+        self._cross_rates = cross_rates
+
+    def __repr__(self) -> str:
+        return 'RateTable(%r, %r)' % (self.base, dict(self.rates))
+
+    def get_rate(self, from_currency: str, to_currency: str) -> Decimal:
+        """Return the value of one unit of `from_currency` in `to_currency`."""
+        try:
+            return self._cross_rates[from_currency, to_currency]
+        except KeyError:
+            raise ValueError(
+                'No exchange rate from %r to %r' % (
+                    from_currency, to_currency)) from None
+
+
+class CurrencyConverter:
+    """Converts prices between currencies using the current `RateTable`.
+
+    Results are quantized to the precision of the target currency. A new
+    table is installed with `load` by replacing a single reference, reads
+    take no locks and every call uses one table throughout.
+    """
+
+    __slots__ = ('table',)
+
+    def __init__(self, table: RateTable) -> None:
+        self.table = table
+
+    def load(self, table: RateTable) -> None:
+        """Replace the exchange rates used for further conversions."""
+        self.table = table
+
+    def get_rate(self, from_currency: str, to_currency: str) -> Decimal:
+        """Return the value of one unit of `from_currency` in `to_currency`."""
+        return self.table.get_rate(from_currency, to_currency)
+
+    def convert(self, value: Price, currency: str, rounding=ROUND_HALF_UP) -> Price:
+        """Convert a price to the given currency."""
+        if type(value) is Money:  # pylint: disable=unidiomatic-typecheck
+            rate = self.table.get_rate(value.currency, currency)
+            return Money._create(  # pylint: disable=protected-access
+                (value.amount * rate).quantize(
+                    registry.get_exponent(currency), rounding=rounding),
+                currency)
+        return self.convert_many((value,), currency, rounding=rounding)[0]
+
+    def convert_many(
+            self, values: Iterable[Price], currency: str,
+            rounding=ROUND_HALF_UP) -> List[Price]:
+        """Convert many prices to the given currency."""
+        get_rate = self.table.get_rate
+        exponent = registry.get_exponent(currency)
+        create = Money._create  # pylint: disable=protected-access
+        rates = {}  # type: Dict[str, Decimal]
+
+        def convert_money(money: Money) -> Money:
+            source = money.currency
+            rate = rates.get(source)
+            if rate is None:
+                rate = rates[source] = get_rate(source, currency)
+            return create(
+                (money.amount * rate).quantize(exponent, rounding=rounding),
+                currency)
+
+        def convert_taxed_money(price: TaxedMoney) -> TaxedMoney:
+            return TaxedMoney._create(  # pylint: disable=protected-access
+                convert_money(price.net), convert_money(price.gross))
+
+        results = []  # type: List[Price]
+        for value in values:
+            if isinstance(value, Money):
+                results.append(convert_money(value))
+            elif isinstance(value, TaxedMoney):
+                results.append(convert_taxed_money(value))
+            elif isinstance(value, TaxedMoneyRange):
+                # Rounding never reverses the order of the bounds
+                results.append(TaxedMoneyRange._create(  # pylint: disable=protected-access
+                    convert_taxed_money(value.start),
+                    convert_taxed_money(value.stop)))
+            elif isinstance(value, MoneyRange):
+                results.append(MoneyRange._create(  # pylint: disable=protected-access
+                    convert_money(value.start), convert_money(value.stop)))
+            else:
+                raise TypeError('Cannot convert %s' % (type(value),))
+        return results
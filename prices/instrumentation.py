@@ -0,0 +1,216 @@
+"""Opt-in counters for the hot paths of the library.
+
+Nothing is instrumented until `capture` is entered. While at least one
+capture is active the constructors, arithmetic operators and `quantize`
+methods of the price classes and currency precision lookups are wrapped,
+and so are the handlers of the tax and discount functions. Leaving the
+capture restores the originals so the library runs unmodified again:
+
+    with capture() as stats:
+        handle_request()
+    stats.constructions['Money'], stats.seconds['flat_tax']
+
+Counts are collected per context, concurrent requests running in different
+threads or tasks each see their own numbers. Module globals are never
+replaced, so functions are timed however they were imported, even when
+their module is first imported during a capture.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Iterator, List, Tuple
+
+from . import currency
+from .currency import CurrencyRegistry
+from .dispatch import Dispatcher
+from .integer_money import IntegerMoney
+from .money import Money
+from .money_range import MoneyRange
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+CLASSES = (Money, IntegerMoney, TaxedMoney, MoneyRange, TaxedMoneyRange)
+CONSTRUCTORS = ('__init__', '_create', '_from_units')
+OPERATORS = (
+    '__add__', '__sub__', '__mul__', '__rmul__', '__truediv__', '__neg__')
+LOOKUPS = ('get_exponent', 'get_precision')
+
+
+class Stats:
+    """Counts collected during a `capture`.
+
+    `calls` and `seconds` hold the number of calls and the time spent in
+    each tax and discount function, time of nested calls is only counted
+    once for each function. A method of a subclass delegating to the same
+    method of its base with `super()` counts as a single call.
+    """
+
+    __slots__ = (
+        'constructions', 'operations', 'quantizations', 'lookups', 'calls',
+        'seconds', '_running')
+
+    def __init__(self) -> None:
+        self.constructions = Counter()  # type: Counter
+        self.operations = Counter()  # type: Counter
+        self.quantizations = Counter()  # type: Counter
+        self.lookups = Counter()  # type: Counter
+        self.calls = Counter()  # type: Counter
+        self.seconds = Counter()  # type: Counter
+        self._running = Counter()  # type: Counter
+
+    def __repr__(self) -> str:
+        return (
+            'Stats(constructions=%r, operations=%r, quantizations=%r,'
+            ' lookups=%r, calls=%r, seconds=%r)' % (
+                dict(self.constructions), dict(self.operations),
+                dict(self.quantizations), dict(self.lookups),
+                dict(self.calls), dict(self.seconds)))
+
+
+_active = ContextVar('prices_instrumentation', default=())  # type: ContextVar
+# Counted calls running in the current context as (name, id of the first
+# argument), methods a subclass delegates to with super() are not counted
+_counting = ContextVar(
+    'prices_instrumentation_counting', default=frozenset())  # type: ContextVar
+_lock = Lock()
+_users = 0
+# Patched attributes as (owner, name, original), restored on uninstall
+_patches = []  # type: List[Tuple[object, str, object]]
+# Dispatchers of the timed functions, their handlers are wrapped instead
+# of the functions so that every reference to a function is timed
+_dispatchers = []  # type: List[Dispatcher]
+# Checked by the timed functions that are not dispatched to handlers
+enabled = False
+
+
+def _counter(field: str, key: str, function: Callable) -> Callable:
+    name = function.__name__
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        call = (name, id(args[0]) if args else None)
+        counting = _counting.get()
+        if call in counting:
+            return function(*args, **kwargs)
+        for stats in _active.get():
+            getattr(stats, field)[key] += 1
+        token = _counting.set(counting | {call})
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _counting.reset(token)
+    return wrapper
+
+
+def timed(name: str, function: Callable, *args, **kwargs):
+    """Call a function, counting the call and its time as `name`."""
+    active = _active.get()
+    if not active:
+        return function(*args, **kwargs)
+    outermost = []
+    for stats in active:
+        stats.calls[name] += 1
+        if not stats._running[name]:  # pylint: disable=protected-access
+            outermost.append(stats)
+        stats._running[name] += 1  # pylint: disable=protected-access
+    start = perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        elapsed = perf_counter() - start
+        for stats in active:
+            stats._running[name] -= 1  # pylint: disable=protected-access
+        for stats in outermost:
+            stats.seconds[name] += elapsed
+
+
+def _timer(name: str) -> Callable[[Callable], Callable]:
+    def wrap(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            return timed(name, function, *args, **kwargs)
+        return wrapper
+    return wrap
+
+
+def register_dispatcher(dispatcher: Dispatcher) -> None:
+    """Time the handlers of a dispatched function during captures."""
+    with _lock:
+        _dispatchers.append(dispatcher)
+        if enabled:
+            dispatcher.wrap(_timer(dispatcher.name))
+
+
+def _patch_method(cls: type, name: str, field: str, key: str) -> None:
+    original = cls.__dict__.get(name)
+    if original is None:
+        return
+    if isinstance(original, classmethod):
+        replacement = classmethod(
+            _counter(field, key, original.__func__))  # type: object
+    else:
+        replacement = _counter(field, key, original)
+    _patches.append((cls, name, original))
+    setattr(cls, name, replacement)
+
+
+def _install() -> None:
+    global enabled  # pylint: disable=global-statement
+    for cls in CLASSES:
+        for name in CONSTRUCTORS:
+            _patch_method(cls, name, 'constructions', cls.__name__)
+        for name in OPERATORS:
+            _patch_method(
+                cls, name, 'operations', '%s.%s' % (cls.__name__, name))
+        _patch_method(cls, 'quantize', 'quantizations', cls.__name__)
+    for name in LOOKUPS:
+        _patch_method(CurrencyRegistry, name, 'lookups', name)
+    babel_precision = currency._babel_precision  # pylint: disable=protected-access
+    _patches.append((currency, '_babel_precision', babel_precision))
+    currency._babel_precision = _counter(  # pylint: disable=protected-access
+        'lookups', 'babel', babel_precision)
+    for dispatcher in _dispatchers:
+        dispatcher.wrap(_timer(dispatcher.name))
+    enabled = True
+
+
+def _uninstall() -> None:
+    global enabled  # pylint: disable=global-statement
+    enabled = False
+    for dispatcher in _dispatchers:
+        dispatcher.wrap(None)
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+
+
+def is_enabled() -> bool:
+    """Tell whether the library is currently instrumented."""
+    return enabled
+
+
+@contextmanager
+def capture() -> Iterator[Stats]:
+    """Count library operations performed in the current context.
+
+    Captures can be nested, the outer one receives the counts of the inner
+    one as well.
+    """
+    global _users  # pylint: disable=global-statement
+    stats = Stats()
+    with _lock:
+        if not _users:
+            _install()
+        _users += 1
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+        with _lock:
+            _users -= 1
+            if not _users:
+                _uninstall()
@@ -0,0 +1,219 @@
+from __future__ import division, unicode_literals
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional, Union
+
+from .currency import registry
+from .money import Money
+from .utils import round_divide
+
+Numeric = Union[int, Decimal]
+
+
+def decimal_to_units(amount: Decimal, precision: Optional[int] = None):
+    """Split a decimal into an integer number of units and a precision.
+
+    The precision is raised above the given minimum when that is needed to
+    represent the amount exactly.
+    """
+    sign, digits, exponent = amount.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError('Cannot represent %r in minor units' % (amount,))
+    units = int(''.join(str(digit) for digit in digits))
+    if sign:
+        units = -units
+    if precision is None or -exponent > precision:
+        return units, -exponent
+    return units * 10 ** (precision + exponent), precision
+
+
+def units_to_decimal(units: int, precision: int) -> Decimal:
+    """Build an exact decimal from a number of units and a precision."""
+    return Decimal('%dE%d' % (units, -precision))
+
+
+class IntegerMoney(Money):
+    """An amount of a particular currency stored as an integer number of minor units.
+
+    `precision` is the number of decimal places the units are scaled by, by
+    default the precision of the currency. Adding, subtracting and comparing
+    two `IntegerMoney` values is done on integers. Mixing with `Money` falls
+    back to decimal arithmetic and returns `Money`.
+    """
+
+    __slots__ = ('units', 'precision')
+    units: int
+    precision: int
+
+    def __init__(self, units: int, currency: str, precision: Optional[int] = None) -> None:
+        if not isinstance(units, int):
+            raise TypeError(
+                'IntegerMoney requires an integer number of units, got %r' % (
+                    units,))
+        if precision is None:
+            precision = registry.get_precision(currency)
+        _set_units(self, units)
+        _set_currency(self, currency)
+        _set_precision(self, precision)
+
+    @classmethod
+    def _from_units(cls, units: int, currency: str, precision: int) -> 'IntegerMoney':
+        money = object.__new__(cls)
+        _set_units(money, units)
+        _set_currency(money, currency)
+        _set_precision(money, precision)
+        return money
+
+    @classmethod
+    def from_money(cls, money: Money) -> 'IntegerMoney':
+        """Convert `Money` without loss.
+
+        Amounts with more decimal places than the currency uses are stored
+        with a higher precision.
+        """
+        if isinstance(money, IntegerMoney):
+            return money
+        units, precision = decimal_to_units(
+            money.amount, registry.get_precision(money.currency))
+        return cls._from_units(units, money.currency, precision)
+
+    def to_money(self) -> Money:
+        """Return the amount as `Money`."""
+        return Money._create(self.amount, self.currency)
+
+    @property  # type: ignore
+    def amount(self) -> Decimal:  # type: ignore
+        """Return the amount as a decimal."""
+        return units_to_decimal(self.units, self.precision)
+
+    def __repr__(self) -> str:
+        return 'IntegerMoney(%r, %r, %r)' % (
+            self.units, self.currency, self.precision)
+
+    def __reduce__(self):
+        return type(self), (self.units, self.currency, self.precision)
+
+    # Hashes the decimal amount so that equal Money and IntegerMoney collide
+    __hash__ = Money.__hash__
+
+    def _align(self, other: 'IntegerMoney'):
+        shift = self.precision - other.precision
+        if shift >= 0:
+            return self.units, other.units * 10 ** shift, self.precision
+        return self.units * 10 ** -shift, other.units, other.precision
+
+    def __lt__(self, other: Money) -> bool:
+        if isinstance(other, IntegerMoney):
+            if self.currency != other.currency:
+                raise ValueError(
+                    'Cannot compare amounts in %r and %r' % (
+                        self.currency, other.currency))
+            units, other_units, _precision = self._align(other)
+            return units < other_units
+        return super().__lt__(other)
+
+    def __le__(self, other: Money) -> bool:
+        if isinstance(other, IntegerMoney):
+            if self.currency != other.currency:
+                raise ValueError(
+                    'Cannot compare amounts in %r and %r' % (
+                        self.currency, other.currency))
+            units, other_units, _precision = self._align(other)
+            return units <= other_units
+        return super().__le__(other)
+
+    def __gt__(self, other: Money) -> bool:
+        if isinstance(other, IntegerMoney):
+            return other < self
+        return super().__gt__(other)
+
+    def __ge__(self, other: Money) -> bool:
+        if isinstance(other, IntegerMoney):
+            return other <= self
+        return super().__ge__(other)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntegerMoney):
+            if self.currency != other.currency:
+                return False
+            units, other_units, _precision = self._align(other)
+            return units == other_units
+        return super().__eq__(other)
+
+    def __mul__(self, other: Numeric) -> Money:
+        if isinstance(other, int):
+            return IntegerMoney._from_units(
+                self.units * other, self.currency, self.precision)
+        if isinstance(other, Decimal) and other.is_finite():
+            units, precision = decimal_to_units(other)
+            return IntegerMoney._from_units(
+                self.units * units, self.currency, self.precision + precision)
+        return super().__mul__(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, Money):
+            return super().__truediv__(other)
+        result = super().__truediv__(other)
+        if result is NotImplemented:
+            return result
+        return IntegerMoney.from_money(result)
+
+    def __add__(self, other: Money) -> Money:
+        if isinstance(other, IntegerMoney):
+            if other.currency != self.currency:
+                raise ValueError(
+                    'Cannot add amount in %r to %r' % (
+                        self.currency, other.currency))
+            if self.precision == other.precision:
+                return IntegerMoney._from_units(
+                    self.units + other.units, self.currency, self.precision)
+            units, other_units, precision = self._align(other)
+            return IntegerMoney._from_units(
+                units + other_units, self.currency, precision)
+        return super().__add__(other)
+
+    def __sub__(self, other: Money) -> Money:
+        if isinstance(other, IntegerMoney):
+            if other.currency != self.currency:
+                raise ValueError(
+                    'Cannot subtract amount in %r from %r' % (
+                        other.currency, self.currency))
+            if self.precision == other.precision:
+                return IntegerMoney._from_units(
+                    self.units - other.units, self.currency, self.precision)
+            units, other_units, precision = self._align(other)
+            return IntegerMoney._from_units(
+                units - other_units, self.currency, precision)
+        return super().__sub__(other)
+
+    def __bool__(self) -> bool:
+        return bool(self.units)
+
+    def quantize(self, exp=None, rounding=None) -> 'IntegerMoney':
+        """Return a copy of the object with its units rounded.
+
+        Takes the same arguments as `Money.quantize` and rounds the same way,
+        the resulting precision matches the exponent of `exp` or the
+        precision of the currency.
+        """
+        if rounding is None:
+            rounding = ROUND_HALF_UP
+        if exp is None:
+            precision = registry.get_precision(self.currency)
+        else:
+            exponent = Decimal(exp).as_tuple().exponent
+            if not isinstance(exponent, int):
+                raise ValueError('Cannot quantize to %r' % (exp,))
+            precision = -exponent
+        shift = precision - self.precision
+        if shift >= 0:
+            units = self.units * 10 ** shift
+        else:
+            units = round_divide(self.units, 10 ** -shift, rounding)
+        return IntegerMoney._from_units(units, self.currency, precision)
+
+
+# Slot setters bypassing __setattr__, used to build immutable instances
+_set_units = IntegerMoney.units.__set__  # type: ignore
+_set_currency = Money.currency.__set__  # type: ignore
+_set_precision = IntegerMoney.precision.__set__  # type: ignore
@@ -0,0 +1,216 @@
+"""JSON serialization of prices.
+
+Values are written as objects with amounts stored as strings to keep them
+exact, the type is inferred from the keys:
+
+    {"amount": "9.99", "currency": "USD"}
+    {"net": "10", "gross": "12.30", "currency": "USD"}
+    {"start": "1", "stop": "2", "currency": "USD"}
+    {"start": {"net": "1", "gross": "1.23"},
+     "stop": {"net": "2", "gross": "2.46"}, "currency": "USD"}
+
+`iterencode` and `iterdecode` stream arrays of prices in constant memory.
+"""
+import json
+from decimal import Decimal
+from functools import partial
+from typing import IO, Any, Dict, Iterable, Iterator, Union
+
+from .money import Money
+from .money_range import MoneyRange
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+Price = Union[Money, TaxedMoney, MoneyRange, TaxedMoneyRange]
+
+_TYPES = (Money, TaxedMoney, MoneyRange, TaxedMoneyRange)
+_decoder = json.JSONDecoder(parse_float=Decimal)
+_WHITESPACE = ' \t\n\r'
+
+
+def to_dict(value: Price) -> Dict[str, Any]:
+    """Return the canonical JSON-compatible form of a price.
+
+    Raises `TypeError` for other values which makes it usable as the
+    `default` hook of `json.dumps`.
+    """
+    if isinstance(value, Money):
+        return {'amount': str(value.amount), 'currency': value.currency}
+    if isinstance(value, TaxedMoney):
+        return {
+            'net': str(value.net.amount), 'gross': str(value.gross.amount),
+            'currency': value.currency}
+    if isinstance(value, TaxedMoneyRange):
+        return {
+            'start': {
+                'net': str(value.start.net.amount),
+                'gross': str(value.start.gross.amount)},
+            'stop': {
+                'net': str(value.stop.net.amount),
+                'gross': str(value.stop.gross.amount)},
+            'currency': value.currency}
+    if isinstance(value, MoneyRange):
+        return {
+            'start': str(value.start.amount), 'stop': str(value.stop.amount),
+            'currency': value.currency}
+    raise TypeError(
+        'Object of type %s is not a price' % (type(value).__name__,))
+
+
+def _amount(value) -> Decimal:
+    if isinstance(value, (str, int, Decimal)) and not isinstance(value, bool):
+        return Decimal(value)
+    raise ValueError('Invalid amount %r' % (value,))
+
+
+def from_dict(data: Dict[str, Any]) -> Price:
+    """Build a price from its canonical JSON form."""
+    try:
+        currency = data['currency']
+        if 'amount' in data:
+            return Money(_amount(data['amount']), currency)
+        if 'net' in data:
+            return TaxedMoney(
+                Money(_amount(data['net']), currency),
+                Money(_amount(data['gross']), currency))
+        start = data['start']
+        stop = data['stop']
+    except (KeyError, TypeError):
+        raise ValueError('Invalid price %r' % (data,)) from None
+    if isinstance(start, dict) and isinstance(stop, dict):
+        try:
+            return TaxedMoneyRange(
+                TaxedMoney(
+                    Money(_amount(start['net']), currency),
+                    Money(_amount(start['gross']), currency)),
+                TaxedMoney(
+                    Money(_amount(stop['net']), currency),
+                    Money(_amount(stop['gross']), currency)))
+        except KeyError:
+            raise ValueError('Invalid price %r' % (data,)) from None
+    return MoneyRange(
+        Money(_amount(start), currency), Money(_amount(stop), currency))
+
+
+def _encode(value: Price, currencies: Dict[str, str]) -> str:
+    if not isinstance(value, _TYPES):
+        raise TypeError(
+            'Object of type %s is not a price' % (type(value).__name__,))
+    currency = value.currency
+    quoted = currencies.get(currency)
+    if quoted is None:
+        quoted = currencies[currency] = json.dumps(currency)
+    if isinstance(value, Money):
+        return '{"amount": "%s", "currency": %s}' % (value.amount, quoted)
+    if isinstance(value, TaxedMoney):
+        return '{"net": "%s", "gross": "%s", "currency": %s}' % (
+            value.net.amount, value.gross.amount, quoted)
+    if isinstance(value, TaxedMoneyRange):
+        return (
+            '{"start": {"net": "%s", "gross": "%s"},'
+            ' "stop": {"net": "%s", "gross": "%s"}, "currency": %s}' % (
+                value.start.net.amount, value.start.gross.amount,
+                value.stop.net.amount, value.stop.gross.amount, quoted))
+    return '{"start": "%s", "stop": "%s", "currency": %s}' % (
+        value.start.amount, value.stop.amount, quoted)
+
+
+def dumps(value: Price) -> str:
+    """Serialize a price to a JSON string."""
+    return _encode(value, {})
+
+
+def loads(text: str) -> Price:
+    """Deserialize a price from a JSON string."""
+    return from_dict(_decoder.decode(text))
+
+
+def iterencode(values: Iterable[Price], batch_size: int = 1024) -> Iterator[str]:
+    """Serialize prices to a JSON array, yielding it in chunks.
+
+    Each chunk holds up to `batch_size` prices.
+    """
+    currencies = {}  # type: Dict[str, str]
+    parts = []
+    separator = '['
+    for value in values:
+        parts.append(separator)
+        parts.append(_encode(value, currencies))
+        separator = ', '
+        if len(parts) >= 2 * batch_size:
+            yield ''.join(parts)
+            parts = []
+    if separator == '[':
+        parts.append('[')
+    parts.append(']')
+    yield ''.join(parts)
+
+
+def dump(values: Iterable[Price], fp: IO[str]) -> None:
+    """Write prices to a text file as a JSON array."""
+    for chunk in iterencode(values):
+        fp.write(chunk)
+
+
+def iterdecode(chunks: Iterable[str]) -> Iterator[Price]:
+    """Deserialize a JSON array of prices received in arbitrary chunks.
+
+    Prices are yielded as soon as they are complete, only the unread part of
+    the input is kept in memory.
+    """
+    chunks = iter(chunks)
+    buffer = ''
+    position = 0
+
+    def read_more():
+        nonlocal buffer, position
+        for chunk in chunks:
+            if chunk:
+                buffer = buffer[position:] + chunk
+                position = 0
+                return True
+        return False
+
+    def next_token():
+        nonlocal position
+        while True:
+            length = len(buffer)
+            while position < length and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < length:
+                return buffer[position]
+            if not read_more():
+                return ''
+
+    if next_token() != '[':
+        raise ValueError('Expected a JSON array of prices')
+    position += 1
+    if next_token() == ']':
+        position += 1
+    else:
+        while True:
+            next_token()
+            while True:
+                try:
+                    data, end = _decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as error:
+                    if not read_more():
+                        raise ValueError(
+                            'Invalid or truncated JSON array of prices') from error
+                    continue
+                break
+            position = end
+            yield from_dict(data)
+            token = next_token()
+            position += 1
+            if token == ']':
+                break
+            if token != ',':
+                raise ValueError('Invalid or truncated JSON array of prices')
+    if next_token():
+        raise ValueError('Unexpected data after the JSON array of prices')
+
+
+def iterload(fp: IO[str], chunk_size: int = 65536) -> Iterator[Price]:
+    """Read a JSON array of prices from a text file one price at a time."""
+    return iterdecode(iter(partial(fp.read, chunk_size), ''))
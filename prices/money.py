@@ -2,9 +2,9 @@ from __future__ import division, unicode_literals
 
 import warnings
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Union, overload
+from typing import Iterable, List, Tuple, Type, Union, overload
 
-from babel.numbers import get_currency_precision
+from .currency import registry
 
 Numeric = Union[int, Decimal]
 
@@ -13,6 +13,8 @@ class Money:
     """An amount of a particular currency."""
 
     __slots__ = ('amount', 'currency')
+    amount: Decimal
+    currency: str
 
     def __init__(self, amount: Numeric, currency: str) -> None:
         if isinstance(amount, float):
@@ -20,12 +22,61 @@ class Money:
                 RuntimeWarning(
                     'float passed as value to Money, consider using Decimal'),
                 stacklevel=2)
-        self.amount = Decimal(amount)
-        self.currency = currency
+        _set_amount(self, Decimal(amount))
+        _set_currency(self, currency)
+
+    @classmethod
+    def _create(cls, amount: Decimal, currency: str) -> 'Money':
+        """Build an instance from a decimal without validating it.
+
+        Meant for values computed by the library itself.
+        """
+        money = object.__new__(Money)
+        _set_amount(money, amount)
+        _set_currency(money, currency)
+        return money
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Numeric, str]]) -> List['Money']:
+        """Build instances from `(amount, currency)` rows.
+
+        Decimal amounts, as returned by database drivers, are used as they
+        are, other amounts are converted like in the constructor.
+        """
+        create = Money._create
+        result = []
+        warned = False
+        for amount, currency in rows:
+            if type(amount) is not Decimal:  # pylint: disable=unidiomatic-typecheck
+                if isinstance(amount, float) and not warned:
+                    warnings.warn(  # pragma: no cover
+                        RuntimeWarning(
+                            'float passed as value to Money, consider using'
+                            ' Decimal'),
+                        stacklevel=2)
+                    warned = True
+                amount = Decimal(amount)
+            result.append(create(amount, currency))
+        return result
 
     def __repr__(self) -> str:
         return 'Money(%r, %r)' % (str(self.amount), self.currency)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError('Money is immutable, cannot set %r' % (name,))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('Money is immutable, cannot delete %r' % (name,))
+
+    def __reduce__(self):
+        cls = type(self)
+        if cls is Money:
+            return _unpickle_money, (str(self.amount), self.currency)
+        return _unpickle_money, (str(self.amount), self.currency, cls)
+
+    def __hash__(self) -> int:
+        return hash((self.amount, self.currency))
+
     def __lt__(self, other: 'Money') -> bool:
         if isinstance(other, Money):
             if self.currency != other.currency:
@@ -36,9 +87,31 @@ class Money:
         return NotImplemented
 
     def __le__(self, other: 'Money') -> bool:
-        if self == other:
-            return True
-        return self < other
+        if isinstance(other, Money):
+            if self.currency != other.currency:
+                raise ValueError(
+                    'Cannot compare amounts in %r and %r' % (
+                        self.currency, other.currency))
+            return self.amount <= other.amount
+        return NotImplemented
+
+    def __gt__(self, other: 'Money') -> bool:
+        if isinstance(other, Money):
+            if self.currency != other.currency:
+                raise ValueError(
+                    'Cannot compare amounts in %r and %r' % (
+                        self.currency, other.currency))
+            return self.amount > other.amount
+        return NotImplemented
+
+    def __ge__(self, other: 'Money') -> bool:
+        if isinstance(other, Money):
+            if self.currency != other.currency:
+                raise ValueError(
+                    'Cannot compare amounts in %r and %r' % (
+                        self.currency, other.currency))
+            return self.amount >= other.amount
+        return NotImplemented
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Money):
@@ -52,6 +125,8 @@ class Money:
             amount = self.amount * other
         except TypeError:
             return NotImplemented
+        if isinstance(amount, Decimal):
+            return Money._create(amount, self.currency)
         return Money(amount, self.currency)
 
     def __rmul__(self, other: Numeric) -> 'Money':
@@ -76,6 +151,8 @@ class Money:
             amount = self.amount / other
         except TypeError:
             return NotImplemented
+        if isinstance(amount, Decimal):
+            return Money._create(amount, self.currency)
         return Money(amount, self.currency)
 
     def __add__(self, other: 'Money') -> 'Money':
@@ -85,7 +162,7 @@ class Money:
                     'Cannot add amount in %r to %r' % (
                         self.currency, other.currency))
             amount = self.amount + other.amount
-            return Money(amount, self.currency)
+            return Money._create(amount, self.currency)
         return NotImplemented
 
     def __sub__(self, other: 'Money') -> 'Money':
@@ -95,7 +172,7 @@ class Money:
                     'Cannot subtract amount in %r from %r' % (
                         other.currency, self.currency))
             amount = self.amount - other.amount
-            return Money(amount, self.currency)
+            return Money._create(amount, self.currency)
         return NotImplemented
 
     def __bool__(self) -> bool:
@@ -113,9 +190,21 @@ class Money:
         if rounding is None:
             rounding = ROUND_HALF_UP
         if exp is None:
-            digits = get_currency_precision(self.currency)
-            exp = Decimal('0.1') ** digits
+            exp = registry.get_exponent(self.currency)
         else:
             exp = Decimal(exp)
-        return Money(
+        return Money._create(
             self.amount.quantize(exp, rounding=rounding), self.currency)
+
+
+# Slot setters bypassing __setattr__, used to build immutable instances
+_set_amount = Money.amount.__set__  # type: ignore
+_set_currency = Money.currency.__set__  # type: ignore
+
+
+def _unpickle_money(
+        amount: str, currency: str, cls: Type[Money] = Money) -> Money:
+    money = object.__new__(cls)
+    _set_amount(money, Decimal(amount))
+    _set_currency(money, currency)
+    return money
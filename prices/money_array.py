@@ -0,0 +1,572 @@
+from __future__ import division, unicode_literals
+
+import operator
+from array import array
+from decimal import (
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP, Decimal)
+from math import gcd
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+from .currency import registry
+from .integer_money import decimal_to_units, units_to_decimal
+from .money import Money
+from .utils import round_divide
+
+Numeric = Union[int, Decimal]
+
+INT64_MAX = 2 ** 63 - 1
+
+
+def _lcm(a: int, b: int) -> int:
+    return a * b // gcd(a, b)
+
+
+def _precision_of(scale: int) -> Optional[int]:
+    """Return the number of decimal places of a power of ten scale."""
+    digits = str(scale)
+    if digits.rstrip('0') == '1':
+        return len(digits) - 1
+    return None
+
+
+def _to_fraction(value: Numeric):
+    """Split a number into an integer numerator and a power of ten exponent."""
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise ValueError('Cannot use %r with MoneyArray' % (value,))
+        return decimal_to_units(value)
+    try:
+        return operator.index(value), 0
+    except TypeError:
+        raise TypeError(
+            'MoneyArray requires int or Decimal operands, got %r' % (
+                value,)) from None
+
+
+class ArrayBackend:
+    """Stores units in a stdlib `array` of signed 64-bit integers."""
+
+    name = 'array'
+
+    @staticmethod
+    def create(values: Iterable[int]):
+        return array('q', values)
+
+    @staticmethod
+    def to_list(data) -> List[int]:
+        return data.tolist()
+
+    @staticmethod
+    def add(a, b):
+        if isinstance(b, int):
+            return array('q', [x + b for x in a])
+        return array('q', [x + y for x, y in zip(a, b)])
+
+    @staticmethod
+    def multiply(a, b):
+        if isinstance(b, int):
+            return array('q', [x * b for x in a])
+        return array('q', [x * y for x, y in zip(a, b)])
+
+    @staticmethod
+    def compare(a, b, op) -> List[bool]:
+        if isinstance(b, int):
+            return [op(x, b) for x in a]
+        return [op(x, y) for x, y in zip(a, b)]
+
+    @staticmethod
+    def round_divide(a, divisor, rounding: str):
+        if isinstance(divisor, int):
+            return array('q', [round_divide(x, divisor, rounding) for x in a])
+        return array(
+            'q', [round_divide(x, y, rounding) for x, y in zip(a, divisor)])
+
+    @staticmethod
+    def sum(data) -> int:
+        return sum(data)
+
+    @staticmethod
+    def min(data) -> int:
+        return min(data)
+
+    @staticmethod
+    def max(data) -> int:
+        return max(data)
+
+
+class NumpyBackend:
+    """Stores units in a NumPy `int64` array and operates on whole columns."""
+
+    name = 'numpy'
+
+    def __init__(self, numpy) -> None:
+        self.np = numpy
+
+    def create(self, values: Iterable[int]):
+        return self.np.array(list(values), dtype=self.np.int64)
+
+    @staticmethod
+    def to_list(data) -> List[int]:
+        return data.tolist()
+
+    def _bound(self, data) -> int:
+        if isinstance(data, int):
+            return abs(data)
+        if len(data) == 0:
+            return 0
+        return max(-int(data.min()), int(data.max()))
+
+    def _check(self, bound: int) -> None:
+        if bound > INT64_MAX:
+            raise OverflowError('MoneyArray units do not fit in 64 bits')
+
+    def add(self, a, b):
+        self._check(self._bound(a) + self._bound(b))
+        return a + b
+
+    def multiply(self, a, b):
+        self._check(self._bound(a) * self._bound(b))
+        return a * b
+
+    @staticmethod
+    def compare(a, b, op):
+        return op(a, b)
+
+    def round_divide(self, a, divisor, rounding: str):
+        np = self.np
+        self._check(self._bound(divisor) * 2)
+        quotient, remainder = np.divmod(a, divisor)
+        inexact = remainder != 0
+        negative = a < 0
+        towards_zero = quotient + (negative & inexact)
+        away_from_zero = quotient + (~negative & inexact)
+        if rounding == ROUND_FLOOR:
+            return quotient
+        if rounding == ROUND_CEILING:
+            return quotient + inexact
+        if rounding == ROUND_DOWN:
+            return towards_zero
+        if rounding == ROUND_UP:
+            return away_from_zero
+        if rounding == ROUND_05UP:
+            return np.where(
+                np.abs(towards_zero) % 5 == 0, away_from_zero, towards_zero)
+        if rounding == ROUND_HALF_UP:
+            tie = away_from_zero
+        elif rounding == ROUND_HALF_DOWN:
+            tie = towards_zero
+        elif rounding == ROUND_HALF_EVEN:
+            tie = quotient + (quotient & 1)
+        else:
+            raise ValueError('Unknown rounding mode: %r' % (rounding,))
+        double_remainder = remainder * 2
+        return np.where(
+            double_remainder < divisor, quotient,
+            np.where(double_remainder > divisor, quotient + 1, tie))
+
+    @staticmethod
+    def sum(data) -> int:
+        # Summing Python ints cannot overflow
+        return sum(data.tolist())
+
+    @staticmethod
+    def min(data) -> int:
+        return int(data.min())
+
+    @staticmethod
+    def max(data) -> int:
+        return int(data.max())
+
+
+_backends = {'array': ArrayBackend()}
+
+
+def get_backend(name=None):
+    """Return a storage backend by name.
+
+    Without a name NumPy is used when it's installed and the stdlib `array`
+    module otherwise. Backend instances are returned unchanged.
+    """
+    if isinstance(name, (ArrayBackend, NumpyBackend)):
+        return name
+    if name is None or name == 'numpy':
+        if 'numpy' not in _backends:
+            try:
+                import numpy  # pylint: disable=import-outside-toplevel
+            except ImportError:
+                if name is not None:
+                    raise
+                return _backends['array']
+            _backends['numpy'] = NumpyBackend(numpy)
+        return _backends['numpy']
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError('Unknown MoneyArray backend: %r' % (name,)) from None
+
+
+class MoneyArray:
+    """A column of amounts in a single currency.
+
+    Each amount is stored as an integer number of units in a 64-bit column,
+    the amount being `units / scale`. The scale is shared by the whole
+    column, it's a power of ten unless the column was divided by a number.
+    Dividing rows by different numbers keeps a divisor per row instead when
+    their common denominator does not fit in 64 bits, such a column has to
+    be quantized before it can be added to or compared with other amounts.
+    Arithmetic is exact, rounding only happens in `quantize` which rounds
+    the same way `Money.quantize` does. Since division is exact too, results
+    can only differ from `Money` when a quotient has more significant digits
+    than the decimal context keeps.
+
+    Comparisons return masks of booleans, a list with the `array` backend
+    and a NumPy array with the `numpy` backend.
+    """
+
+    __slots__ = ('units', 'scale', 'divisors', 'currency', 'backend')
+
+    def __init__(self, amounts: Iterable[Numeric], currency: str, *, backend=None) -> None:
+        backend = get_backend(backend)
+        minimum = registry.get_precision(currency)
+        pairs = [decimal_to_units(Decimal(amount), minimum) for amount in amounts]
+        precision = max((p for _units, p in pairs), default=minimum)
+        self.units = backend.create(
+            units * 10 ** (precision - p) for units, p in pairs)
+        self.scale = 10 ** precision
+        self.divisors = None
+        self.currency = currency
+        self.backend = backend
+
+    @classmethod
+    def _create(
+            cls, units, scale: int, currency: str, backend,
+            divisors=None) -> 'MoneyArray':
+        money_array = object.__new__(cls)
+        money_array.units = units
+        money_array.scale = scale
+        money_array.divisors = divisors
+        money_array.currency = currency
+        money_array.backend = backend
+        return money_array
+
+    @classmethod
+    def from_units(
+            cls, units: Iterable[int], currency: str,
+            precision: Optional[int] = None, *, backend=None) -> 'MoneyArray':
+        """Build a column from integer minor units."""
+        backend = get_backend(backend)
+        if precision is None:
+            precision = registry.get_precision(currency)
+        return cls._create(
+            backend.create(units), 10 ** precision, currency, backend)
+
+    @classmethod
+    def from_money(
+            cls, values: Iterable[Money], currency: Optional[str] = None, *,
+            backend=None) -> 'MoneyArray':
+        """Build a column from `Money` values sharing a currency."""
+        values = list(values)
+        if currency is None:
+            if not values:
+                raise ValueError('Cannot guess the currency of an empty column')
+            currency = values[0].currency
+        for value in values:
+            if value.currency != currency:
+                raise ValueError(
+                    'Cannot add amount in %r to a column in %r' % (
+                        value.currency, currency))
+        return cls([value.amount for value in values], currency, backend=backend)
+
+    def to_money(self) -> List[Money]:
+        """Return the column as a list of `Money`."""
+        currency = self.currency
+        create = Money._create  # pylint: disable=protected-access
+        return [create(amount, currency) for amount in self.amounts()]
+
+    def amounts(self) -> List[Decimal]:
+        """Return the column as a list of decimal amounts.
+
+        Amounts are exact unless the scale is not a power of ten, in which
+        case they are divided with the precision of the decimal context.
+        """
+        units = self.backend.to_list(self.units)
+        if self.divisors is not None:
+            scale = self.scale
+            return [
+                Decimal(value) / Decimal(scale * divisor)
+                for value, divisor in zip(
+                    units, self.backend.to_list(self.divisors))]
+        precision = _precision_of(self.scale)
+        if precision is not None:
+            return [units_to_decimal(value, precision) for value in units]
+        scale = Decimal(self.scale)
+        return [Decimal(value) / scale for value in units]
+
+    def __repr__(self) -> str:
+        return 'MoneyArray(%r, %r)' % (
+            [str(amount) for amount in self.amounts()], self.currency)
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def __iter__(self) -> Iterator[Money]:
+        return iter(self.to_money())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            divisors = self.divisors
+            if divisors is not None:
+                divisors = divisors[index]
+            return MoneyArray._create(
+                self.units[index], self.scale, self.currency, self.backend,
+                divisors)
+        scale = self.scale
+        if self.divisors is not None:
+            scale *= int(self.divisors[index])
+        return self._to_money(int(self.units[index]), scale)
+
+    def _to_money(self, units: int, scale: int) -> Money:
+        precision = _precision_of(scale)
+        if precision is not None:
+            return Money._create(  # pylint: disable=protected-access
+                units_to_decimal(units, precision), self.currency)
+        return Money._create(  # pylint: disable=protected-access
+            Decimal(units) / Decimal(scale), self.currency)
+
+    def _settle(self, strict: bool = True) -> 'MoneyArray':
+        """Return the column with the divisors of its rows folded into the scale.
+
+        Raises `ValueError` when the common denominator of the rows does not
+        fit in 64 bits, unless `strict` is false in which case the column is
+        returned unchanged.
+        """
+        if self.divisors is None:
+            return self
+        divisors = self.backend.to_list(self.divisors)
+        denominator = 1
+        for divisor in divisors:
+            denominator = _lcm(denominator, divisor)
+        units = [
+            value * (denominator // divisor)
+            for value, divisor in zip(self.backend.to_list(self.units), divisors)]
+        if denominator > INT64_MAX or any(abs(value) > INT64_MAX for value in units):
+            if not strict:
+                return self
+            raise ValueError(
+                'Rows divided by %d different numbers do not fit in 64 bits '
+                'on a common scale, quantize the column first' % (
+                    len(set(divisors)),))
+        return MoneyArray._create(
+            self.backend.create(units), self.scale * denominator,
+            self.currency, self.backend)
+
+    def _align(self, other, verb: str):
+        """Return units of both operands scaled to a common scale."""
+        column = self._settle()
+        if isinstance(other, MoneyArray):
+            other = other._settle()  # pylint: disable=protected-access
+            if other.currency != self.currency:
+                raise ValueError(
+                    'Cannot %s amounts in %r and %r' % (
+                        verb, self.currency, other.currency))
+            if len(other) != len(self):
+                raise ValueError(
+                    'Cannot %s columns of different lengths: %d and %d' % (
+                        verb, len(self), len(other)))
+            other_units, other_scale = other.units, other.scale
+        elif isinstance(other, Money):
+            if other.currency != self.currency:
+                raise ValueError(
+                    'Cannot %s amounts in %r and %r' % (
+                        verb, self.currency, other.currency))
+            other_units, precision = _to_fraction(other.amount)
+            if precision < 0:
+                other_units, precision = other_units * 10 ** -precision, 0
+            other_scale = 10 ** precision
+        else:
+            return None
+        scale = _lcm(column.scale, other_scale)
+        units = column.units
+        if scale != column.scale:
+            units = self.backend.multiply(units, scale // column.scale)
+        if scale != other_scale:
+            if isinstance(other_units, int):
+                other_units *= scale // other_scale
+            else:
+                other_units = self.backend.multiply(
+                    other_units, scale // other_scale)
+        return units, other_units, scale
+
+    def __add__(self, other: Union[Money, 'MoneyArray']) -> 'MoneyArray':
+        aligned = self._align(other, 'add')
+        if aligned is None:
+            return NotImplemented
+        units, other_units, scale = aligned
+        return MoneyArray._create(
+            self.backend.add(units, other_units), scale, self.currency,
+            self.backend)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[Money, 'MoneyArray']) -> 'MoneyArray':
+        aligned = self._align(other, 'subtract')
+        if aligned is None:
+            return NotImplemented
+        units, other_units, scale = aligned
+        if isinstance(other_units, int):
+            other_units = -other_units
+        else:
+            other_units = self.backend.multiply(other_units, -1)
+        return MoneyArray._create(
+            self.backend.add(units, other_units), scale, self.currency,
+            self.backend)
+
+    def __rsub__(self, other: Money) -> 'MoneyArray':
+        return (self * -1) + other
+
+    def __neg__(self) -> 'MoneyArray':
+        return self * -1
+
+    def _factors(self, other):
+        """Split numbers into integer numerators and a common exponent.
+
+        Each number equals its numerator divided by ten to the power of the
+        exponent, the exponent is never negative.
+        """
+        if isinstance(other, (int, Decimal)):
+            numerator, exponent = _to_fraction(other)
+            if exponent < 0:
+                return numerator * 10 ** -exponent, 0
+            return numerator, exponent
+        if isinstance(other, (Money, MoneyArray, str, bytes)):
+            raise TypeError(
+                'MoneyArray can only be multiplied or divided by numbers')
+        pairs = [_to_fraction(value) for value in other]
+        if len(pairs) != len(self):
+            raise ValueError(
+                'Expected %d factors, got %d' % (len(self), len(pairs)))
+        exponent = max([p for _n, p in pairs] + [0])
+        return [n * 10 ** (exponent - p) for n, p in pairs], exponent
+
+    def __mul__(self, other: Union[Numeric, Sequence[Numeric]]) -> 'MoneyArray':
+        try:
+            numerators, exponent = self._factors(other)
+        except TypeError:
+            return NotImplemented
+        if not isinstance(numerators, int):
+            numerators = self.backend.create(numerators)
+        units = self.backend.multiply(self.units, numerators)
+        return MoneyArray._create(
+            units, self.scale * 10 ** exponent, self.currency, self.backend,
+            self.divisors)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union[Numeric, Sequence[Numeric]]) -> 'MoneyArray':
+        try:
+            numerators, exponent = self._factors(other)
+        except TypeError:
+            return NotImplemented
+        power = 10 ** exponent
+        if isinstance(numerators, int):
+            if not numerators:
+                raise ZeroDivisionError('MoneyArray division by zero')
+            denominator = abs(numerators)
+            multipliers = power if numerators > 0 else -power
+        else:
+            if not all(numerators):
+                raise ZeroDivisionError('MoneyArray division by zero')
+            # Each row keeps its own divisor until they are folded into the
+            # scale, the common denominator of many divisors quickly
+            # outgrows 64 bits
+            units = self.backend.multiply(
+                self.units, self.backend.create(
+                    power if numerator > 0 else -power
+                    for numerator in numerators))
+            divisors = self.backend.create(
+                abs(numerator) for numerator in numerators)
+            if self.divisors is not None:
+                divisors = self.backend.multiply(self.divisors, divisors)
+            return MoneyArray._create(
+                units, self.scale, self.currency, self.backend,
+                divisors)._settle(strict=False)
+        units = self.backend.multiply(self.units, multipliers)
+        return MoneyArray._create(
+            units, self.scale * denominator, self.currency, self.backend,
+            self.divisors)
+
+    def _compare(self, other, op):
+        aligned = self._align(other, 'compare')
+        if aligned is None:
+            return NotImplemented
+        units, other_units, _scale = aligned
+        return self.backend.compare(units, other_units, op)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __eq__(self, other):  # type: ignore
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):  # type: ignore
+        return self._compare(other, operator.ne)
+
+    __hash__ = None  # type: ignore
+
+    def sum(self) -> Money:
+        """Return the sum of the column."""
+        column = self._settle()
+        return self._to_money(column.backend.sum(column.units), column.scale)
+
+    def min(self) -> Money:
+        """Return the lowest amount of the column."""
+        if len(self) == 0:
+            raise ValueError('min() of an empty MoneyArray')
+        column = self._settle()
+        return self._to_money(column.backend.min(column.units), column.scale)
+
+    def max(self) -> Money:
+        """Return the highest amount of the column."""
+        if len(self) == 0:
+            raise ValueError('max() of an empty MoneyArray')
+        column = self._settle()
+        return self._to_money(column.backend.max(column.units), column.scale)
+
+    def quantize(self, exp=None, rounding=None) -> 'MoneyArray':
+        """Return a copy of the column with its amounts quantized.
+
+        Takes the same arguments as `Money.quantize` and rounds each amount
+        exactly like `Money.quantize` would.
+        """
+        if rounding is None:
+            rounding = ROUND_HALF_UP
+        if exp is None:
+            precision = registry.get_precision(self.currency)
+        else:
+            exponent = Decimal(exp).as_tuple().exponent
+            if not isinstance(exponent, int) or exponent > 0:
+                raise ValueError(
+                    'MoneyArray cannot be quantized to %r' % (exp,))
+            precision = -exponent
+        scale = 10 ** precision
+        divisor = gcd(scale, self.scale)
+        units = self.units
+        if scale != divisor:
+            units = self.backend.multiply(units, scale // divisor)
+        divisors = self.scale // divisor
+        if self.divisors is not None:
+            divisors = self.backend.multiply(self.divisors, divisors)
+            units = self.backend.round_divide(units, divisors, rounding)
+        elif divisors != 1:
+            units = self.backend.round_divide(units, divisors, rounding)
+        return MoneyArray._create(units, scale, self.currency, self.backend)
@@ -0,0 +1,389 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, Iterator, Mapping, Tuple, Union
+
+from .currency import registry
+from .money import Money
+from .taxed_money import TaxedMoney
+
+Numeric = Union[int, Decimal]
+Rates = Union[Mapping[str, Union[int, str, Decimal]], object]
+TaxedAddable = Union[Money, TaxedMoney, 'MoneyBag', 'TaxedMoneyBag']
+
+
+def _rate_getter(rates: Rates, currency: str):
+    """Return a function giving the value of one unit in `currency`.
+
+    `rates` is either a mapping of currencies to their value in `currency`
+    or an object with a `get_rate` method like `RateTable`.
+    """
+    get_rate = getattr(rates, 'get_rate', None)
+    if get_rate is not None:
+        return lambda source: get_rate(source, currency)
+
+    def get_mapped_rate(source: str) -> Decimal:
+        if source == currency:
+            return Decimal(1)
+        try:
+            return Decimal(rates[source])  # type: ignore
+        except KeyError:
+            raise ValueError(
+                'No exchange rate from %r to %r' % (source, currency)) from None
+    return get_mapped_rate
+
+
+class MoneyBag:
+    """Totals of `Money` in any number of currencies.
+
+    Amounts in different currencies are kept apart instead of raising, the
+    `+` and `-` operators return new bags while `+=`, `-=`, `add` and
+    `update` change the bag in place:
+
+        revenue = MoneyBag()
+        revenue.update(order.total for order in orders)
+        revenue['EUR'], revenue.to_money('EUR', rates)
+    """
+
+    __slots__ = ('_amounts',)
+    __hash__ = None  # type: ignore
+
+    def __init__(self, values: Iterable[Money] = ()) -> None:
+        self._amounts = {}  # type: Dict[str, Decimal]
+        self.update(values)
+
+    def __repr__(self) -> str:
+        return 'MoneyBag(%r)' % (list(self),)
+
+    def __iter__(self) -> Iterator[Money]:
+        """Yield the total of each currency in order of first appearance."""
+        create = Money._create
+        for currency, amount in self._amounts.items():
+            yield create(amount, currency)
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    def __contains__(self, currency: object) -> bool:
+        return currency in self._amounts
+
+    def __getitem__(self, currency: str) -> Money:
+        """Return the total in a currency, zero if there is none."""
+        amount = self._amounts.get(currency)
+        if amount is None:
+            return Money(0, currency)
+        return Money._create(amount, currency)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MoneyBag):
+            return _nonzero(self._amounts) == _nonzero(other._amounts)
+        return False
+
+    def __bool__(self) -> bool:
+        return any(self._amounts.values())
+
+    @property
+    def currencies(self) -> Tuple[str, ...]:
+        """Return the currencies held in the bag."""
+        return tuple(self._amounts)
+
+    def copy(self) -> 'MoneyBag':
+        bag = object.__new__(MoneyBag)
+        bag._amounts = dict(self._amounts)  # pylint: disable=protected-access
+        return bag
+
+    def add(self, money: Money, quantity: Numeric = 1) -> 'MoneyBag':
+        """Add `quantity` times the given amount to the total of its currency."""
+        if not isinstance(money, Money):
+            raise TypeError('MoneyBag can only add Money, got %r' % (money,))
+        amount = money.amount
+        # Multiplying by a decimal one could still change the exponent
+        if quantity != 1 or type(quantity) is not int:  # pylint: disable=unidiomatic-typecheck
+            amount = amount * quantity
+        amounts = self._amounts
+        total = amounts.get(money.currency)
+        amounts[money.currency] = amount if total is None else total + amount
+        return self
+
+    def update(self, values: Iterable[Union[Money, 'MoneyBag']]) -> 'MoneyBag':
+        """Add each of the given amounts or bags to the totals."""
+        amounts = self._amounts
+        for value in values:
+            if type(value) is Money:  # pylint: disable=unidiomatic-typecheck
+                currency = value.currency
+                total = amounts.get(currency)
+                amounts[currency] = (
+                    value.amount if total is None else total + value.amount)
+            elif isinstance(value, MoneyBag):
+                self._merge(value, 1)
+            else:
+                self.add(value)
+        return self
+
+    def _merge(self, other: 'MoneyBag', sign: int) -> None:
+        amounts = self._amounts
+        for currency, amount in other._amounts.items():  # pylint: disable=protected-access
+            if sign < 0:
+                amount = -amount
+            total = amounts.get(currency)
+            amounts[currency] = amount if total is None else total + amount
+
+    def __iadd__(self, other: Union[Money, 'MoneyBag']) -> 'MoneyBag':
+        if isinstance(other, MoneyBag):
+            self._merge(other, 1)
+            return self
+        if isinstance(other, Money):
+            return self.add(other)
+        return NotImplemented
+
+    def __isub__(self, other: Union[Money, 'MoneyBag']) -> 'MoneyBag':
+        if isinstance(other, MoneyBag):
+            self._merge(other, -1)
+            return self
+        if isinstance(other, Money):
+            return self.add(other, -1)
+        return NotImplemented
+
+    def __add__(self, other: Union[Money, 'MoneyBag']) -> 'MoneyBag':
+        if isinstance(other, (Money, MoneyBag)):
+            return self.copy().__iadd__(other)
+        if isinstance(other, TaxedMoney):
+            return TaxedMoneyBag((self, other))
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[Money, 'MoneyBag']) -> 'MoneyBag':
+        if isinstance(other, (Money, MoneyBag)):
+            return self.copy().__isub__(other)
+        if isinstance(other, TaxedMoney):
+            return TaxedMoneyBag((self,)).__isub__(other)
+        return NotImplemented
+
+    def __rsub__(self, other: Money) -> 'MoneyBag':
+        if isinstance(other, Money):
+            return MoneyBag((other,)).__isub__(self)
+        if isinstance(other, TaxedMoney):
+            return TaxedMoneyBag((other,)).__isub__(self)
+        return NotImplemented
+
+    def __neg__(self) -> 'MoneyBag':
+        return MoneyBag().__isub__(self)
+
+    def quantize(self, rounding=ROUND_HALF_UP) -> 'MoneyBag':
+        """Return a bag with every total quantized to its currency."""
+        bag = MoneyBag()
+        bag._amounts = {  # pylint: disable=protected-access
+            currency: amount.quantize(
+                registry.get_exponent(currency), rounding=rounding)
+            for currency, amount in self._amounts.items()}
+        return bag
+
+    def to_money(self, currency: str, rates: Rates, rounding=ROUND_HALF_UP) -> Money:
+        """Convert all totals to a single currency.
+
+        `rates` maps each currency to the value of one of its units in
+        `currency`, an object with a `get_rate` method like `RateTable` or
+        `CurrencyConverter` works as well. Converted amounts are added up
+        exactly and the result is quantized once.
+        """
+        get_rate = _rate_getter(rates, currency)
+        total = Decimal(0)
+        for source, amount in self._amounts.items():
+            total += amount * get_rate(source)
+        return Money._create(  # pylint: disable=protected-access
+            total.quantize(registry.get_exponent(currency), rounding=rounding),
+            currency)
+
+
+class TaxedMoneyBag:
+    """Totals of `TaxedMoney` in any number of currencies.
+
+    `Money` and `MoneyBag` are added to both the net and gross totals, like
+    with the `+` operator of `TaxedMoney`.
+    """
+
+    __slots__ = ('_amounts',)
+    __hash__ = None  # type: ignore
+
+    def __init__(self, values: Iterable[TaxedAddable] = ()) -> None:
+        self._amounts = {}  # type: Dict[str, Tuple[Decimal, Decimal]]
+        self.update(values)
+
+    def __repr__(self) -> str:
+        return 'TaxedMoneyBag(%r)' % (list(self),)
+
+    def __iter__(self) -> Iterator[TaxedMoney]:
+        """Yield the totals of each currency in order of first appearance."""
+        create = Money._create
+        for currency, (net, gross) in self._amounts.items():
+            yield TaxedMoney._create(
+                create(net, currency), create(gross, currency))
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    def __contains__(self, currency: object) -> bool:
+        return currency in self._amounts
+
+    def __getitem__(self, currency: str) -> TaxedMoney:
+        """Return the totals in a currency, zero if there are none."""
+        amounts = self._amounts.get(currency)
+        if amounts is None:
+            zero = Money(0, currency)
+            return TaxedMoney._create(zero, zero)
+        net, gross = amounts
+        return TaxedMoney._create(
+            Money._create(net, currency), Money._create(gross, currency))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaxedMoneyBag):
+            return _nonzero(self._amounts) == _nonzero(other._amounts)
+        return False
+
+    def __bool__(self) -> bool:
+        return any(any(amounts) for amounts in self._amounts.values())
+
+    @property
+    def currencies(self) -> Tuple[str, ...]:
+        """Return the currencies held in the bag."""
+        return tuple(self._amounts)
+
+    @property
+    def net(self) -> MoneyBag:
+        """Return the net totals."""
+        bag = MoneyBag()
+        bag._amounts = {  # pylint: disable=protected-access
+            currency: net for currency, (net, _gross) in self._amounts.items()}
+        return bag
+
+    @property
+    def gross(self) -> MoneyBag:
+        """Return the gross totals."""
+        bag = MoneyBag()
+        bag._amounts = {  # pylint: disable=protected-access
+            currency: gross
+            for currency, (_net, gross) in self._amounts.items()}
+        return bag
+
+    def copy(self) -> 'TaxedMoneyBag':
+        bag = object.__new__(TaxedMoneyBag)
+        bag._amounts = dict(self._amounts)  # pylint: disable=protected-access
+        return bag
+
+    def _add_amounts(self, currency: str, net: Decimal, gross: Decimal) -> None:
+        amounts = self._amounts
+        totals = amounts.get(currency)
+        if totals is None:
+            amounts[currency] = net, gross
+        else:
+            amounts[currency] = totals[0] + net, totals[1] + gross
+
+    def add(self, price: Union[Money, TaxedMoney], quantity: Numeric = 1) -> 'TaxedMoneyBag':
+        """Add `quantity` times the given price to the totals of its currency."""
+        if isinstance(price, TaxedMoney):
+            net, gross = price.net.amount, price.gross.amount
+        elif isinstance(price, Money):
+            net = gross = price.amount
+        else:
+            raise TypeError(
+                'TaxedMoneyBag can only add TaxedMoney or Money, got %r' % (
+                    price,))
+        if quantity != 1 or type(quantity) is not int:  # pylint: disable=unidiomatic-typecheck
+            net = net * quantity
+            gross = gross * quantity
+        self._add_amounts(price.currency, net, gross)
+        return self
+
+    def update(self, values: Iterable[TaxedAddable]) -> 'TaxedMoneyBag':
+        """Add each of the given prices or bags to the totals."""
+        for value in values:
+            if type(value) is TaxedMoney:  # pylint: disable=unidiomatic-typecheck
+                self._add_amounts(
+                    value.currency, value.net.amount, value.gross.amount)
+            elif isinstance(value, (MoneyBag, TaxedMoneyBag)):
+                self._merge(value, 1)
+            else:
+                self.add(value)
+        return self
+
+    def _merge(self, other: Union[MoneyBag, 'TaxedMoneyBag'], sign: int) -> None:
+        if isinstance(other, MoneyBag):
+            items = [
+                (currency, (amount, amount))
+                for currency, amount in other._amounts.items()]  # pylint: disable=protected-access
+        else:
+            items = list(other._amounts.items())  # pylint: disable=protected-access
+        for currency, (net, gross) in items:
+            if sign < 0:
+                net, gross = -net, -gross
+            self._add_amounts(currency, net, gross)
+
+    def __iadd__(self, other: TaxedAddable) -> 'TaxedMoneyBag':
+        if isinstance(other, (MoneyBag, TaxedMoneyBag)):
+            self._merge(other, 1)
+            return self
+        if isinstance(other, (Money, TaxedMoney)):
+            return self.add(other)
+        return NotImplemented
+
+    def __isub__(self, other: TaxedAddable) -> 'TaxedMoneyBag':
+        if isinstance(other, (MoneyBag, TaxedMoneyBag)):
+            self._merge(other, -1)
+            return self
+        if isinstance(other, (Money, TaxedMoney)):
+            return self.add(other, -1)
+        return NotImplemented
+
+    def __add__(self, other: TaxedAddable) -> 'TaxedMoneyBag':
+        if isinstance(other, (Money, TaxedMoney, MoneyBag, TaxedMoneyBag)):
+            return self.copy().__iadd__(other)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: TaxedAddable) -> 'TaxedMoneyBag':
+        if isinstance(other, (Money, TaxedMoney, MoneyBag, TaxedMoneyBag)):
+            return self.copy().__isub__(other)
+        return NotImplemented
+
+    def __rsub__(self, other: Union[Money, TaxedMoney, MoneyBag]) -> 'TaxedMoneyBag':
+        if isinstance(other, (Money, TaxedMoney, MoneyBag)):
+            return TaxedMoneyBag((other,)).__isub__(self)
+        return NotImplemented
+
+    def __neg__(self) -> 'TaxedMoneyBag':
+        return TaxedMoneyBag().__isub__(self)
+
+    def quantize(self, rounding=ROUND_HALF_UP) -> 'TaxedMoneyBag':
+        """Return a bag with every total quantized to its currency."""
+        bag = TaxedMoneyBag()
+        for currency, (net, gross) in self._amounts.items():
+            exponent = registry.get_exponent(currency)
+            bag._amounts[currency] = (  # pylint: disable=protected-access
+                net.quantize(exponent, rounding=rounding),
+                gross.quantize(exponent, rounding=rounding))
+        return bag
+
+    def to_taxed_money(self, currency: str, rates: Rates, rounding=ROUND_HALF_UP) -> TaxedMoney:
+        """Convert all totals to a single currency.
+
+        Takes the same `rates` as `MoneyBag.to_money`.
+        """
+        get_rate = _rate_getter(rates, currency)
+        net_total = gross_total = Decimal(0)
+        for source, (net, gross) in self._amounts.items():
+            rate = get_rate(source)
+            net_total += net * rate
+            gross_total += gross * rate
+        exponent = registry.get_exponent(currency)
+        create_money = Money._create  # pylint: disable=protected-access
+        return TaxedMoney._create(  # pylint: disable=protected-access
+            create_money(
+                net_total.quantize(exponent, rounding=rounding), currency),
+            create_money(
+                gross_total.quantize(exponent, rounding=rounding), currency))
+
+
+def _nonzero(amounts: dict) -> dict:
+    return {
+        currency: value for currency, value in amounts.items()
+        if (any(value) if isinstance(value, tuple) else value)}
@@ -1,6 +1,7 @@
 from __future__ import division, unicode_literals
 
-from typing import Union
+from decimal import Decimal
+from typing import Type, Union
 
 from .taxed_money import Money
 
@@ -11,6 +12,8 @@ class MoneyRange:
     """A taxed money range."""
 
     __slots__ = ('start', 'stop')
+    start: Money
+    stop: Money
 
     def __init__(self, start: Money, stop: Money) -> None:
         if start.currency != stop.currency:
@@ -21,12 +24,43 @@ class MoneyRange:
             raise ValueError(
                 'Cannot create a range from %r to %r' % (
                     start, stop))
-        self.start = start
-        self.stop = stop
+        _set_start(self, start)
+        _set_stop(self, stop)
+
+    @classmethod
+    def _create(cls, start: Money, stop: Money) -> 'MoneyRange':
+        """Build a range without validating its bounds.
+
+        Meant for ranges computed by the library itself.
+        """
+        price_range = object.__new__(MoneyRange)
+        _set_start(price_range, start)
+        _set_stop(price_range, stop)
+        return price_range
 
     def __repr__(self) -> str:
         return 'MoneyRange(%r, %r)' % (self.start, self.stop)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            'MoneyRange is immutable, cannot set %r' % (name,))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            'MoneyRange is immutable, cannot delete %r' % (name,))
+
+    def __reduce__(self):
+        start, stop = self.start, self.stop
+        # pylint: disable=unidiomatic-typecheck
+        if type(self) is MoneyRange and type(start) is type(stop) is Money:
+            return _unpickle_money_range, (
+                str(start.amount), str(stop.amount), start.currency)
+        # Subclasses keep their type and so do the bounds
+        return _rebuild_money_range, (type(self), start, stop)
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.stop))
+
     def __add__(self, other: Addable) -> 'MoneyRange':
         if isinstance(other, Money):
             if other.currency != self.currency:
@@ -35,7 +69,7 @@ class MoneyRange:
                         self.currency, other.currency))
             start = self.start + other
             stop = self.stop + other
-            return MoneyRange(start, stop)
+            return MoneyRange._create(start, stop)
         elif isinstance(other, MoneyRange):
             if other.start.currency != self.currency:
                 raise ValueError(
@@ -43,7 +77,7 @@ class MoneyRange:
                         self.currency, other.currency))
             start = self.start + other.start
             stop = self.stop + other.stop
-            return MoneyRange(start, stop)
+            return MoneyRange._create(start, stop)
         return NotImplemented
 
     def __sub__(self, other: Addable) -> 'MoneyRange':
@@ -54,7 +88,7 @@ class MoneyRange:
                         other.currency, self.start.currency))
             start = self.start - other
             stop = self.stop - other
-            return MoneyRange(start, stop)
+            return MoneyRange._create(start, stop)
         elif isinstance(other, MoneyRange):
             if other.start.currency != self.start.currency:
                 raise ValueError(
@@ -89,7 +123,7 @@ class MoneyRange:
 
         All arguments are passed to `Money.quantize`.
         """
-        return MoneyRange(
+        return MoneyRange._create(
             self.start.quantize(exp, rounding=rounding),
             self.stop.quantize(exp, rounding=rounding))
 
@@ -100,3 +134,23 @@ class MoneyRange:
         if stop is None:
             stop = self.stop
         return MoneyRange(start=start, stop=stop)
+
+
+# Slot setters bypassing __setattr__, used to build immutable instances
+_set_start = MoneyRange.start.__set__  # type: ignore
+_set_stop = MoneyRange.stop.__set__  # type: ignore
+
+
+def _unpickle_money_range(start: str, stop: str, currency: str) -> MoneyRange:
+    create_money = Money._create  # pylint: disable=protected-access
+    return MoneyRange._create(  # pylint: disable=protected-access
+        create_money(Decimal(start), currency),
+        create_money(Decimal(stop), currency))
+
+
+def _rebuild_money_range(
+        cls: Type[MoneyRange], start: Money, stop: Money) -> MoneyRange:
+    price_range = object.__new__(cls)
+    _set_start(price_range, start)
+    _set_stop(price_range, stop)
+    return price_range
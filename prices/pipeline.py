@@ -0,0 +1,243 @@
+from decimal import ROUND_HALF_UP, Decimal
+from functools import partial
+from inspect import signature
+from typing import Callable, Dict, Iterable, List
+
+from .currency import registry
+from .discount import fixed_discount, fractional_discount, percentage_discount
+from .money import Money
+from .money_range import MoneyRange
+from .tax import flat_tax, get_multiplier
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+FIXED = 'fixed'
+FRACTION = 'fraction'
+TAX = 'tax'
+
+ZERO = Decimal(0)
+
+
+def _compile_fixed(discount):
+    return FIXED, discount, None, None
+
+
+def _compile_fractional(fraction, from_gross, rounding):
+    return FRACTION, fraction, from_gross, rounding
+
+
+def _compile_percentage(percentage, from_gross, rounding):
+    return FRACTION, Decimal(percentage) / 100, from_gross, rounding
+
+
+def _compile_flat_tax(tax_rate, keep_gross):
+    return TAX, get_multiplier(tax_rate), keep_gross, None
+
+
+COMPILERS = {
+    fixed_discount: _compile_fixed,
+    fractional_discount: _compile_fractional,
+    percentage_discount: _compile_percentage,
+    flat_tax: _compile_flat_tax}  # type: Dict[Callable, Callable]
+
+# Dispatchers whose built-in handlers the fused steps stand in for
+DISPATCHERS = {
+    fixed_discount: fixed_discount.dispatcher,  # type: ignore
+    fractional_discount: fractional_discount.dispatcher,  # type: ignore
+    percentage_discount: fractional_discount.dispatcher,  # type: ignore
+    flat_tax: flat_tax.dispatcher}  # type: ignore
+
+
+def compile_step(step: Callable):
+    """Turn a partial of a tax or discount function into a fused step.
+
+    Returns `None` for any other callable.
+    """
+    if not isinstance(step, partial) or step.func not in COMPILERS:
+        return None
+    arguments = signature(step.func).bind(
+        None, *step.args, **step.keywords)
+    arguments.apply_defaults()
+    parameters = dict(arguments.arguments)
+    parameters.pop('base')
+    return COMPILERS[step.func](**parameters)
+
+
+class FusedSteps:
+    """Runs consecutive tax and discount steps on raw decimal amounts.
+
+    Type dispatch happens once per value, intermediate `Money` and
+    `TaxedMoney` objects are never created. Rounding happens in the same
+    places as when the original functions are called one after another.
+    Types whose handler was replaced with `register` on any of the
+    functions go through the original functions instead.
+    """
+
+    __slots__ = (
+        'steps', 'functions', 'adds_tax', 'dispatchers', 'caches', 'handlers')
+
+    def __init__(self, steps, functions) -> None:
+        self.steps = steps
+        self.functions = functions
+        self.adds_tax = any(step[0] is TAX for step in steps)
+        self.dispatchers = [DISPATCHERS[function.func] for function in functions]
+        self.caches = []  # type: List[dict]
+        self.handlers = {}  # type: Dict[type, Callable]
+        self._update_handlers()
+
+    def _update_handlers(self) -> None:
+        handlers = {
+            Money: self._apply_money,
+            TaxedMoney: self._apply_taxed_money,
+            MoneyRange: self._apply_money_range,
+            TaxedMoneyRange: self._apply_taxed_money_range}  # type: Dict[type, Callable]
+        dispatchers = self.dispatchers
+        self.handlers = {
+            cls: handler for cls, handler in handlers.items()
+            if all(dispatcher.is_builtin(cls) for dispatcher in dispatchers)}
+        self.caches = [dispatcher.cache for dispatcher in dispatchers]
+
+    def __call__(self, value):
+        # Dispatchers replace their cache whenever handlers change
+        for dispatcher, cache in zip(self.dispatchers, self.caches):
+            if dispatcher.cache is not cache:
+                self._update_handlers()
+                break
+        try:
+            handler = self.handlers[type(value)]
+        except KeyError:
+            return self._apply_functions(value)
+        return handler(value)
+
+    def _apply_functions(self, value):
+        for function in self.functions:
+            value = function(value)
+        return value
+
+    def _run(self, net: Decimal, gross: Decimal, currency: str, taxed: bool):
+        exponent = registry.get_exponent(currency)
+        for kind, first, second, third in self.steps:
+            if kind is FIXED:
+                if first.currency != currency:
+                    raise ValueError(
+                        'Cannot subtract amount in %r from %r' % (
+                            first.currency, currency))
+                net = net - first.amount
+                if net < 0:
+                    net = ZERO
+                if taxed:
+                    gross = gross - first.amount
+                    if gross < 0:
+                        gross = ZERO
+                else:
+                    gross = net
+            elif kind is FRACTION:
+                base = gross if second or not taxed else net
+                discount = (base * first).quantize(exponent, rounding=third)
+                net = net - discount
+                if net < 0:
+                    net = ZERO
+                if taxed:
+                    gross = gross - discount
+                    if gross < 0:
+                        gross = ZERO
+                else:
+                    gross = net
+            elif second:
+                net = (net / first).quantize(exponent, rounding=ROUND_HALF_UP)
+                taxed = True
+            else:
+                gross = (gross * first).quantize(exponent, rounding=ROUND_HALF_UP)
+                taxed = True
+        return net, gross
+
+    def _apply_money(self, value: Money):
+        currency = value.currency
+        net, gross = self._run(value.amount, value.amount, currency, False)
+        create_money = Money._create  # pylint: disable=protected-access
+        if self.adds_tax:
+            return TaxedMoney._create(  # pylint: disable=protected-access
+                create_money(net, currency), create_money(gross, currency))
+        return create_money(net, currency)
+
+    def _apply_taxed_money(self, value: TaxedMoney) -> TaxedMoney:
+        currency = value.currency
+        net, gross = self._run(
+            value.net.amount, value.gross.amount, currency, True)
+        create_money = Money._create  # pylint: disable=protected-access
+        return TaxedMoney._create(  # pylint: disable=protected-access
+            create_money(net, currency), create_money(gross, currency))
+
+    def _apply_money_range(self, value: MoneyRange):
+        start = self._apply_money(value.start)
+        stop = self._apply_money(value.stop)
+        if self.adds_tax:
+            return TaxedMoneyRange(start, stop)
+        return MoneyRange(start, stop)
+
+    def _apply_taxed_money_range(self, value: TaxedMoneyRange) -> TaxedMoneyRange:
+        return TaxedMoneyRange(
+            self._apply_taxed_money(value.start),
+            self._apply_taxed_money(value.stop))
+
+
+class PricingPipeline:
+    """A chain of tax and discount steps compiled once and applied many times.
+
+    Steps are callables taking a price, usually partials of `fixed_discount`,
+    `fractional_discount`, `percentage_discount` and `flat_tax`:
+
+        pipeline = PricingPipeline(
+            partial(percentage_discount, percentage=10),
+            partial(fixed_discount, discount=Money(5, 'USD')),
+            partial(flat_tax, tax_rate=Decimal('0.23')))
+        pipeline(Money(100, 'USD'))
+
+    Consecutive partials of those functions are fused, their constant
+    factors are computed upfront and the chain runs on decimal amounts.
+    Any other callable is applied as is.
+    """
+
+    __slots__ = ('steps', 'segments')
+
+    def __init__(self, *steps: Callable) -> None:
+        self.steps = steps
+        self.segments = []  # type: List[Callable]
+        fused = []
+        functions = []  # type: List[Callable]
+        for step in steps:
+            compiled = compile_step(step)
+            if compiled is not None:
+                fused.append(compiled)
+                functions.append(step)
+                continue
+            if fused:
+                self.segments.append(FusedSteps(fused, functions))
+                fused, functions = [], []
+            self.segments.append(step)
+        if fused:
+            self.segments.append(FusedSteps(fused, functions))
+
+    def __repr__(self) -> str:
+        return 'PricingPipeline(%s)' % (
+            ', '.join(repr(step) for step in self.steps),)
+
+    def __call__(self, value):
+        for segment in self.segments:
+            value = segment(value)
+        return value
+
+    apply = __call__
+
+    def apply_many(self, values: Iterable) -> List:
+        """Apply the pipeline to each of the given values."""
+        segments = self.segments
+        if len(segments) == 1:
+            segment = segments[0]
+            return [segment(value) for value in values]
+        results = []
+        for value in values:
+            for segment in segments:
+                value = segment(value)
+            results.append(value)
+        return results
@@ -0,0 +1,97 @@
+from decimal import Decimal
+from typing import Dict, Hashable, Iterable, List, Tuple, Union
+
+from .money import Money
+from .money_range import MoneyRange
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+Price = Union[Money, TaxedMoney]
+PriceRange = Union[MoneyRange, TaxedMoneyRange]
+
+
+def _amount(price: Price) -> Decimal:
+    if isinstance(price, TaxedMoney):
+        return price.gross.amount
+    if isinstance(price, Money):
+        return price.amount
+    raise TypeError(
+        'Cannot build a range from %s, Money or TaxedMoney is required' % (
+            type(price),))
+
+
+class RangeBuilder:
+    """Builds one price range per key from a stream of `(key, price)` pairs.
+
+    Only the lowest and highest price seen for each key are kept, so memory
+    grows with the number of keys rather than the number of prices. Prices
+    are compared the same way `min()` and `max()` would, taxed prices by
+    gross amount, and the first of several equal prices is kept.
+
+        builder = RangeBuilder()
+        builder.update([('shirt', Money(10, 'USD')), ('shirt', Money(5, 'USD'))])
+        builder.ranges()
+        # {'shirt': MoneyRange(Money('5', 'USD'), Money('10', 'USD'))}
+    """
+
+    __slots__ = ('_groups',)
+
+    def __init__(self) -> None:
+        # Each group is [lowest price, highest price, lowest amount, highest amount]
+        self._groups = {}  # type: Dict[Hashable, List]
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def add(self, key: Hashable, price: Price) -> None:
+        """Include a price in the range of the given key."""
+        self.update(((key, price),))
+
+    def update(self, pairs: Iterable[Tuple[Hashable, Price]]) -> None:
+        """Include each price in the range of its key."""
+        groups = self._groups
+        for key, price in pairs:
+            if type(price) is Money:  # pylint: disable=unidiomatic-typecheck
+                amount = price.amount
+            else:
+                amount = _amount(price)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [price, price, amount, amount]
+                continue
+            lowest = group[0]
+            if type(price) is not type(lowest) and (
+                    isinstance(price, TaxedMoney) is not
+                    isinstance(lowest, TaxedMoney)):
+                raise TypeError(
+                    'Cannot build a range for %r from taxed and untaxed'
+                    ' prices' % (key,))
+            if price.currency != lowest.currency:
+                raise ValueError(
+                    'Cannot build a range for %r from amounts in %r and %r' % (
+                        key, lowest.currency, price.currency))
+            if amount < group[2]:
+                group[0] = price
+                group[2] = amount
+            elif amount > group[3]:
+                group[1] = price
+                group[3] = amount
+
+    def ranges(self) -> Dict[Hashable, PriceRange]:
+        """Return the range of each key in order of first appearance."""
+        ranges = {}  # type: Dict[Hashable, PriceRange]
+        create_taxed_range = TaxedMoneyRange._create  # pylint: disable=protected-access
+        create_range = MoneyRange._create  # pylint: disable=protected-access
+        for key, (lowest, highest, _low, _high) in self._groups.items():
+            if isinstance(lowest, TaxedMoney):
+                ranges[key] = create_taxed_range(lowest, highest)
+            else:
+                ranges[key] = create_range(lowest, highest)
+        return ranges
+
+
+def build_ranges(pairs: Iterable[Tuple[Hashable, Price]]) -> Dict[Hashable, PriceRange]:
+    """Build a range per key from `(key, price)` pairs in a single pass."""
+    builder = RangeBuilder()
+    builder.update(pairs)
+    return builder.ranges()
@@ -0,0 +1,253 @@
+from collections import deque
+from collections.abc import Mapping
+from decimal import Decimal
+from itertools import count
+from random import random
+from typing import (
+    Deque, Dict, Hashable, Iterable, List, Optional, Tuple, Union)
+
+from .money import Money
+from .money_range import MoneyRange
+from .taxed_money import TaxedMoney
+from .taxed_money_range import TaxedMoneyRange
+
+Price = Union[Money, TaxedMoney]
+PriceRange = Union[MoneyRange, TaxedMoneyRange]
+
+
+class _Node:
+    __slots__ = (
+        'start', 'order', 'stop', 'start_net', 'stop_net', 'key', 'priority',
+        'max_stop', 'left', 'right')
+
+    def __init__(
+            self, start: Decimal, order: int, stop: Decimal, key: Hashable,
+            priority: float, *, start_net: Optional[Decimal],
+            stop_net: Optional[Decimal]) -> None:
+        self.start = start
+        self.order = order
+        self.stop = stop
+        self.start_net = start_net
+        self.stop_net = stop_net
+        self.key = key
+        self.priority = priority
+        self.max_stop = stop
+        self.left = None  # type: Optional[_Node]
+        self.right = None  # type: Optional[_Node]
+
+    def update(self) -> None:
+        max_stop = self.stop
+        if self.left is not None and self.left.max_stop > max_stop:
+            max_stop = self.left.max_stop
+        if self.right is not None and self.right.max_stop > max_stop:
+            max_stop = self.right.max_stop
+        self.max_stop = max_stop
+
+
+def _split(node: Optional[_Node], start: Decimal, order: int):
+    """Split a tree into nodes ordered before and not before `(start, order)`."""
+    if node is None:
+        return None, None
+    if (node.start, node.order) < (start, order):
+        node.right, right = _split(node.right, start, order)
+        node.update()
+        return node, right
+    left, node.left = _split(node.left, start, order)
+    node.update()
+    return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.update()
+        return left
+    right.left = _merge(left, right.left)
+    right.update()
+    return right
+
+
+def _build(nodes: List[_Node], low: int, high: int) -> Optional[_Node]:
+    if low >= high:
+        return None
+    middle = (low + high) // 2
+    node = nodes[middle]
+    node.left = _build(nodes, low, middle)
+    node.right = _build(nodes, middle + 1, high)
+    node.update()
+    return node
+
+
+Bounds = Tuple[str, Decimal, Decimal, Optional[Decimal], Optional[Decimal]]
+
+
+def _bounds(price_range: PriceRange) -> Bounds:
+    """Return the currency, gross bounds and net bounds of a range.
+
+    Net bounds are `None` for untaxed ranges.
+    """
+    if isinstance(price_range, TaxedMoneyRange):
+        start, stop = price_range.start, price_range.stop
+        return (
+            price_range.currency, start.gross.amount, stop.gross.amount,
+            start.net.amount, stop.net.amount)
+    if isinstance(price_range, MoneyRange):
+        return (
+            price_range.currency, price_range.start.amount,
+            price_range.stop.amount, None, None)
+    raise TypeError(
+        'RangeIndex requires MoneyRange or TaxedMoneyRange, not %s' % (
+            type(price_range),))
+
+
+def _point(price: Price) -> Bounds:
+    if isinstance(price, TaxedMoney):
+        gross, net = price.gross.amount, price.net.amount
+        return price.currency, gross, gross, net, net
+    if isinstance(price, Money):
+        return price.currency, price.amount, price.amount, None, None
+    raise TypeError(
+        'RangeIndex requires Money or TaxedMoney, not %s' % (type(price),))
+
+
+def _touches(bound_net: Optional[Decimal], net: Optional[Decimal]) -> bool:
+    """Tell whether a price with the gross of a bound lies on that bound.
+
+    Like `TaxedMoney` comparisons, equal gross amounts only match when both
+    net amounts are equal as well. Untaxed prices only have a gross amount.
+    """
+    return bound_net is None or net is None or bound_net == net
+
+
+class RangeIndex:
+    """An interval index over many keyed price ranges.
+
+    Each currency is kept in its own treap ordered by range start and
+    augmented with the largest stop of every subtree. Queries take
+    logarithmic time plus the number of matches, keys are returned in order
+    of range start. Bounds are inclusive like `in money_range`.
+
+    Taxed ranges are indexed by gross amount. As with `in taxed_money_range`,
+    a taxed price whose gross equals the gross of a bound only lies on that
+    bound when the net amounts are equal too. Untaxed prices and ranges only
+    compare gross amounts with taxed ones.
+
+        index = RangeIndex({'shirt': MoneyRange(Money(10, 'USD'), Money(20, 'USD'))})
+        index.containing(Money(15, 'USD'))
+        # ['shirt']
+    """
+
+    __slots__ = ('_roots', '_entries', '_order')
+
+    def __init__(self, ranges: Union[Mapping, Iterable[Tuple[Hashable, PriceRange]]] = ()) -> None:
+        self._roots = {}  # type: Dict[str, Optional[_Node]]
+        self._entries = {}  # type: Dict[Hashable, Tuple[str, _Node]]
+        self._order = count()
+        if isinstance(ranges, Mapping):
+            ranges = ranges.items()
+        partitions = {}  # type: Dict[str, List[_Node]]
+        for key, price_range in ranges:
+            if key in self._entries:
+                raise KeyError('Duplicate key %r' % (key,))
+            currency, start, stop, start_net, stop_net = _bounds(price_range)
+            node = _Node(
+                start, next(self._order), stop, key, 0.0,
+                start_net=start_net, stop_net=stop_net)
+            self._entries[key] = currency, node
+            partitions.setdefault(currency, []).append(node)
+        for currency, nodes in partitions.items():
+            nodes.sort(key=lambda node: (node.start, node.order))
+            root = _build(nodes, 0, len(nodes))
+            # Hand out random priorities largest first in breadth-first order
+            # so the balanced tree is a valid treap for later inserts
+            priorities = sorted(
+                (random() for _node in nodes), reverse=True)
+            queue = deque([root])  # type: Deque
+            for priority in priorities:
+                node = queue.popleft()
+                node.priority = priority
+                if node.left is not None:
+                    queue.append(node.left)
+                if node.right is not None:
+                    queue.append(node.right)
+            self._roots[currency] = root
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def insert(self, key: Hashable, price_range: PriceRange) -> None:
+        """Add a range under the given key, replacing any previous one."""
+        currency, start, stop, start_net, stop_net = _bounds(price_range)
+        if key in self._entries:
+            self.remove(key)
+        node = _Node(
+            start, next(self._order), stop, key, random(),
+            start_net=start_net, stop_net=stop_net)
+        self._entries[key] = currency, node
+        left, right = _split(self._roots.get(currency), start, node.order)
+        self._roots[currency] = _merge(_merge(left, node), right)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the range stored under the given key.
+
+        Raises `KeyError` if there is no such key.
+        """
+        currency, node = self._entries.pop(key)
+        left, rest = _split(self._roots[currency], node.start, node.order)
+        _node, right = _split(rest, node.start, node.order + 1)
+        root = _merge(left, right)
+        if root is None:
+            del self._roots[currency]
+        else:
+            self._roots[currency] = root
+
+    def _search(
+            self, currency: str, start: Decimal, stop: Decimal,
+            start_net: Optional[Decimal],
+            stop_net: Optional[Decimal]) -> List[Hashable]:
+        keys = []  # type: List[Hashable]
+        node = self._roots.get(currency)
+        stack = []  # type: List[_Node]
+        # In-order walk skipping subtrees that end before `start` and
+        # everything that begins after `stop`
+        while stack or node is not None:
+            if node is not None:
+                if node.max_stop < start:
+                    node = None
+                    continue
+                stack.append(node)
+                node = node.left
+                continue
+            node = stack.pop()
+            if node.start > stop:
+                break
+            starts_in = node.start < stop or _touches(node.start_net, stop_net)
+            stops_in = node.stop > start or (
+                node.stop == start and _touches(node.stop_net, start_net))
+            if starts_in and stops_in:
+                keys.append(node.key)
+            node = node.right
+        return keys
+
+    def overlapping(self, price_range: PriceRange) -> List[Hashable]:
+        """Return keys of ranges sharing at least one price with the given range."""
+        return self._search(*_bounds(price_range))
+
+    def containing(self, price: Price) -> List[Hashable]:
+        """Return keys of ranges containing the given price."""
+        return self._search(*_point(price))
+
+    def contains_many(self, prices: Iterable[Price]) -> List[List[Hashable]]:
+        """Return keys of ranges containing each of the given prices."""
+        search = self._search
+        results = []
+        for price in prices:
+            results.append(search(*_point(price)))
+        return results
@@ -0,0 +1,121 @@
+"""Repricing of large catalogs in worker processes.
+
+Decimal arithmetic holds the GIL, so repricing is spread over processes
+instead of threads. Every worker builds a `PricingPipeline` from the steps
+once, when it starts. Prices travel in chunks, each encoded into a single
+buffer with `prices.binary` instead of pickled object by object:
+
+    with Repricer(
+            partial(percentage_discount, percentage=10),
+            partial(flat_tax, tax_rate=Decimal('0.23'))) as repricer:
+        for price in repricer.map(catalog):
+            store(price)
+
+Steps must be picklable, partials of module-level functions are. Results
+are yielded in input order and only a bounded number of chunks is in flight
+at any time, so arbitrarily long iterables are streamed. Values are sent as
+the base price types, instances of `Money` subclasses come back as `Money`.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Iterable, Iterator, Optional
+
+from .binary import decode_many, encode_many
+from .pipeline import PricingPipeline
+
+_pipeline = None  # type: Optional[PricingPipeline]
+
+
+def _init_worker(steps) -> None:
+    global _pipeline  # pylint: disable=global-statement
+    _pipeline = PricingPipeline(*steps)
+
+
+def _reprice_chunk(data: bytes) -> bytes:
+    return encode_many(
+        _pipeline.apply_many(decode_many(data)))  # type: ignore
+
+
+class Repricer:
+    """Applies a chain of tax and discount steps in a pool of processes.
+
+    `processes` defaults to the number of CPUs. Up to `max_pending` chunks
+    of `chunk_size` prices are being repriced at once, by default two per
+    process. The pool is shut down by `close` or when leaving the `with`
+    block.
+    """
+
+    __slots__ = ('steps', 'chunk_size', 'max_pending', '_executor')
+
+    def __init__(
+            self, *steps: Callable, processes: Optional[int] = None,
+            chunk_size: int = 1000, max_pending: Optional[int] = None,
+            mp_context=None) -> None:
+        if chunk_size < 1:
+            raise ValueError(
+                'Chunk size must be positive, got %r' % (chunk_size,))
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if max_pending is None:
+            max_pending = 2 * processes
+        elif max_pending < 1:
+            raise ValueError(
+                'Number of pending chunks must be positive, got %r' % (
+                    max_pending,))
+        self.steps = steps
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+        self._executor = ProcessPoolExecutor(
+            processes, mp_context=mp_context, initializer=_init_worker,
+            initargs=(steps,))
+
+    def __repr__(self) -> str:
+        return 'Repricer(%s)' % (', '.join(repr(step) for step in self.steps),)
+
+    def __enter__(self) -> 'Repricer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        self._executor.shutdown()
+
+    def map(self, values: Iterable) -> Iterator:
+        """Yield the repriced values in the order they were given."""
+        iterator = iter(values)
+        chunk_size = self.chunk_size
+        max_pending = self.max_pending
+        submit = self._executor.submit
+        pending = deque()  # type: Deque[Future]
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    chunk = list(islice(iterator, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending.append(
+                        submit(_reprice_chunk, encode_many(chunk)))
+                if not pending:
+                    return
+                yield from decode_many(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def reprice(
+        values: Iterable, *steps: Callable, processes: Optional[int] = None,
+        chunk_size: int = 1000) -> Iterator:
+    """Yield the given prices with the steps applied, using a new `Repricer`.
+
+    The worker processes are shut down once all results are consumed.
+    """
+    with Repricer(
+            *steps, processes=processes, chunk_size=chunk_size) as repricer:
+        yield from repricer.map(values)
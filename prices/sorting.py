@@ -0,0 +1,95 @@
+from decimal import Decimal
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Tuple, TypeVar, Union
+
+from .money import Money
+from .taxed_money import TaxedMoney
+
+T = TypeVar('T', Money, TaxedMoney)
+
+GROSS = 'gross'
+NET = 'net'
+
+_AMOUNT_KEYS = {
+    GROSS: attrgetter('gross.amount'),
+    NET: attrgetter('net.amount')}
+_money_amount = attrgetter('amount')
+
+
+def sort_key(value: Union[Money, TaxedMoney], by: str = GROSS) -> Tuple[str, Decimal]:
+    """Return a `(currency, amount)` key ordering prices by currency first.
+
+    `TaxedMoney` is keyed on its gross amount unless `by` is `NET`. Use it to
+    sort lists mixing currencies:
+
+        sorted(prices, key=sort_key)
+    """
+    if isinstance(value, TaxedMoney):
+        return value.currency, _get_amount_key(by)(value)
+    if isinstance(value, Money):
+        return value.currency, value.amount
+    raise TypeError('Cannot build a sort key for %r' % (value,))
+
+
+def _get_amount_key(by: str) -> Callable:
+    try:
+        return _AMOUNT_KEYS[by]
+    except KeyError:
+        raise ValueError(
+            'Prices can be sorted by %r or %r, got %r' % (
+                GROSS, NET, by)) from None
+
+
+def _sort(values: List[T], by: str, reverse: bool) -> List[T]:
+    if not values:
+        return values
+    first = values[0]
+    if isinstance(first, TaxedMoney):
+        key = _get_amount_key(by)
+    elif isinstance(first, Money):
+        key = _money_amount
+    else:
+        raise TypeError('Cannot sort %r' % (first,))
+    try:
+        values.sort(key=key, reverse=reverse)
+    except AttributeError:
+        raise TypeError(
+            'Cannot sort taxed and untaxed prices together') from None
+    return values
+
+
+def sort_by_currency(
+        values: Iterable[T], *, by: str = GROSS,
+        reverse: bool = False) -> Dict[str, List[T]]:
+    """Split prices by currency and sort each group on decimal amounts.
+
+    Groups are returned in order of first appearance. Sorting is stable and
+    orders values like `sorted()` would within a currency.
+    """
+    groups = {}  # type: Dict[str, List[T]]
+    for value in values:
+        group = groups.get(value.currency)
+        if group is None:
+            groups[value.currency] = [value]
+        else:
+            group.append(value)
+    for group in groups.values():
+        _sort(group, by, reverse)
+    return groups
+
+
+def sort_prices(values: Iterable[T], *, by: str = GROSS, reverse: bool = False) -> List[T]:
+    """Return prices in a single currency sorted on their decimal amounts.
+
+    Gives the same result as `sorted()` while checking the currency once per
+    value instead of on every comparison. Raises `ValueError` if the prices
+    use different currencies.
+    """
+    groups = sort_by_currency(values, by=by, reverse=reverse)
+    if len(groups) > 1:
+        raise ValueError(
+            'Cannot sort amounts in %s together' % (
+                ', '.join(repr(currency) for currency in groups),))
+    for group in groups.values():
+        return group
+    return []
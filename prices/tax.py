@@ -1,7 +1,12 @@
-from decimal import Decimal
-from typing import Optional, Union, overload
+from decimal import ROUND_HALF_UP, Decimal, Inexact, localcontext
+from itertools import repeat
+from typing import Iterable, List, Optional, Sequence, Tuple, Union, overload
 
+from . import instrumentation
+from .currency import registry
+from .dispatch import Dispatcher
 from .money import Money
+from .money_array import MoneyArray
 from .money_range import MoneyRange
 from .taxed_money import TaxedMoney
 from .taxed_money_range import TaxedMoneyRange
@@ -9,10 +14,86 @@ from .taxed_money_range import TaxedMoneyRange
 Numeric = Union[int, Decimal]
 
 
+class TaxRate:
+    """A tax rate with the arithmetic needed to apply it done upfront.
+
+    The multiplier turning net amounts into gross amounts is computed once,
+    and so is its reciprocal when it can be represented exactly. Pass it
+    anywhere a decimal rate is accepted:
+
+        vat = TaxRate('0.23')
+        flat_tax(price, vat)
+
+    Rates are combined with `+` when they are all charged on the net amount
+    and with `compound` when a tax is charged on top of another one.
+    """
+
+    __slots__ = ('rate', 'multiplier', 'reciprocal')
+
+    def __init__(self, rate: Union[Numeric, str]) -> None:
+        rate = Decimal(rate)
+        multiplier = Decimal(1) + rate
+        if not multiplier.is_finite() or multiplier <= 0:
+            raise ValueError('Tax rate must be above -1, got %r' % (rate,))
+        self.rate = rate
+        self.multiplier = multiplier
+        with localcontext() as context:
+            context.traps[Inexact] = False
+            context.flags[Inexact] = False
+            reciprocal = Decimal(1) / multiplier
+            exact = not context.flags[Inexact]
+        # Dividing by the multiplier and multiplying by a rounded reciprocal
+        # can round a tie differently, only exact reciprocals are used
+        self.reciprocal = reciprocal if exact else None  # type: Optional[Decimal]
+
+    def __repr__(self) -> str:
+        return 'TaxRate(%r)' % (str(self.rate),)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaxRate):
+            return self.rate == other.rate
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.rate)
+
+    def __add__(self, other: 'TaxRate') -> 'TaxRate':
+        """Return a rate charging both taxes on the net amount."""
+        if isinstance(other, TaxRate):
+            return TaxRate(self.rate + other.rate)
+        return NotImplemented
+
+    def compound(self, other: 'TaxRate') -> 'TaxRate':
+        """Return a rate charging `other` on the amount taxed by this one."""
+        if not isinstance(other, TaxRate):
+            raise TypeError('Cannot compound a tax rate with %r' % (other,))
+        return TaxRate(self.multiplier * other.multiplier - 1)
+
+    def apply(self, base, *, keep_gross=False):
+        """Apply the tax to any price type, like `flat_tax`."""
+        return flat_tax(base, self, keep_gross=keep_gross)
+
+
+def get_multiplier(tax_rate: Union[Decimal, TaxRate]) -> Decimal:
+    """Return the number a net amount is multiplied by to add the tax."""
+    if isinstance(tax_rate, TaxRate):
+        return tax_rate.multiplier
+    return Decimal(1) + tax_rate
+
+
+def _remove_tax(amount, tax_rate: Union[Decimal, TaxRate]):
+    """Divide a gross `Money` or decimal amount by the tax multiplier."""
+    if isinstance(tax_rate, TaxRate):
+        if tax_rate.reciprocal is not None:
+            return amount * tax_rate.reciprocal
+        return amount / tax_rate.multiplier
+    return amount / (Decimal(1) + tax_rate)
+
+
 @overload
 def flat_tax(
         base: Union[Money, TaxedMoney],
-        tax_rate: Decimal,
+        tax_rate: Union[Decimal, TaxRate],
         *,
         keep_gross) -> TaxedMoney:
     ...  # pragma: no cover
@@ -21,31 +102,155 @@ def flat_tax(
 @overload
 def flat_tax(
         base: Union[MoneyRange, TaxedMoneyRange],
-        tax_rate: Decimal,
+        tax_rate: Union[Decimal, TaxRate],
         *,
         keep_gross) -> TaxedMoneyRange:
     ...  # pragma: no cover
 
 
 def flat_tax(base, tax_rate, *, keep_gross=False):
-    """Apply a flat tax by either increasing gross or decreasing net amount."""
-    fraction = Decimal(1) + tax_rate
-    if isinstance(base, (MoneyRange, TaxedMoneyRange)):
-        return TaxedMoneyRange(
-            flat_tax(base.start, tax_rate, keep_gross=keep_gross),
-            flat_tax(base.stop, tax_rate, keep_gross=keep_gross))
-    if isinstance(base, TaxedMoney):
+    """Apply a flat tax by either increasing gross or decreasing net amount.
+
+    The tax rate is a decimal or a `TaxRate`. Support for other price types
+    is added with `flat_tax.register`, the handler is called with `base`,
+    `tax_rate` and `keep_gross` as positional arguments. Registrations are
+    undone with `flat_tax.unregister`.
+    """
+    try:
+        handler = _flat_tax.cache[type(base)]
+    except KeyError:
+        handler = _flat_tax.resolve(base)
+    return handler(base, tax_rate, keep_gross)
+
+
+_flat_tax = Dispatcher('flat_tax')
+flat_tax.register = _flat_tax.register  # type: ignore
+flat_tax.unregister = _flat_tax.unregister  # type: ignore
+flat_tax.dispatcher = _flat_tax  # type: ignore
+instrumentation.register_dispatcher(_flat_tax)
+
+
+@_flat_tax.register(Money)
+def _flat_tax_money(
+        base: Money, tax_rate: Decimal, keep_gross: bool) -> TaxedMoney:
+    if keep_gross:
+        net = _remove_tax(base, tax_rate).quantize()
+        return TaxedMoney._create(net, base)  # pylint: disable=protected-access
+    gross = (base * get_multiplier(tax_rate)).quantize()
+    return TaxedMoney._create(base, gross)  # pylint: disable=protected-access
+
+
+@_flat_tax.register(TaxedMoney)
+def _flat_tax_taxed_money(
+        base: TaxedMoney, tax_rate: Decimal, keep_gross: bool) -> TaxedMoney:
+    if keep_gross:
+        new_net = _remove_tax(base.net, tax_rate).quantize()
+        return TaxedMoney._create(new_net, base.gross)  # pylint: disable=protected-access
+    new_gross = (base.gross * get_multiplier(tax_rate)).quantize()
+    return TaxedMoney._create(base.net, new_gross)  # pylint: disable=protected-access
+
+
+@_flat_tax.register(MoneyRange)
+def _flat_tax_money_range(
+        base: MoneyRange, tax_rate: Decimal,
+        keep_gross: bool) -> TaxedMoneyRange:
+    return TaxedMoneyRange(
+        _flat_tax_money(base.start, tax_rate, keep_gross),
+        _flat_tax_money(base.stop, tax_rate, keep_gross))
+
+
+@_flat_tax.register(TaxedMoneyRange)
+def _flat_tax_taxed_money_range(
+        base: TaxedMoneyRange, tax_rate: Decimal,
+        keep_gross: bool) -> TaxedMoneyRange:
+    return TaxedMoneyRange(
+        _flat_tax_taxed_money(base.start, tax_rate, keep_gross),
+        _flat_tax_taxed_money(base.stop, tax_rate, keep_gross))
+
+
+_flat_tax.seal()
+
+
+@overload
+def flat_tax_many(
+        values: MoneyArray,
+        tax_rate: Union[Decimal, TaxRate, Sequence[Decimal]],
+        *,
+        keep_gross,
+        currency) -> Tuple[MoneyArray, MoneyArray]:
+    ...  # pragma: no cover
+
+
+@overload
+def flat_tax_many(
+        values: Iterable[Union[Money, Numeric]],
+        tax_rate: Union[Decimal, TaxRate, Sequence[Decimal]],
+        *,
+        keep_gross,
+        currency) -> Tuple[List[Money], List[Money]]:
+    ...  # pragma: no cover
+
+
+def flat_tax_many(values, tax_rate, *, keep_gross=False, currency=None):
+    """Apply a flat tax to a column of values and return net and gross columns.
+
+    Values can be a `MoneyArray`, an iterable of `Money` or an iterable of
+    amounts in the given `currency`. The tax rate, a decimal or a `TaxRate`,
+    is either shared by all values or given as a sequence with one rate per
+    value. Results are rounded exactly like `flat_tax` rounds them.
+    """
+    if instrumentation.enabled:
+        return instrumentation.timed(
+            'flat_tax_many', _flat_tax_many, values, tax_rate, keep_gross,
+            currency)
+    return _flat_tax_many(values, tax_rate, keep_gross, currency)
+
+
+def _flat_tax_many(values, tax_rate, keep_gross, currency):
+    if isinstance(values, MoneyArray):
+        if isinstance(tax_rate, (int, Decimal, TaxRate)):
+            fractions = get_multiplier(tax_rate)
+        else:
+            fractions = [get_multiplier(rate) for rate in tax_rate]
         if keep_gross:
-            new_net = (base.net / fraction).quantize()
-            return TaxedMoney(net=new_net, gross=base.gross)
+            return (values / fractions).quantize(), values
+        return values, (values * fractions).quantize()
+    if isinstance(tax_rate, (int, Decimal, TaxRate)):
+        fractions = repeat(get_multiplier(tax_rate))
+    else:
+        values = list(values)
+        fractions = [get_multiplier(rate) for rate in tax_rate]
+        if len(fractions) != len(values):
+            raise ValueError(
+                'Expected %d tax rates, got %d' % (
+                    len(values), len(fractions)))
+    nets = []
+    grosses = []
+    exponents = {}
+    create_money = Money._create  # pylint: disable=protected-access
+    for value, fraction in zip(values, fractions):
+        if isinstance(value, Money):
+            amount = value.amount
+            value_currency = value.currency
+        elif isinstance(value, (int, Decimal)) and currency is not None:
+            amount = Decimal(value)
+            value_currency = currency
+            value = create_money(amount, currency)
         else:
-            new_gross = (base.gross * fraction).quantize()
-            return TaxedMoney(net=base.net, gross=new_gross)
-    if isinstance(base, Money):
+            raise TypeError('Unknown base for flat_tax_many: %r' % (value,))
+        try:
+            exponent = exponents[value_currency]
+        except KeyError:
+            exponent = exponents[value_currency] = registry.get_exponent(
+                value_currency)
         if keep_gross:
-            net = (base / fraction).quantize()
-            return TaxedMoney(net=net, gross=base)
+            nets.append(create_money(
+                (amount / fraction).quantize(exponent, rounding=ROUND_HALF_UP),
+                value_currency))
+            grosses.append(value)
         else:
-            gross = (base * fraction).quantize()
-            return TaxedMoney(net=base, gross=gross)
-    raise TypeError('Unknown base for flat_tax: %r' % (base,))
+            nets.append(value)
+            grosses.append(create_money(
+                (amount * fraction).quantize(exponent, rounding=ROUND_HALF_UP),
+                value_currency))
+    return nets, grosses
@@ -2,7 +2,7 @@ from __future__ import division, unicode_literals
 
 import warnings
 from decimal import Decimal
-from typing import Union
+from typing import Iterable, List, Tuple, Type, Union
 
 from .money import Money
 
@@ -13,6 +13,8 @@ class TaxedMoney:
     """Stores Money for net, gross (incl. tax) and tax."""
 
     __slots__ = ('net', 'gross')
+    net: Money
+    gross: Money
 
     def __init__(self, net: Money, gross: Money) -> None:
         if not isinstance(net, Money) or not isinstance(gross, Money):
@@ -22,12 +24,61 @@ class TaxedMoney:
             raise ValueError(
                 'Amounts given in different currencies: %r and %r' % (
                     net.currency, gross.currency))
-        self.net = net
-        self.gross = gross
+        _set_net(self, net)
+        _set_gross(self, gross)
+
+    @classmethod
+    def _create(cls, net: Money, gross: Money) -> 'TaxedMoney':
+        """Build an instance without validating the amounts.
+
+        Meant for values computed by the library itself.
+        """
+        price = object.__new__(TaxedMoney)
+        _set_net(price, net)
+        _set_gross(price, gross)
+        return price
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Numeric, Numeric, str]]) -> List['TaxedMoney']:
+        """Build instances from `(net, gross, currency)` rows.
+
+        Amounts are converted like in the `Money` constructor.
+        """
+        create = TaxedMoney._create
+        create_money = Money._create  # pylint: disable=protected-access
+        result = []
+        for net, gross, currency in rows:
+            if type(net) is not Decimal:  # pylint: disable=unidiomatic-typecheck
+                net = Money(net, currency).amount
+            if type(gross) is not Decimal:  # pylint: disable=unidiomatic-typecheck
+                gross = Money(gross, currency).amount
+            result.append(create(
+                create_money(net, currency), create_money(gross, currency)))
+        return result
 
     def __repr__(self) -> str:
         return 'TaxedMoney(net=%r, gross=%r)' % (self.net, self.gross)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            'TaxedMoney is immutable, cannot set %r' % (name,))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            'TaxedMoney is immutable, cannot delete %r' % (name,))
+
+    def __reduce__(self):
+        net, gross = self.net, self.gross
+        # pylint: disable=unidiomatic-typecheck
+        if type(self) is TaxedMoney and type(net) is type(gross) is Money:
+            return _unpickle_taxed_money, (
+                str(net.amount), str(gross.amount), net.currency)
+        # Subclasses keep their type and so do the amounts
+        return _rebuild_taxed_money, (type(self), net, gross)
+
+    def __hash__(self) -> int:
+        return hash((self.net, self.gross))
+
     def __lt__(self, other: 'TaxedMoney') -> bool:
         if isinstance(other, TaxedMoney):
             return self.gross < other.gross
@@ -45,9 +96,33 @@ class TaxedMoney:
         return False
 
     def __le__(self, other: 'TaxedMoney') -> bool:
-        if self == other:
-            return True
-        return self < other
+        if isinstance(other, TaxedMoney):
+            return self.gross < other.gross or (
+                self.gross == other.gross and self.net == other.net)
+        elif isinstance(other, Money):
+            raise TypeError(
+                'Cannot compare taxed and untaxed Money,'
+                ' use taxed_money.net or taxed_money.gross explicitly')
+        return NotImplemented
+
+    def __gt__(self, other: 'TaxedMoney') -> bool:
+        if isinstance(other, TaxedMoney):
+            return self.gross > other.gross
+        elif isinstance(other, Money):
+            raise TypeError(
+                'Cannot compare taxed and untaxed Money,'
+                ' use taxed_money.net or taxed_money.gross explicitly')
+        return NotImplemented
+
+    def __ge__(self, other: 'TaxedMoney') -> bool:
+        if isinstance(other, TaxedMoney):
+            return self.gross > other.gross or (
+                self.gross == other.gross and self.net == other.net)
+        elif isinstance(other, Money):
+            raise TypeError(
+                'Cannot compare taxed and untaxed Money,'
+                ' use taxed_money.net or taxed_money.gross explicitly')
+        return NotImplemented
 
     def __mul__(self, other: Numeric) -> 'TaxedMoney':
         try:
@@ -55,7 +130,9 @@ class TaxedMoney:
             gross = self.gross * other
         except TypeError:
             return NotImplemented
-        return TaxedMoney(net=net, gross=gross)
+        if isinstance(net, Money) and isinstance(gross, Money):
+            return TaxedMoney._create(net, gross)
+        return TaxedMoney(net, gross)
 
     def __rmul__(self, other: Numeric) -> 'TaxedMoney':
         return self * other
@@ -66,28 +143,30 @@ class TaxedMoney:
             gross = self.gross / other
         except TypeError:
             return NotImplemented
-        return TaxedMoney(net=net, gross=gross)
+        if isinstance(net, Money) and isinstance(gross, Money):
+            return TaxedMoney._create(net, gross)
+        return TaxedMoney(net, gross)
 
     def __add__(self, other: Union[Money, 'TaxedMoney']) -> 'TaxedMoney':
         if isinstance(other, TaxedMoney):
             net = self.net + other.net
             gross = self.gross + other.gross
-            return TaxedMoney(net=net, gross=gross)
+            return TaxedMoney._create(net, gross)
         if isinstance(other, Money):
             net = self.net + other
             gross = self.gross + other
-            return TaxedMoney(net=net, gross=gross)
+            return TaxedMoney._create(net, gross)
         return NotImplemented
 
     def __sub__(self, other: Union[Money, 'TaxedMoney']) -> 'TaxedMoney':
         if isinstance(other, TaxedMoney):
             net = self.net - other.net
             gross = self.gross - other.gross
-            return TaxedMoney(net=net, gross=gross)
+            return TaxedMoney._create(net, gross)
         if isinstance(other, Money):
             net = self.net - other
             gross = self.gross - other
-            return TaxedMoney(net=net, gross=gross)
+            return TaxedMoney._create(net, gross)
         return NotImplemented
 
     def __bool__(self) -> bool:  # pragma: no cover
@@ -114,6 +193,26 @@ class TaxedMoney:
 
         All arguments are passed to `Money.quantize`.
         """
-        return TaxedMoney(
-            net=self.net.quantize(exp, rounding=rounding),
-            gross=self.gross.quantize(exp, rounding=rounding))
+        return TaxedMoney._create(
+            self.net.quantize(exp, rounding=rounding),
+            self.gross.quantize(exp, rounding=rounding))
+
+
+# Slot setters bypassing __setattr__, used to build immutable instances
+_set_net = TaxedMoney.net.__set__  # type: ignore
+_set_gross = TaxedMoney.gross.__set__  # type: ignore
+
+
+def _unpickle_taxed_money(net: str, gross: str, currency: str) -> TaxedMoney:
+    create_money = Money._create  # pylint: disable=protected-access
+    return TaxedMoney._create(  # pylint: disable=protected-access
+        create_money(Decimal(net), currency),
+        create_money(Decimal(gross), currency))
+
+
+def _rebuild_taxed_money(
+        cls: Type[TaxedMoney], net: Money, gross: Money) -> TaxedMoney:
+    price = object.__new__(cls)
+    _set_net(price, net)
+    _set_gross(price, gross)
+    return price
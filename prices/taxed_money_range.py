@@ -1,6 +1,7 @@
 from __future__ import division, unicode_literals
 
-from typing import Union
+from decimal import Decimal
+from typing import Type, Union
 
 from .money import Money
 from .money_range import MoneyRange
@@ -13,6 +14,8 @@ class TaxedMoneyRange:
     """A taxed money range."""
 
     __slots__ = ('start', 'stop')
+    start: TaxedMoney
+    stop: TaxedMoney
 
     def __init__(self, start: TaxedMoney, stop: TaxedMoney) -> None:
         if start.currency != stop.currency:
@@ -22,12 +25,48 @@ class TaxedMoneyRange:
         if start > stop:
             raise ValueError(
                 'Cannot create a range from %r to %r' % (start, stop))
-        self.start = start
-        self.stop = stop
+        _set_start(self, start)
+        _set_stop(self, stop)
+
+    @classmethod
+    def _create(cls, start: TaxedMoney, stop: TaxedMoney) -> 'TaxedMoneyRange':
+        """Build a range without validating its bounds.
+
+        Meant for ranges computed by the library itself.
+        """
+        price_range = object.__new__(TaxedMoneyRange)
+        _set_start(price_range, start)
+        _set_stop(price_range, stop)
+        return price_range
 
     def __repr__(self) -> str:
         return 'TaxedMoneyRange(%r, %r)' % (self.start, self.stop)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            'TaxedMoneyRange is immutable, cannot set %r' % (name,))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            'TaxedMoneyRange is immutable, cannot delete %r' % (name,))
+
+    def __reduce__(self):
+        start, stop = self.start, self.stop
+        # pylint: disable=unidiomatic-typecheck
+        if (type(self) is TaxedMoneyRange and
+                type(start) is type(stop) is TaxedMoney and
+                type(start.net) is type(start.gross) is Money and
+                type(stop.net) is type(stop.gross) is Money):
+            return _unpickle_taxed_money_range, (
+                str(start.net.amount), str(start.gross.amount),
+                str(stop.net.amount), str(stop.gross.amount),
+                start.currency)
+        # Subclasses keep their type and so do the bounds
+        return _rebuild_taxed_money_range, (type(self), start, stop)
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.stop))
+
     def __add__(self, other: Addable) -> 'TaxedMoneyRange':
         if isinstance(other, (Money, TaxedMoney)):
             if other.currency != self.currency:
@@ -36,7 +75,7 @@ class TaxedMoneyRange:
                         self.currency, other.currency))
             start = self.start + other
             stop = self.stop + other
-            return TaxedMoneyRange(start, stop)
+            return TaxedMoneyRange._create(start, stop)
         elif isinstance(other, (MoneyRange, TaxedMoneyRange)):
             if other.start.currency != self.currency:
                 raise ValueError(
@@ -44,7 +83,7 @@ class TaxedMoneyRange:
                         self.currency, other.currency))
             start = self.start + other.start
             stop = self.stop + other.stop
-            return TaxedMoneyRange(start, stop)
+            return TaxedMoneyRange._create(start, stop)
         return NotImplemented
 
     def __sub__(self, other: Addable) -> 'TaxedMoneyRange':
@@ -55,7 +94,7 @@ class TaxedMoneyRange:
                         other.currency, self.start.currency))
             start = self.start - other
             stop = self.stop - other
-            return TaxedMoneyRange(start, stop)
+            return TaxedMoneyRange._create(start, stop)
         elif isinstance(other, (MoneyRange, TaxedMoneyRange)):
             if other.start.currency != self.start.currency:
                 raise ValueError(
@@ -91,7 +130,7 @@ class TaxedMoneyRange:
         All arguments are passed to `TaxedMoney.quantize` which in turn calls
         `Money.quantize`.
         """
-        return TaxedMoneyRange(
+        return TaxedMoneyRange._create(
             self.start.quantize(exp, rounding=rounding),
             self.stop.quantize(exp, rounding=rounding))
 
@@ -102,3 +141,31 @@ class TaxedMoneyRange:
         if stop is None:
             stop = self.stop
         return TaxedMoneyRange(start=start, stop=stop)
+
+
+# Slot setters bypassing __setattr__, used to build immutable instances
+_set_start = TaxedMoneyRange.start.__set__  # type: ignore
+_set_stop = TaxedMoneyRange.stop.__set__  # type: ignore
+
+
+def _unpickle_taxed_money_range(
+        start_net: str, start_gross: str, stop_net: str, stop_gross: str,
+        currency: str) -> TaxedMoneyRange:
+    create_money = Money._create  # pylint: disable=protected-access
+    create_taxed_money = TaxedMoney._create  # pylint: disable=protected-access
+    return TaxedMoneyRange._create(  # pylint: disable=protected-access
+        create_taxed_money(
+            create_money(Decimal(start_net), currency),
+            create_money(Decimal(start_gross), currency)),
+        create_taxed_money(
+            create_money(Decimal(stop_net), currency),
+            create_money(Decimal(stop_gross), currency)))
+
+
+def _rebuild_taxed_money_range(
+        cls: Type[TaxedMoneyRange], start: TaxedMoney,
+        stop: TaxedMoney) -> TaxedMoneyRange:
+    price_range = object.__new__(cls)
+    _set_start(price_range, start)
+    _set_stop(price_range, stop)
+    return price_range
@@ -1,10 +1,138 @@
 import functools
 import operator
-from typing import Iterable, TypeVar
+from decimal import (
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP)
+from typing import Any, Iterable, Optional, TypeVar
+
+from .money import Money
+from .taxed_money import TaxedMoney
 
 T = TypeVar('T')
 
+_EXHAUSTED = object()
+
+ROUNDING_MODES = frozenset([
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP])
+
+
+def sum(values: Iterable[T], start: Optional[T] = None) -> T:
+    """Return a sum of given values.
+
+    `start` is added to the total and returned as is for an empty iterable.
+    Runs of `Money` and `TaxedMoney` are summed on their decimal amounts,
+    other values are added with the `+` operator.
+    """
+    iterator = iter(values)
+    # Narrowed by exact type checks below, which type checkers do not follow
+    total = start  # type: Any
+    if total is None:
+        try:
+            total = next(iterator)
+        except StopIteration:
+            raise TypeError(
+                'sum() of an empty iterable with no start value') from None
+    while True:
+        if type(total) is Money:  # pylint: disable=unidiomatic-typecheck
+            total, value = _sum_money(total, iterator)
+        elif type(total) is TaxedMoney:  # pylint: disable=unidiomatic-typecheck
+            total, value = _sum_taxed_money(total, iterator)
+        else:
+            return functools.reduce(operator.add, iterator, total)
+        if value is _EXHAUSTED:
+            return total
+        total = total + value
+
+
+def _sum_money(total: Money, iterator):
+    """Add `Money` values to the total until a value of another type is met.
+
+    Return the total and the first value that was not added.
+    """
+    amount = total.amount
+    currency = total.currency
+    for value in iterator:
+        if type(value) is not Money:  # pylint: disable=unidiomatic-typecheck
+            break
+        if value.currency != currency:
+            raise ValueError(
+                'Cannot add amount in %r to %r' % (currency, value.currency))
+        amount += value.amount
+    else:
+        value = _EXHAUSTED
+    if amount is not total.amount:
+        total = Money._create(amount, currency)  # pylint: disable=protected-access
+    return total, value
+
+
+def _sum_taxed_money(total: TaxedMoney, iterator):
+    """Add `TaxedMoney` and `Money` values to the total.
+
+    Stop at the first value of another type and return the total and that
+    value.
+    """
+    net = total.net.amount
+    gross = total.gross.amount
+    currency = total.currency
+    for value in iterator:
+        value_type = type(value)
+        if value_type is TaxedMoney:
+            if value.currency != currency:
+                raise ValueError(
+                    'Cannot add amount in %r to %r' % (
+                        currency, value.currency))
+            net += value.net.amount
+            gross += value.gross.amount
+        elif value_type is Money:
+            if value.currency != currency:
+                raise ValueError(
+                    'Cannot add amount in %r to %r' % (
+                        currency, value.currency))
+            net += value.amount
+            gross += value.amount
+        else:
+            break
+    else:
+        value = _EXHAUSTED
+    if net is not total.net.amount or gross is not total.gross.amount:
+        create_money = Money._create  # pylint: disable=protected-access
+        total = TaxedMoney._create(  # pylint: disable=protected-access
+            create_money(net, currency), create_money(gross, currency))
+    return total, value
+
 
-def sum(values: Iterable[T]) -> T:
-    """Return a sum of given values."""
-    return functools.reduce(operator.add, values)
+def round_divide(  # pylint: disable=too-many-return-statements
+        numerator: int, denominator: int, rounding: str) -> int:
+    """Divide two integers rounding the result the way `Decimal` does."""
+    if rounding not in ROUNDING_MODES:
+        raise ValueError('Unknown rounding mode: %r' % (rounding,))
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    if not remainder or rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_CEILING:
+        return quotient + 1
+    if numerator < 0:
+        towards_zero, away_from_zero = quotient + 1, quotient
+    else:
+        towards_zero, away_from_zero = quotient, quotient + 1
+    if rounding == ROUND_DOWN:
+        return towards_zero
+    if rounding == ROUND_UP:
+        return away_from_zero
+    if rounding == ROUND_05UP:
+        if abs(towards_zero) % 5:
+            return towards_zero
+        return away_from_zero
+    double_remainder = 2 * remainder
+    if double_remainder < denominator:
+        return quotient
+    if double_remainder > denominator:
+        return quotient + 1
+    if rounding == ROUND_HALF_UP:
+        return away_from_zero
+    if rounding == ROUND_HALF_DOWN:
+        return towards_zero
+    return quotient + (quotient & 1)
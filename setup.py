@@ -7,10 +7,10 @@ CLASSIFIERS = [
     'License :: OSI Approved :: BSD License',
     'Operating System :: OS Independent',
     'Programming Language :: Python',
-    'Programming Language :: Python :: 3.5',
-    'Programming Language :: Python :: 3.6',
     'Programming Language :: Python :: 3.7',
     'Programming Language :: Python :: 3.8',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
     'Topic :: Software Development :: Libraries :: Python Modules']
 
 README_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "README.md")
@@ -28,6 +28,8 @@ setup(
     version='1.1.1',
     url='https://github.com/mirumee/prices',
     packages=['prices'],
-    install_requires=['babel>=2.5.0', 'typing>=3.6.0;python_version<"3.5"'],
+    python_requires='>=3.7',
+    install_requires=['babel>=2.5.0'],
+    extras_require={'numpy': ['numpy>=1.17']},
     classifiers=CLASSIFIERS,
     platforms=['any'])
@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+
+from prices import (
+    Money, MoneyAccumulator, TaxedMoney, TaxedMoneyAccumulator, sum)
+
+
+def test_money_accumulator():
+    total = MoneyAccumulator()
+    total.add(Money('1.50', 'USD'))
+    total.add(Money('2.25', 'USD'), 3)
+    total += Money('0.25', 'USD')
+    assert total.result() == Money('8.50', 'USD')
+    assert total.currency == 'USD'
+
+
+def test_matches_repeated_addition():
+    values = [Money('1.0', 'USD'), Money('2', 'USD'), Money('0.005', 'USD')]
+    result = MoneyAccumulator().update(values).result()
+    assert str(result.amount) == str(sum(values).amount)
+    result = MoneyAccumulator().add(Money('2', 'USD'), Decimal('1.0')).result()
+    assert str(result.amount) == '2.0'
+
+
+def test_money_accumulator_empty():
+    assert MoneyAccumulator('EUR').result() == Money(0, 'EUR')
+    with pytest.raises(ValueError):
+        MoneyAccumulator().result()
+
+
+def test_money_accumulator_invalid():
+    total = MoneyAccumulator('USD')
+    with pytest.raises(ValueError):
+        total.add(Money(1, 'EUR'))
+    with pytest.raises(TypeError):
+        total.add(TaxedMoney(Money(1, 'USD'), Money(1, 'USD')))
+
+
+def test_taxed_money_accumulator():
+    total = TaxedMoneyAccumulator()
+    total.add(TaxedMoney(Money(10, 'USD'), Money('12.30', 'USD')), 2)
+    total += Money(5, 'USD')
+    result = total.result()
+    assert result == TaxedMoney(Money(25, 'USD'), Money('29.60', 'USD'))
+    assert type(result) is TaxedMoney
+
+
+def test_taxed_money_accumulator_matches_sum():
+    values = [
+        TaxedMoney(Money('1.0', 'USD'), Money('1.23', 'USD')),
+        Money(2, 'USD'),
+        TaxedMoney(Money(3, 'USD'), Money('3.69', 'USD'))]
+    result = TaxedMoneyAccumulator().update(values).result()
+    expected = sum(values)
+    assert str(result.net.amount) == str(expected.net.amount)
+    assert str(result.gross.amount) == str(expected.gross.amount)
+
+
+def test_taxed_money_accumulator_empty():
+    zero = Money(0, 'EUR')
+    assert TaxedMoneyAccumulator('EUR').result() == TaxedMoney(zero, zero)
+    with pytest.raises(ValueError):
+        TaxedMoneyAccumulator().result()
+
+
+def test_taxed_money_accumulator_invalid():
+    total = TaxedMoneyAccumulator('USD')
+    with pytest.raises(ValueError):
+        total.add(Money(1, 'EUR'))
+    with pytest.raises(TypeError):
+        total.add(Decimal(1))
@@ -0,0 +1,80 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from prices import (
+    IntegerMoney, Money, TaxedMoney, allocate, allocate_many, sum)
+
+
+def test_allocate():
+    assert allocate(Money(10, 'USD'), [1, 1, 1]) == [
+        Money('3.34', 'USD'), Money('3.33', 'USD'), Money('3.33', 'USD')]
+    assert allocate(Money(5, 'USD'), [3, 0, 7]) == [
+        Money('1.50', 'USD'), Money(0, 'USD'), Money('3.50', 'USD')]
+    parts = allocate(Money('0.05', 'EUR'), [1, 1, 1, 1, 1, 1, 1])
+    assert parts == [Money('0.01', 'EUR')] * 5 + [Money(0, 'EUR')] * 2
+    assert all(part.amount.as_tuple().exponent == -2 for part in parts)
+
+
+def test_allocate_gives_leftover_to_largest_remainders():
+    parts = allocate(Money('1.00', 'USD'), [Decimal('0.15'), Decimal('0.35'), 1])
+    assert parts == [
+        Money('0.10', 'USD'), Money('0.23', 'USD'), Money('0.67', 'USD')]
+
+
+def test_allocate_keeps_total():
+    rng = random.Random(0)
+    for _ in range(50):
+        total = Money(Decimal(rng.randint(-10 ** 6, 10 ** 6)).scaleb(-2), 'EUR')
+        weights = [rng.randint(0, 1000) for _ in range(rng.randint(1, 50))]
+        weights[0] += 1
+        parts = allocate(total, weights)
+        assert len(parts) == len(weights)
+        assert sum(parts) == total
+        exact = [total.amount * weight / sum(weights) for weight in weights]
+        assert all(
+            abs(part.amount - share) < Decimal('0.01')
+            for part, share in zip(parts, exact))
+
+
+def test_allocate_finer_amounts():
+    parts = allocate(Money('0.005', 'USD'), [1, 1])
+    assert parts == [Money('0.003', 'USD'), Money('0.002', 'USD')]
+
+
+def test_allocate_integer_money():
+    parts = allocate(IntegerMoney(1000, 'USD'), [1, 2])
+    assert [part.units for part in parts] == [333, 667]
+    assert all(isinstance(part, IntegerMoney) for part in parts)
+
+
+def test_allocate_taxed_money():
+    price = TaxedMoney(Money('10.00', 'EUR'), Money('12.30', 'EUR'))
+    parts = allocate(price, [1, 1, 1])
+    assert sum(parts) == price
+    assert [part.tax for part in parts] == [
+        Money('0.77', 'EUR'), Money('0.77', 'EUR'), Money('0.76', 'EUR')]
+    assert parts[0] == TaxedMoney(Money('3.33', 'EUR'), Money('4.10', 'EUR'))
+
+
+def test_allocate_many():
+    values = [Money('5.00', 'USD'), Money('-1.00', 'USD')]
+    assert allocate_many(values, iter([1, 2])) == [
+        allocate(value, [1, 2]) for value in values]
+    assert allocate_many([], [1]) == []
+
+
+def test_allocate_invalid_weights():
+    with pytest.raises(ValueError):
+        allocate(Money(1, 'USD'), [])
+    with pytest.raises(ValueError):
+        allocate(Money(1, 'USD'), [0, 0])
+    with pytest.raises(ValueError):
+        allocate(Money(1, 'USD'), [1, -1])
+    with pytest.raises(ValueError):
+        allocate(Money(1, 'USD'), [Decimal('NaN')])
+    with pytest.raises(TypeError):
+        allocate(Money(1, 'USD'), [0.5])
+    with pytest.raises(TypeError):
+        allocate(1, [1])
@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+import pytest
+
+from prices import (
+    IntegerMoney, Money, MoneyRange, TaxedMoney, TaxedMoneyRange)
+from prices.binary import decode, decode_many, encode, encode_many
+
+VALUES = [
+    Money('9.99', 'USD'),
+    Money('-0.00', 'EUR'),
+    Money('1E+3', 'JPY'),
+    Money('123456789012345678901234567890.123', 'XBT'),
+    TaxedMoney(Money('10', 'GBP'), Money('12.30', 'GBP')),
+    MoneyRange(Money(1, 'PLN'), Money('2.5', 'PLN')),
+    TaxedMoneyRange(
+        TaxedMoney(Money(1, 'CHF'), Money('1.2', 'CHF')),
+        TaxedMoney(Money(2, 'CHF'), Money('2.4', 'CHF')))]
+
+
+
+@pytest.mark.parametrize('value', VALUES)
+def test_round_trip(value):
+    decoded = decode(encode(value))
+    assert type(decoded) is type(value)
+    assert decoded == value
+    assert repr(decoded) == repr(value)
+
+
+def test_round_trip_keeps_exponent_and_sign():
+    decoded = decode(encode(Money('-0.00', 'EUR')))
+    assert str(decoded.amount) == '-0.00'
+
+
+def test_is_compact():
+    assert len(encode(Money('9.99', 'USD'))) == 5
+    assert len(encode(TaxedMoney(Money('10', 'USD'), Money('12.30', 'USD')))) == 7
+    assert len(encode(Money(1, 'XBT'))) == 8
+
+
+def test_batch():
+    data = encode_many(VALUES)
+    assert isinstance(data, bytes)
+    assert decode_many(data) == VALUES
+    assert decode_many(memoryview(data)) == VALUES
+    assert decode_many(bytearray(data)) == VALUES
+    assert decode_many(encode_many([])) == []
+
+
+def test_subclasses_decode_as_money():
+    decoded = decode(encode(IntegerMoney(999, 'USD')))
+    assert type(decoded) is Money
+    assert decoded == Money('9.99', 'USD')
+
+
+def test_invalid_values():
+    with pytest.raises(TypeError):
+        encode(Decimal(1))
+    with pytest.raises(ValueError):
+        encode(Money('NaN', 'USD'))
+
+
+def test_invalid_data():
+    data = encode(TaxedMoney(Money(1, 'USD'), Money(1, 'USD')))
+    with pytest.raises(ValueError):
+        decode(data[:-1])
+    with pytest.raises(ValueError):
+        decode(data + b'\x00')
+    with pytest.raises(ValueError):
+        decode(b'\x09\x01')
+    with pytest.raises(ValueError):
+        decode(b'\x01\xff\x00\x00')
+    with pytest.raises(ValueError):
+        decode_many(encode_many(VALUES)[:-1])
@@ -0,0 +1,98 @@
+from decimal import ROUND_HALF_UP, Decimal
+from threading import Thread
+
+import pytest
+
+from prices import (
+    IntegerMoney, Money, MoneyRange, PriceCache, TaxedMoney, flat_tax,
+    fractional_discount, percentage_discount)
+
+
+def test_flat_tax_is_cached():
+    cache = PriceCache()
+    price = Money('9.99', 'EUR')
+    result = cache.flat_tax(price, Decimal('0.23'))
+    assert result == flat_tax(price, Decimal('0.23'))
+    assert cache.flat_tax(Money('9.99', 'EUR'), Decimal('0.23')) is result
+    assert cache.cache_info() == (1, 1, 0, 1024, 1)
+
+
+def test_keys_include_rate_and_flags():
+    cache = PriceCache()
+    price = Money(100, 'USD')
+    cache.flat_tax(price, Decimal('0.23'))
+    cache.flat_tax(price, Decimal('0.08'))
+    assert cache.flat_tax(price, Decimal('0.23'), keep_gross=True) == (
+        flat_tax(price, Decimal('0.23'), keep_gross=True))
+    assert cache.cache_info().misses == 3
+
+
+def test_keys_distinguish_exponent():
+    cache = PriceCache()
+    assert str(cache.flat_tax(Money('10', 'USD'), 1).net.amount) == '10'
+    assert str(cache.flat_tax(Money('10.0', 'USD'), 1).net.amount) == '10.0'
+    assert cache.cache_info().hits == 0
+
+
+def test_discounts():
+    cache = PriceCache()
+    price = TaxedMoney(Money(100, 'USD'), Money(123, 'USD'))
+    assert cache.fractional_discount(
+        price, Decimal('0.1'), from_gross=False, rounding=ROUND_HALF_UP) == (
+            fractional_discount(
+                price, Decimal('0.1'), from_gross=False,
+                rounding=ROUND_HALF_UP))
+    assert cache.percentage_discount(price, 10) == percentage_discount(
+        price, 10)
+    price_range = MoneyRange(Money(10, 'USD'), Money(20, 'USD'))
+    assert cache.percentage_discount(price_range, 50) == MoneyRange(
+        Money(5, 'USD'), Money(10, 'USD'))
+    assert cache.cache_info().currsize == 3
+
+
+def test_unsupported_types_are_not_cached():
+    cache = PriceCache()
+    price = IntegerMoney(999, 'USD')
+    assert cache.flat_tax(price, 1) == flat_tax(price, 1)
+    assert cache.cache_info() == (0, 0, 0, 1024, 0)
+
+
+def test_eviction():
+    cache = PriceCache(maxsize=2)
+    first = cache.flat_tax(Money(1, 'USD'), 1)
+    cache.flat_tax(Money(2, 'USD'), 1)
+    cache.flat_tax(Money(1, 'USD'), 1)
+    cache.flat_tax(Money(3, 'USD'), 1)
+    assert cache.cache_info() == (1, 3, 1, 2, 2)
+    assert cache.flat_tax(Money(1, 'USD'), 1) is first
+    cache.flat_tax(Money(2, 'USD'), 1)
+    assert cache.cache_info() == (2, 4, 2, 2, 2)
+
+
+def test_clear():
+    cache = PriceCache()
+    cache.flat_tax(Money(1, 'USD'), 1)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 1024, 0)
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        PriceCache(maxsize=0)
+
+
+def test_threads():
+    cache = PriceCache(maxsize=8)
+
+    def work():
+        for i in range(200):
+            cache.flat_tax(Money(i % 16, 'USD'), Decimal('0.23'))
+
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.cache_info()
+    assert info.hits + info.misses == 800
+    assert info.currsize == 8
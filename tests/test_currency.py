@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+import pytest
+
+from prices import (
+    Money, currency_cache_info, get_currency_exponent, get_currency_precision,
+    register_currency, unregister_currency, warm_currency_cache)
+from prices.currency import CurrencyRegistry
+
+
+def test_exponent():
+    assert get_currency_exponent('USD') == Decimal('0.01')
+    assert get_currency_exponent('JPY') == Decimal('1')
+    assert get_currency_exponent('BHD') == Decimal('0.001')
+    assert get_currency_precision('USD') == 2
+    assert get_currency_precision('JPY') == 0
+
+
+def test_unknown_currency_defaults_to_two_places():
+    assert get_currency_precision('XYZ') == 2
+
+
+def test_register_currency():
+    register_currency('XBT', 8)
+    try:
+        assert get_currency_precision('XBT') == 8
+        assert str(Money('0.123456789', 'XBT').quantize().amount) == (
+            '0.12345679')
+    finally:
+        unregister_currency('XBT')
+    assert get_currency_precision('XBT') == 2
+
+
+def test_register_overrides_babel():
+    register_currency('JPY', 2)
+    try:
+        assert str(Money(1, 'JPY').quantize().amount) == '1.00'
+    finally:
+        unregister_currency('JPY')
+    assert str(Money(1, 'JPY').quantize().amount) == '1'
+
+
+def test_register_negative_precision():
+    with pytest.raises(ValueError):
+        register_currency('XBT', -1)
+
+
+def test_counters():
+    registry = CurrencyRegistry()
+    registry.get_exponent('EUR')
+    registry.get_exponent('EUR')
+    registry.get_precision('EUR')
+    info = registry.cache_info()
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_warm():
+    registry = CurrencyRegistry()
+    registry.warm(['EUR', 'USD'])
+    assert registry.cache_info() == (0, 0, 2)
+    registry.get_exponent('USD')
+    assert registry.cache_info() == (1, 0, 2)
+
+
+def test_warm_all_currencies():
+    warm_currency_cache()
+    assert currency_cache_info().currsize > 100
+
+
+def test_clear_keeps_registered_currencies():
+    registry = CurrencyRegistry()
+    registry.register('XBT', 8)
+    registry.get_exponent('EUR')
+    registry.clear()
+    assert registry.cache_info() == (0, 0, 1)
+    assert registry.get_precision('XBT') == 8
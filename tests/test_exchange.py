@@ -0,0 +1,75 @@
+from decimal import ROUND_DOWN, Decimal
+
+import pytest
+
+from prices import (
+    CurrencyConverter, Money, MoneyRange, RateTable, TaxedMoney,
+    TaxedMoneyRange)
+
+TABLE = RateTable('EUR', {'USD': '1.25', 'PLN': '4.00', 'JPY': 160})
+
+
+def test_cross_rates():
+    assert TABLE.get_rate('EUR', 'USD') == Decimal('1.25')
+    assert TABLE.get_rate('USD', 'EUR') == Decimal('0.8')
+    assert TABLE.get_rate('USD', 'PLN') == Decimal('3.2')
+    assert TABLE.get_rate('PLN', 'PLN') == 1
+    assert TABLE.rates['EUR'] == 1
+    with pytest.raises(ValueError):
+        TABLE.get_rate('USD', 'GBP')
+
+
+@pytest.mark.parametrize('rates', [
+    {'USD': 0}, {'USD': '-1'}, {'USD': 'NaN'}, {'EUR': 2}])
+def test_invalid_rates(rates):
+    with pytest.raises(ValueError):
+        RateTable('EUR', rates)
+
+
+def test_convert_money():
+    converter = CurrencyConverter(TABLE)
+    assert converter.convert(Money(10, 'USD'), 'PLN') == Money(32, 'PLN')
+    result = converter.convert(Money('0.99', 'USD'), 'JPY')
+    assert str(result.amount) == '127'
+    result = converter.convert(Money('1.11', 'USD'), 'EUR')
+    assert str(result.amount) == '0.89'
+    result = converter.convert(
+        Money('1.11', 'USD'), 'EUR', rounding=ROUND_DOWN)
+    assert str(result.amount) == '0.88'
+
+
+def test_convert_other_types():
+    converter = CurrencyConverter(TABLE)
+    price = TaxedMoney(Money(10, 'EUR'), Money('12.30', 'EUR'))
+    assert converter.convert(price, 'USD') == TaxedMoney(
+        Money('12.50', 'USD'), Money('15.38', 'USD'))
+    assert converter.convert(
+        MoneyRange(Money(1, 'EUR'), Money(2, 'EUR')), 'PLN') == MoneyRange(
+            Money(4, 'PLN'), Money(8, 'PLN'))
+    price_range = converter.convert(TaxedMoneyRange(price, price), 'USD')
+    assert type(price_range) is TaxedMoneyRange
+    assert price_range.start == TaxedMoney(
+        Money('12.50', 'USD'), Money('15.38', 'USD'))
+    with pytest.raises(TypeError):
+        converter.convert(Decimal(1), 'USD')
+
+
+def test_convert_many():
+    converter = CurrencyConverter(TABLE)
+    values = [
+        Money(1, 'EUR'), Money(1, 'USD'),
+        TaxedMoney(Money(1, 'PLN'), Money(2, 'PLN'))]
+    assert converter.convert_many(values, 'EUR') == [
+        Money(1, 'EUR'), Money('0.8', 'EUR'),
+        TaxedMoney(Money('0.25', 'EUR'), Money('0.5', 'EUR'))]
+    assert converter.convert_many(values, 'EUR') == [
+        converter.convert(value, 'EUR') for value in values]
+
+
+def test_load_replaces_rates():
+    converter = CurrencyConverter(TABLE)
+    converter.load(RateTable('EUR', {'USD': 2}))
+    assert converter.get_rate('EUR', 'USD') == 2
+    assert converter.convert(Money(1, 'EUR'), 'USD') == Money(2, 'USD')
+    with pytest.raises(ValueError):
+        converter.convert(Money(1, 'PLN'), 'USD')
@@ -31,8 +31,35 @@ def test_zero_clipping():
     assert result.gross == Money(0, 'USD')
 
 
+class Voucher:
+    def __init__(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def voucher_handler():
+    fixed_discount.register(
+        Voucher, lambda base, discount: Voucher(base.value - discount))
+    yield
+    fixed_discount.unregister(Voucher)
+
+
+@pytest.mark.usefixtures('voucher_handler')
+def test_register():
+    result = fixed_discount(Voucher(Money(30, 'USD')), Money(10, 'USD'))
+    assert result.value == Money(20, 'USD')
+
+
 def test_currency_mismatch():
     with pytest.raises(ValueError):
         fixed_discount(
             TaxedMoney(Money(10, 'BTC'), Money(10, 'BTC')),
             Money(10, 'USD'))
+
+
+@pytest.mark.usefixtures('voucher_handler')
+def test_unregister():
+    fixed_discount.unregister(Voucher)
+    with pytest.raises(TypeError):
+        fixed_discount(Voucher(Money(30, 'USD')), Money(10, 'USD'))
+    fixed_discount.register(Voucher, lambda base, discount: base)
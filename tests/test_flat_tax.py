@@ -1,8 +1,16 @@
+import random
 from decimal import Decimal
 
 import pytest
 
-from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange, flat_tax
+from prices import (
+    IntegerMoney, Money, MoneyArray, MoneyRange, TaxedMoney, TaxedMoneyRange,
+    TaxRate, flat_tax, flat_tax_many)
+
+
+class Bundle:
+    def __init__(self, *items):
+        self.items = items
 
 
 def test_application():
@@ -38,3 +46,168 @@ def test_range():
     result = flat_tax(price_range, 1)
     assert result.start == TaxedMoney(Money(10, 'BTC'), Money(20, 'BTC'))
     assert result.stop == TaxedMoney(Money(20, 'BTC'), Money(40, 'BTC'))
+
+
+def test_money_subclasses():
+    result = flat_tax(IntegerMoney(1000, 'USD'), Decimal('0.23'))
+    assert result == TaxedMoney(Money(10, 'USD'), Money('12.30', 'USD'))
+
+
+@pytest.fixture
+def bundle_handler():
+    @flat_tax.register(Bundle)
+    def flat_tax_bundle(base, tax_rate, keep_gross):
+        return Bundle(*[
+            flat_tax(item, tax_rate, keep_gross=keep_gross)
+            for item in base.items])
+
+    yield
+    flat_tax.unregister(Bundle)
+
+
+@pytest.mark.usefixtures('bundle_handler')
+def test_register():
+    result = flat_tax(
+        Bundle(Money(10, 'USD'), Money(20, 'USD')), 1, keep_gross=True)
+    assert result.items == (
+        TaxedMoney(Money(5, 'USD'), Money(10, 'USD')),
+        TaxedMoney(Money(10, 'USD'), Money(20, 'USD')))
+
+
+def test_many_matches_flat_tax():
+    rng = random.Random(0)
+    values = [
+        Money(Decimal(rng.randint(1, 10 ** 6)).scaleb(-2), 'EUR')
+        for _ in range(500)]
+    for keep_gross in [False, True]:
+        expected = [
+            flat_tax(value, Decimal('0.23'), keep_gross=keep_gross)
+            for value in values]
+        net, gross = flat_tax_many(
+            values, Decimal('0.23'), keep_gross=keep_gross)
+        assert [TaxedMoney(n, g) for n, g in zip(net, gross)] == expected
+        net, gross = flat_tax_many(
+            MoneyArray.from_money(values), Decimal('0.23'),
+            keep_gross=keep_gross)
+        assert net.to_money() == [price.net for price in expected]
+        assert gross.to_money() == [price.gross for price in expected]
+
+
+def test_many_with_rate_per_value():
+    rates = [Decimal('0.23'), Decimal('0.08'), 0]
+    values = [Money('10.00', 'PLN'), Money('10.00', 'PLN'), Money('10.00', 'PLN')]
+    expected = [flat_tax(value, rate) for value, rate in zip(values, rates)]
+    net, gross = flat_tax_many(values, rates)
+    assert net == values
+    assert gross == [price.gross for price in expected]
+    net, gross = flat_tax_many(MoneyArray.from_money(values), rates)
+    assert gross.to_money() == [price.gross for price in expected]
+    expected = [
+        flat_tax(value, rate, keep_gross=True)
+        for value, rate in zip(values, rates)]
+    net, gross = flat_tax_many(values, rates, keep_gross=True)
+    assert net == [price.net for price in expected]
+    net, gross = flat_tax_many(MoneyArray.from_money(values), rates, keep_gross=True)
+    assert net.to_money() == [price.net for price in expected]
+    with pytest.raises(ValueError):
+        flat_tax_many(values, rates[:2])
+
+
+def test_many_with_amounts():
+    net, gross = flat_tax_many(
+        [Decimal('10.00'), 5], Decimal('0.5'), currency='USD')
+    assert net == [Money(10, 'USD'), Money(5, 'USD')]
+    assert gross == [Money(15, 'USD'), Money('7.50', 'USD')]
+    with pytest.raises(TypeError):
+        flat_tax_many([Decimal('10.00')], Decimal('0.5'))
+    with pytest.raises(TypeError):
+        flat_tax_many([TaxedMoney(Money(1, 'USD'), Money(1, 'USD'))], 1)
+
+
+def test_tax_rate_matches_decimal_rate():
+    rng = random.Random(0)
+    values = [
+        Money(Decimal(rng.randint(1, 10 ** 6)).scaleb(-3), 'EUR')
+        for _ in range(500)]
+    values.append(Money('1.125', 'EUR'))
+    for rate in [Decimal('0.23'), Decimal('0.25'), Decimal('0.2')]:
+        tax_rate = TaxRate(rate)
+        for keep_gross in [False, True]:
+            for value in values:
+                expected = flat_tax(value, rate, keep_gross=keep_gross)
+                assert tax_rate.apply(value, keep_gross=keep_gross) == expected
+                taxed = TaxedMoney(value, value)
+                assert flat_tax(taxed, tax_rate, keep_gross=keep_gross) == (
+                    flat_tax(taxed, rate, keep_gross=keep_gross))
+
+
+def test_tax_rate():
+    vat = TaxRate('0.25')
+    assert vat.multiplier == Decimal('1.25')
+    assert vat.reciprocal == Decimal('0.8')
+    assert TaxRate('0.2').reciprocal is None
+    assert vat == TaxRate(Decimal('0.250'))
+    assert hash(vat) == hash(TaxRate(Decimal('0.250')))
+    assert repr(vat) == "TaxRate('0.25')"
+    price_range = MoneyRange(Money(10, 'USD'), Money(20, 'USD'))
+    assert vat.apply(price_range) == flat_tax(price_range, Decimal('0.25'))
+    with pytest.raises(ValueError):
+        TaxRate(-1)
+
+
+def test_tax_rate_subclasses():
+    class Vat(TaxRate):
+        __slots__ = ()
+
+    result = flat_tax(Money(10, 'USD'), Vat('0.25'))
+    assert result == TaxedMoney(Money(10, 'USD'), Money('12.50', 'USD'))
+    result = flat_tax(Money(10, 'USD'), Vat('0.25'), keep_gross=True)
+    assert result == TaxedMoney(Money(8, 'USD'), Money(10, 'USD'))
+
+
+def test_tax_rate_composition():
+    national = TaxRate('0.05')
+    regional = TaxRate('0.09975')
+    assert national + regional == TaxRate('0.14975')
+    assert national.compound(regional) == TaxRate('0.1547375')
+    price = Money(100, 'CAD')
+    assert flat_tax(price, national + regional).gross == Money('114.98', 'CAD')
+    assert flat_tax(price, national.compound(regional)).gross == (
+        Money('115.47', 'CAD'))
+    with pytest.raises(TypeError):
+        national + Decimal('0.1')  # pylint: disable=pointless-statement
+    with pytest.raises(TypeError):
+        national.compound(Decimal('0.1'))
+
+
+def test_many_with_tax_rate():
+    values = [Money('10.00', 'PLN'), Money('9.99', 'PLN')]
+    for keep_gross in [False, True]:
+        expected = flat_tax_many(
+            values, Decimal('0.23'), keep_gross=keep_gross)
+        assert flat_tax_many(
+            values, TaxRate('0.23'), keep_gross=keep_gross) == expected
+        net, gross = flat_tax_many(
+            MoneyArray.from_money(values), [TaxRate('0.23')] * 2,
+            keep_gross=keep_gross)
+        assert (net.to_money(), gross.to_money()) == expected
+
+
+@pytest.mark.parametrize('backend', ['array', 'numpy'])
+def test_many_with_distinct_rates_per_value(backend):
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+    rates = [Decimal(rate) for rate in (
+        '0.20 0.21 0.19 0.25 0.22 0.24 0.23 0.27 0.17 0.05 0.07 0.10 0.09'
+        ' 0.13').split()]
+    rates += [Decimal(index).scaleb(-3) for index in range(1, 30)]
+    values = [Money('9.99', 'EUR')] * len(rates)
+    expected = [
+        flat_tax(value, rate, keep_gross=True).net
+        for value, rate in zip(values, rates)]
+    assert flat_tax_many(values, rates, keep_gross=True)[0] == expected
+    net, gross = flat_tax_many(
+        MoneyArray.from_money(values, backend=backend), rates,
+        keep_gross=True)
+    assert net.to_money() == expected
+    assert gross.to_money() == values
@@ -42,3 +42,22 @@ def test_precision_when_half_up_rounding():
     price = TaxedMoney(Money('1.01', 'BTC'), Money('1.01', 'BTC'))
     result = fractional_discount(price, Decimal('0.5'), rounding=ROUND_HALF_UP)
     assert result.net == Money('0.50', 'BTC')
+
+
+def test_range_rounding():
+    price = TaxedMoney(Money('1.01', 'BTC'), Money('1.01', 'BTC'))
+    result = fractional_discount(
+        TaxedMoneyRange(price, price), Decimal('0.5'), rounding=ROUND_HALF_UP)
+    assert result.start.net == Money('0.50', 'BTC')
+    assert result.stop.net == Money('0.50', 'BTC')
+
+
+def test_subclasses_resolve_to_base_handlers():
+    class PromoPrice(TaxedMoney):
+        __slots__ = ()
+
+    price = PromoPrice(Money(100, 'USD'), Money(123, 'USD'))
+    assert fractional_discount(price, Decimal('0.1')) == TaxedMoney(
+        Money('87.70', 'USD'), Money('110.70', 'USD'))
+    with pytest.raises(TypeError):
+        fractional_discount(Decimal(1), Decimal('0.1'))
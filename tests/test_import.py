@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+import prices
+
+
+def run(code):
+    return subprocess.check_output([sys.executable, '-c', code]).decode()
+
+
+def test_import_is_lazy():
+    output = run(
+        'import sys, prices; '
+        'print("babel" in sys.modules, "prices.money" in sys.modules)')
+    assert output.split() == ['False', 'False']
+
+
+def test_babel_is_imported_on_first_lookup():
+    output = run(
+        'import sys; from prices import Money; '
+        'print("babel" in sys.modules); '
+        'Money(1, "USD").quantize(); '
+        'print("babel" in sys.modules)')
+    assert output.split() == ['False', 'True']
+
+
+def test_public_names():
+    for name in prices.__all__:
+        assert getattr(prices, name) is not None
+        assert name in dir(prices)
+    with pytest.raises(AttributeError):
+        prices.Unknown  # pylint: disable=pointless-statement
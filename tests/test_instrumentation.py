@@ -0,0 +1,124 @@
+import subprocess
+import sys
+from decimal import Decimal
+from threading import Thread
+
+import prices
+from prices import (
+    IntegerMoney, Money, MoneyRange, TaxedMoney, flat_tax, percentage_discount)
+from prices.currency import CurrencyRegistry, registry
+from prices.instrumentation import capture, is_enabled
+
+
+def test_disabled_by_default():
+    original = Money.__add__
+    assert not is_enabled()
+    with capture():
+        assert is_enabled()
+        assert Money.__add__ is not original
+    assert not is_enabled()
+    assert Money.__add__ is original
+    assert 'wrapper' not in repr(prices.tax.flat_tax)
+
+
+def test_counts():
+    with capture() as stats:
+        total = Money(1, 'USD') + Money(2, 'USD')
+        (total * 2).quantize()
+        TaxedMoney(total, total)
+    assert stats.constructions['Money'] == 5
+    assert stats.constructions['TaxedMoney'] == 1
+    assert stats.operations['Money.__add__'] == 1
+    assert stats.operations['Money.__mul__'] == 1
+    assert stats.quantizations['Money'] == 1
+    assert stats.lookups['get_exponent'] == 1
+
+
+def test_delegating_subclass_counts_once():
+    value = IntegerMoney(1000, 'USD')
+    with capture() as stats:
+        value / 4
+        value * Decimal('0.5')
+        value * 2
+        IntegerMoney(5, 'USD', 2)
+    assert stats.operations['IntegerMoney.__truediv__'] == 1
+    assert stats.operations['IntegerMoney.__mul__'] == 2
+    assert 'Money.__truediv__' not in stats.operations
+    assert 'Money.__mul__' not in stats.operations
+    assert stats.constructions['IntegerMoney'] == 4
+    assert stats.constructions['Money'] == 1
+
+
+def test_babel_lookups():
+    with capture() as stats:
+        CurrencyRegistry().get_precision('EUR')
+    assert stats.lookups['get_precision'] == 1
+    assert stats.lookups['babel'] == 1
+
+
+def test_timings():
+    with capture() as stats:
+        prices.flat_tax(Money(10, 'USD'), Decimal('0.23'))
+        prices.tax.flat_tax(
+            MoneyRange(Money(1, 'USD'), Money(2, 'USD')), Decimal('0.23'))
+        prices.discount.percentage_discount(Money(10, 'USD'), 10)
+    assert stats.calls['flat_tax'] == 2
+    assert stats.calls['percentage_discount'] == 1
+    assert stats.calls['fractional_discount'] == 1
+    assert stats.seconds['flat_tax'] > 0
+    assert stats.seconds['fractional_discount'] <= (
+        stats.seconds['percentage_discount'])
+
+
+def test_references_imported_before_are_timed():
+    with capture() as stats:
+        flat_tax(Money(10, 'USD'), Decimal('0.23'))
+        percentage_discount(Money(10, 'USD'), 10)
+    assert stats.calls['flat_tax'] == 1
+    assert stats.calls['percentage_discount'] == 1
+    assert stats.calls['fractional_discount'] == 1
+
+
+def test_submodules_imported_during_capture():
+    code = (
+        'import prices, prices.tax\n'
+        'from prices.instrumentation import capture\n'
+        'with capture():\n'
+        '    prices.PricingPipeline, prices.flat_tax\n'
+        'print(prices.pipeline.flat_tax is prices.tax.flat_tax,'
+        ' prices.flat_tax is prices.tax.flat_tax,'
+        ' "wrapper" in repr(prices.tax.flat_tax))')
+    output = subprocess.check_output([sys.executable, '-c', code]).decode()
+    assert output.split() == ['True', 'True', 'False']
+
+
+def test_nested_captures():
+    with capture() as outer:
+        Money(1, 'USD')
+        with capture() as inner:
+            Money(1, 'USD')
+        assert is_enabled()
+    assert outer.constructions['Money'] == 2
+    assert inner.constructions['Money'] == 1
+
+
+def test_contexts_are_separate():
+    results = {}
+
+    def work(name, count):
+        with capture() as stats:
+            for _ in range(count):
+                Money(1, 'USD')
+            results[name] = stats
+
+    threads = [
+        Thread(target=work, args=(index, index * 100))
+        for index in range(1, 4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for index in range(1, 4):
+        assert results[index].constructions['Money'] == index * 100
+    assert not is_enabled()
+    assert registry.get_exponent('USD') == Decimal('0.01')
@@ -0,0 +1,187 @@
+import pickle
+import random
+from decimal import (
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP, Decimal)
+
+import pytest
+
+from prices import (
+    IntegerMoney, Money, TaxedMoney, fixed_discount, flat_tax,
+    fractional_discount, percentage_discount)
+
+ROUNDING_MODES = [
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP]
+
+
+def test_construction():
+    money = IntegerMoney(1050, 'USD')
+    assert money.units == 1050
+    assert money.precision == 2
+    assert str(money.amount) == '10.50'
+    assert IntegerMoney(5, 'JPY').amount == 5
+    with pytest.raises(TypeError):
+        IntegerMoney(Decimal('10.5'), 'USD')
+
+
+def test_conversion_is_lossless():
+    for amount in ['10.50', '10', '-0.01', '0.125', '1E+3', '123456789.987654321']:
+        money = Money(amount, 'USD')
+        integer_money = IntegerMoney.from_money(money)
+        assert integer_money == money
+        assert integer_money.to_money() == money
+    assert IntegerMoney.from_money(Money('0.125', 'USD')).precision == 3
+    assert str(IntegerMoney.from_money(Money(1, 'USD')).amount) == '1.00'
+    with pytest.raises(ValueError):
+        IntegerMoney.from_money(Money('NaN', 'USD'))
+
+
+def test_addition():
+    money = IntegerMoney(1000, 'USD') + IntegerMoney(5, 'USD', 3)
+    assert isinstance(money, IntegerMoney)
+    assert money == Money('10.005', 'USD')
+    assert money.precision == 3
+    assert IntegerMoney(1000, 'USD') + Money(1, 'USD') == Money(11, 'USD')
+    with pytest.raises(ValueError):
+        IntegerMoney(10, 'USD') + IntegerMoney(10, 'EUR')
+    with pytest.raises(TypeError):
+        IntegerMoney(10, 'USD') + 1
+
+
+def test_subtraction():
+    money = IntegerMoney(1000, 'USD') - IntegerMoney(1500, 'USD')
+    assert isinstance(money, IntegerMoney)
+    assert money == Money(-5, 'USD')
+    with pytest.raises(ValueError):
+        IntegerMoney(10, 'USD') - IntegerMoney(10, 'EUR')
+
+
+def test_multiplication():
+    money = IntegerMoney(1050, 'USD') * 3
+    assert isinstance(money, IntegerMoney)
+    assert money == Money('31.50', 'USD')
+    money = 3 * IntegerMoney(1050, 'USD')
+    assert money == Money('31.50', 'USD')
+    money = IntegerMoney(1050, 'USD') * Decimal('0.23')
+    assert isinstance(money, IntegerMoney)
+    assert money.amount == Decimal('10.50') * Decimal('0.23')
+    with pytest.raises(TypeError):
+        IntegerMoney(1050, 'USD') * None
+
+
+def test_division():
+    money = IntegerMoney(1000, 'USD') / 3
+    assert isinstance(money, IntegerMoney)
+    assert money == Money(10, 'USD') / 3
+    assert IntegerMoney(1000, 'USD') / IntegerMoney(500, 'USD') == 2
+    with pytest.raises(ValueError):
+        IntegerMoney(1000, 'USD') / IntegerMoney(500, 'EUR')
+
+
+def test_comparison():
+    assert IntegerMoney(100, 'USD') == IntegerMoney(1000, 'USD', 3)
+    assert IntegerMoney(100, 'USD') == Money(1, 'USD')
+    assert Money(1, 'USD') == IntegerMoney(100, 'USD')
+    assert IntegerMoney(100, 'USD') != IntegerMoney(100, 'EUR')
+    assert IntegerMoney(100, 'USD') < IntegerMoney(101, 'USD')
+    assert IntegerMoney(100, 'USD') <= IntegerMoney(1000, 'USD', 3)
+    assert IntegerMoney(101, 'USD') > Money(1, 'USD')
+    assert Money(1, 'USD') < IntegerMoney(101, 'USD')
+    assert IntegerMoney(100, 'USD') >= Money(1, 'USD')
+    assert not IntegerMoney(100, 'USD') < Money(1, 'USD')
+    with pytest.raises(ValueError):
+        IntegerMoney(100, 'USD') < IntegerMoney(100, 'EUR')
+    with pytest.raises(ValueError):
+        IntegerMoney(100, 'USD') <= IntegerMoney(100, 'EUR')
+
+
+def test_truthiness():
+    assert not IntegerMoney(0, 'USD')
+    assert IntegerMoney(1, 'USD')
+
+
+def test_quantize_matches_money():
+    rng = random.Random(0)
+    for _ in range(500):
+        money = Money(Decimal(rng.randint(-10 ** 6, 10 ** 6)).scaleb(-4), 'USD')
+        integer_money = IntegerMoney.from_money(money)
+        for rounding in ROUNDING_MODES:
+            expected = money.quantize(rounding=rounding)
+            result = integer_money.quantize(rounding=rounding)
+            assert result == expected
+            assert result.amount.as_tuple()[2] == expected.amount.as_tuple()[2]
+            expected = money.quantize('0.1', rounding=rounding)
+            result = integer_money.quantize('0.1', rounding=rounding)
+            assert result == expected
+            assert result.amount.as_tuple()[2] == expected.amount.as_tuple()[2]
+
+
+def test_quantize_increases_precision():
+    money = IntegerMoney(5, 'JPY').quantize('0.01')
+    assert money.units == 500
+    assert str(money.amount) == '5.00'
+    with pytest.raises(ValueError):
+        IntegerMoney(5, 'JPY').quantize('NaN')
+
+
+def test_repr():
+    assert repr(IntegerMoney(1050, 'USD')) == "IntegerMoney(1050, 'USD', 2)"
+
+
+def test_taxed_money():
+    price = TaxedMoney(IntegerMoney(1000, 'USD'), IntegerMoney(1230, 'USD'))
+    total = price + price
+    assert isinstance(total.net, IntegerMoney)
+    assert total == TaxedMoney(Money(20, 'USD'), Money('24.60', 'USD'))
+    assert isinstance(total.tax, IntegerMoney)
+
+
+def test_flat_tax():
+    for keep_gross in [False, True]:
+        expected = flat_tax(Money('10.99', 'USD'), Decimal('0.23'), keep_gross=keep_gross)
+        result = flat_tax(IntegerMoney(1099, 'USD'), Decimal('0.23'), keep_gross=keep_gross)
+        assert isinstance(result.net, IntegerMoney)
+        assert isinstance(result.gross, IntegerMoney)
+        assert result == expected
+
+
+def test_discounts():
+    base = IntegerMoney(1099, 'USD')
+    result = fixed_discount(base, IntegerMoney(100, 'USD'))
+    assert isinstance(result, IntegerMoney)
+    assert result == Money('9.99', 'USD')
+    assert fixed_discount(base, IntegerMoney(2000, 'USD')) == Money(0, 'USD')
+    result = fractional_discount(base, Decimal('0.25'))
+    assert isinstance(result, IntegerMoney)
+    assert result == fractional_discount(Money('10.99', 'USD'), Decimal('0.25'))
+    result = percentage_discount(base, 10)
+    assert result == percentage_discount(Money('10.99', 'USD'), 10)
+
+
+def test_immutability():
+    money = IntegerMoney(100, 'USD')
+    with pytest.raises(AttributeError):
+        money.units = 200
+
+
+def test_hash():
+    assert hash(IntegerMoney(100, 'USD')) == hash(Money(1, 'USD'))
+    assert hash(IntegerMoney(100, 'USD')) == hash(IntegerMoney(1000, 'USD', 3))
+    assert len({IntegerMoney(100, 'USD'), Money('1.0', 'USD')}) == 1
+
+
+def test_pickle():
+    money = IntegerMoney(1050, 'USD', 3)
+    result = pickle.loads(pickle.dumps(money))
+    assert isinstance(result, IntegerMoney)
+    assert (result.units, result.precision) == (1050, 3)
+
+
+class Cents(IntegerMoney):
+    __slots__ = ()
+
+
+def test_pickle_subclass():
+    money = Cents(1050, 'USD')
+    assert type(pickle.loads(pickle.dumps(money))) is Cents
@@ -0,0 +1,97 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
+from prices import json as prices_json
+
+VALUES = [
+    Money('9.99', 'USD'),
+    Money('-0.00', 'EUR'),
+    TaxedMoney(Money('10', 'GBP'), Money('12.30', 'GBP')),
+    MoneyRange(Money(1, 'PLN'), Money('2.5', 'PLN')),
+    TaxedMoneyRange(
+        TaxedMoney(Money(1, 'CHF'), Money('1.2', 'CHF')),
+        TaxedMoney(Money(2, 'CHF'), Money('2.4', 'CHF')))]
+
+
+@pytest.mark.parametrize('value', VALUES)
+def test_round_trip(value):
+    text = prices_json.dumps(value)
+    assert json.loads(text) == prices_json.to_dict(value)
+    decoded = prices_json.loads(text)
+    assert type(decoded) is type(value)
+    assert repr(decoded) == repr(value)
+    assert prices_json.from_dict(prices_json.to_dict(value)) == value
+
+
+def test_schema():
+    assert prices_json.to_dict(
+        TaxedMoney(Money('10', 'USD'), Money('12.30', 'USD'))) == {
+            'net': '10', 'gross': '12.30', 'currency': 'USD'}
+    assert json.dumps(
+        {'price': Money('1.50', 'USD')}, default=prices_json.to_dict) == (
+            '{"price": {"amount": "1.50", "currency": "USD"}}')
+
+
+def test_numeric_amounts_are_exact():
+    price = prices_json.loads('{"amount": 0.10, "currency": "USD"}')
+    assert price.amount == Decimal('0.10')
+
+
+def test_invalid_values():
+    with pytest.raises(TypeError):
+        prices_json.dumps(Decimal(1))
+    with pytest.raises(ValueError):
+        prices_json.loads('{"currency": "USD"}')
+    with pytest.raises(ValueError):
+        prices_json.loads('{"amount": true, "currency": "USD"}')
+    with pytest.raises(ValueError):
+        prices_json.loads('[1]')
+
+
+def test_iterencode():
+    chunks = list(prices_json.iterencode(VALUES, batch_size=2))
+    assert len(chunks) == 3
+    assert json.loads(''.join(chunks)) == [
+        prices_json.to_dict(value) for value in VALUES]
+    assert ''.join(prices_json.iterencode([])) == '[]'
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 1000])
+def test_iterdecode(chunk_size):
+    text = ' \n'.join(prices_json.iterencode(VALUES, batch_size=2))
+    chunks = [
+        text[index:index + chunk_size]
+        for index in range(0, len(text), chunk_size)]
+    assert list(prices_json.iterdecode(chunks)) == VALUES
+
+
+def test_iterdecode_is_lazy():
+    def chunks():
+        yield '[{"amount": "1", "currency": "USD"},'
+        raise AssertionError('Read too far')
+
+    assert next(prices_json.iterdecode(chunks())) == Money(1, 'USD')
+
+
+def test_dump_and_iterload():
+    fp = io.StringIO()
+    prices_json.dump(VALUES * 100, fp)
+    fp.seek(0)
+    assert list(prices_json.iterload(fp, chunk_size=64)) == VALUES * 100
+
+
+@pytest.mark.parametrize('text', [
+    '', '{}', '[', '[{"amount": "1", "currency": "USD"}',
+    '[{"amount": "1", "currency": "USD"} {}]',
+    '[{"amount": "1", "currency": "USD"},]', '[] []'])
+def test_iterdecode_invalid(text):
+    with pytest.raises(ValueError):
+        list(prices_json.iterdecode([text]))
+
+
+def test_iterdecode_empty():
+    assert list(prices_json.iterdecode([' [ ', ' ] '])) == []
@@ -1,4 +1,6 @@
-from decimal import ROUND_DOWN
+import copy
+import pickle
+from decimal import ROUND_DOWN, Decimal
 
 import pytest
 
@@ -76,3 +78,61 @@ def test_quantize():
 def test_repr():
     money = Money(10, 'USD')
     assert repr(money) == "Money('10', 'USD')"
+
+
+def test_from_rows():
+    rows = [(Decimal('10.50'), 'USD'), (3, 'EUR'), ('0.99', 'GBP')]
+    values = Money.from_rows(rows)
+    assert values == [
+        Money('10.50', 'USD'), Money(3, 'EUR'), Money('0.99', 'GBP')]
+    assert all(isinstance(value.amount, Decimal) for value in values)
+    assert Money.from_rows([]) == []
+
+
+def test_arithmetic_results_are_validated():
+    with pytest.raises(TypeError):
+        Money(10, 'USD') * Money(10, 'USD')
+
+
+def test_immutability():
+    money = Money(10, 'USD')
+    with pytest.raises(AttributeError):
+        money.amount = Decimal(20)
+    with pytest.raises(AttributeError):
+        money.currency = 'EUR'
+    with pytest.raises(AttributeError):
+        del money.amount
+    assert money == Money(10, 'USD')
+
+
+def test_hash():
+    assert hash(Money(Decimal('1.0'), 'USD')) == hash(Money(Decimal('1'), 'USD'))
+    assert len({Money('1.0', 'USD'), Money(1, 'USD'), Money(1, 'EUR')}) == 2
+    prices = {Money(1, 'USD'): 'one'}
+    assert prices[Money('1.00', 'USD')] == 'one'
+
+
+def test_pickle_and_copy():
+    money = Money('10.50', 'USD')
+    assert pickle.loads(pickle.dumps(money)) == money
+    assert copy.copy(money) == money
+    assert copy.deepcopy(money) == money
+
+
+def test_pickle_keeps_exponent():
+    money = pickle.loads(pickle.dumps(Money('-0.00', 'USD')))
+    assert type(money) is Money
+    assert str(money.amount) == '-0.00'
+
+
+class Amount(Money):
+    __slots__ = ()
+
+
+def test_pickle_and_copy_subclass():
+    money = Amount('10.50', 'USD')
+    for result in [
+            pickle.loads(pickle.dumps(money)), copy.copy(money),
+            copy.deepcopy(money)]:
+        assert type(result) is Amount
+        assert result == money
@@ -0,0 +1,215 @@
+import random
+from decimal import (
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP, Decimal)
+
+import pytest
+
+from prices import Money, MoneyArray
+
+ROUNDING_MODES = [
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP]
+
+
+@pytest.fixture(params=['array', 'numpy'])
+def backend(request):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    return request.param
+
+
+def test_construction(backend):
+    column = MoneyArray(['10.50', 3, Decimal('0.125')], 'USD', backend=backend)
+    assert len(column) == 3
+    assert column.scale == 1000
+    assert column.to_money() == [
+        Money('10.50', 'USD'), Money(3, 'USD'), Money('0.125', 'USD')]
+    assert [str(amount) for amount in column.amounts()] == [
+        '10.500', '3.000', '0.125']
+    assert column[0] == Money('10.5', 'USD')
+    assert list(column[1:]) == [Money(3, 'USD'), Money('0.125', 'USD')]
+
+
+def test_from_units(backend):
+    column = MoneyArray.from_units([1050, 99], 'USD', backend=backend)
+    assert column.to_money() == [Money('10.50', 'USD'), Money('0.99', 'USD')]
+    column = MoneyArray.from_units([5], 'JPY', backend=backend)
+    assert str(column[0].amount) == '5'
+
+
+def test_from_money(backend):
+    values = [Money('1.99', 'EUR'), Money(5, 'EUR')]
+    column = MoneyArray.from_money(values, backend=backend)
+    assert column.currency == 'EUR'
+    assert list(column) == values
+    with pytest.raises(ValueError):
+        MoneyArray.from_money([Money(1, 'EUR'), Money(1, 'USD')])
+    with pytest.raises(ValueError):
+        MoneyArray.from_money([])
+    assert len(MoneyArray.from_money([], 'EUR')) == 0
+
+
+def test_overflow(backend):
+    with pytest.raises(OverflowError):
+        MoneyArray([10 ** 17], 'USD', backend=backend)
+    column = MoneyArray([10 ** 15], 'USD', backend=backend)
+    with pytest.raises(OverflowError):
+        column * 10000  # pylint: disable=pointless-statement
+
+
+def test_addition(backend):
+    column = MoneyArray(['1.50', '2.25'], 'USD', backend=backend)
+    result = column + MoneyArray(['0.001', 1], 'USD', backend=backend)
+    assert result.to_money() == [Money('1.501', 'USD'), Money('3.25', 'USD')]
+    assert (column + Money('0.5', 'USD')).to_money() == [
+        Money(2, 'USD'), Money('2.75', 'USD')]
+    assert (Money('0.5', 'USD') + column).to_money() == [
+        Money(2, 'USD'), Money('2.75', 'USD')]
+    with pytest.raises(ValueError):
+        column + Money(1, 'EUR')  # pylint: disable=pointless-statement
+    with pytest.raises(ValueError):
+        column + MoneyArray([1], 'USD', backend=backend)  # pylint: disable=pointless-statement
+    with pytest.raises(TypeError):
+        column + 1  # pylint: disable=pointless-statement
+
+
+def test_subtraction(backend):
+    column = MoneyArray(['1.50', '2.25'], 'USD', backend=backend)
+    assert (column - column).to_money() == [Money(0, 'USD')] * 2
+    assert (column - Money(2, 'USD')).to_money() == [
+        Money('-0.5', 'USD'), Money('0.25', 'USD')]
+    assert (Money(2, 'USD') - column).to_money() == [
+        Money('0.5', 'USD'), Money('-0.25', 'USD')]
+    assert (-column)[0] == Money('-1.5', 'USD')
+
+
+def test_multiplication(backend):
+    column = MoneyArray(['1.50', '2.25'], 'USD', backend=backend)
+    assert (column * 2).to_money() == [Money(3, 'USD'), Money('4.5', 'USD')]
+    assert (2 * column).to_money() == [Money(3, 'USD'), Money('4.5', 'USD')]
+    result = column * Decimal('0.23')
+    assert result.to_money() == [
+        Money('1.50', 'USD') * Decimal('0.23'),
+        Money('2.25', 'USD') * Decimal('0.23')]
+    result = column * [Decimal('0.5'), 3]
+    assert result.to_money() == [Money('0.75', 'USD'), Money('6.75', 'USD')]
+    with pytest.raises(ValueError):
+        column * [1]  # pylint: disable=pointless-statement
+    with pytest.raises(TypeError):
+        column * 1.5  # pylint: disable=pointless-statement
+    with pytest.raises(TypeError):
+        column * column  # pylint: disable=pointless-statement
+
+
+def test_division(backend):
+    column = MoneyArray(['10.00', '2.46'], 'USD', backend=backend)
+    result = column / 4
+    assert result.to_money() == [Money('2.5', 'USD'), Money('0.615', 'USD')]
+    result = column / Decimal('1.23')
+    assert result[1] == Money(2, 'USD')
+    assert result.quantize().to_money() == [
+        (Money('10.00', 'USD') / Decimal('1.23')).quantize(),
+        Money('2.00', 'USD')]
+    result = column / [2, Decimal('-0.5')]
+    assert result.to_money() == [Money(5, 'USD'), Money('-4.92', 'USD')]
+    with pytest.raises(ZeroDivisionError):
+        column / 0  # pylint: disable=pointless-statement
+    with pytest.raises(ZeroDivisionError):
+        column / [1, 0]  # pylint: disable=pointless-statement
+
+
+def test_comparison(backend):
+    column = MoneyArray(['1.00', '2.00', '3.00'], 'USD', backend=backend)
+    assert list(column < Money(2, 'USD')) == [True, False, False]
+    assert list(column <= Money(2, 'USD')) == [True, True, False]
+    assert list(column > Money('1.5', 'USD')) == [False, True, True]
+    assert list(column >= Money(3, 'USD')) == [False, False, True]
+    assert list(column == Money(2, 'USD')) == [False, True, False]
+    assert list(column != Money(2, 'USD')) == [True, False, True]
+    other = MoneyArray(['3.00', '2.00', '1.00'], 'USD', backend=backend)
+    assert list(column < other) == [True, False, False]
+    with pytest.raises(ValueError):
+        column < Money(2, 'EUR')  # pylint: disable=pointless-statement
+
+
+def test_reductions(backend):
+    column = MoneyArray(['1.25', '-2.00', '3.50'], 'USD', backend=backend)
+    assert column.sum() == Money('2.75', 'USD')
+    assert column.min() == Money(-2, 'USD')
+    assert column.max() == Money('3.5', 'USD')
+    assert (column / 3).sum() == Money('2.75', 'USD') / 3
+    empty = MoneyArray([], 'USD', backend=backend)
+    assert empty.sum() == Money(0, 'USD')
+    with pytest.raises(ValueError):
+        empty.min()
+    with pytest.raises(ValueError):
+        empty.max()
+
+
+def test_quantize_matches_money(backend):
+    rng = random.Random(0)
+    amounts = [
+        Decimal(rng.randint(-10 ** 6, 10 ** 6)).scaleb(-4) for _ in range(500)]
+    column = MoneyArray(amounts, 'USD', backend=backend)
+    for rounding in ROUNDING_MODES:
+        expected = [Money(amount, 'USD').quantize(rounding=rounding)
+                    for amount in amounts]
+        result = column.quantize(rounding=rounding).to_money()
+        assert result == expected
+        assert [str(money.amount).lstrip('-') for money in result] == [
+            str(money.amount).lstrip('-') for money in expected]
+        expected = [Money(amount, 'USD').quantize('0.1', rounding=rounding)
+                    for amount in amounts]
+        assert column.quantize('0.1', rounding=rounding).to_money() == expected
+
+
+def test_quantize_after_division_matches_money(backend):
+    rng = random.Random(0)
+    amounts = [Decimal(rng.randint(1, 10 ** 6)).scaleb(-2) for _ in range(500)]
+    column = MoneyArray(amounts, 'EUR', backend=backend) / Decimal('1.23')
+    expected = [(Money(amount, 'EUR') / Decimal('1.23')).quantize()
+                for amount in amounts]
+    assert column.quantize().to_money() == expected
+
+
+def test_quantize_increases_precision(backend):
+    column = MoneyArray([5], 'JPY', backend=backend).quantize('0.01')
+    assert str(column[0].amount) == '5.00'
+    with pytest.raises(ValueError):
+        column.quantize('1E+1')
+    with pytest.raises(ValueError):
+        column.quantize('NaN')
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        MoneyArray([1], 'USD', backend='unknown')
+
+
+def test_repr():
+    column = MoneyArray(['1.5', 2], 'USD', backend='array')
+    assert repr(column) == "MoneyArray(['1.50', '2.00'], 'USD')"
+
+
+def test_division_by_many_factors(backend):
+    rates = [Decimal(rate) for rate in (
+        '1.23', '1.08', '1.05', '1.20', '1.19', '1.21', '1.25', '1.24',
+        '1.17', '1.22', '1.27', '1.18', '1.10', '1.07')]
+    amounts = [Decimal('%d.99' % (index * 37,)) for index in range(len(rates))]
+    column = MoneyArray(amounts, 'EUR', backend=backend) / rates
+    assert column[3] == Money(amounts[3], 'EUR') / rates[3]
+    assert column.quantize().to_money() == [
+        (Money(amount, 'EUR') / rate).quantize()
+        for amount, rate in zip(amounts, rates)]
+    assert (column * 2).quantize().to_money() == [
+        (Money(amount * 2, 'EUR') / rate).quantize()
+        for amount, rate in zip(amounts, rates)]
+    with pytest.raises(ValueError):
+        column.sum()
+    with pytest.raises(ValueError):
+        column + column  # pylint: disable=pointless-statement
+    column = MoneyArray(amounts[:2], 'EUR', backend=backend) / rates[:2]
+    assert column.scale == 100 * 123 * 108 // 3
+    assert column.sum() == (
+        Money(amounts[0], 'EUR') / rates[0] + Money(amounts[1], 'EUR') / rates[1])
@@ -0,0 +1,102 @@
+from decimal import Decimal
+
+import pytest
+
+from prices import Money, MoneyBag, RateTable, TaxedMoney, TaxedMoneyBag
+
+
+def taxed(net, gross, currency='EUR'):
+    return TaxedMoney(Money(net, currency), Money(gross, currency))
+
+
+def test_money_bag():
+    bag = MoneyBag([Money(10, 'EUR'), Money(5, 'USD'), Money(2, 'EUR')])
+    assert bag['EUR'] == Money(12, 'EUR')
+    assert bag['USD'] == Money(5, 'USD')
+    assert bag['GBP'] == Money(0, 'GBP')
+    assert bag.currencies == ('EUR', 'USD')
+    assert list(bag) == [Money(12, 'EUR'), Money(5, 'USD')]
+    assert len(bag) == 2
+    assert 'USD' in bag
+    assert 'GBP' not in bag
+    assert bag
+    assert not MoneyBag()
+    assert repr(MoneyBag([Money(1, 'EUR')])) == "MoneyBag([Money('1', 'EUR')])"
+
+
+def test_money_bag_add_and_update():
+    bag = MoneyBag()
+    bag.add(Money('1.50', 'EUR'), 3)
+    bag.update([Money(1, 'USD'), MoneyBag([Money(1, 'EUR')])])
+    bag += Money(1, 'USD')
+    bag -= Money('0.50', 'EUR')
+    assert bag == MoneyBag([Money(5, 'EUR'), Money(2, 'USD')])
+    with pytest.raises(TypeError):
+        bag.add(taxed(1, 1))
+    with pytest.raises(TypeError):
+        bag.update([1])
+
+
+def test_money_bag_operators():
+    bag = MoneyBag([Money(10, 'EUR')])
+    assert bag + Money(5, 'USD') == MoneyBag([Money(10, 'EUR'), Money(5, 'USD')])
+    assert Money(5, 'USD') + bag == bag + Money(5, 'USD')
+    assert bag - Money(10, 'EUR') == MoneyBag()
+    assert Money(1, 'EUR') - bag == MoneyBag([Money(-9, 'EUR')])
+    assert -bag == MoneyBag([Money(-10, 'EUR')])
+    other = MoneyBag([Money(2, 'EUR'), Money(3, 'GBP')])
+    assert bag + other == MoneyBag([Money(12, 'EUR'), Money(3, 'GBP')])
+    assert bag - other == MoneyBag([Money(8, 'EUR'), Money(-3, 'GBP')])
+    assert bag == MoneyBag([Money(10, 'EUR')])
+    assert bag + taxed(1, 2) == TaxedMoneyBag([taxed(11, 12)])
+    assert bag - taxed(1, 2) == TaxedMoneyBag([taxed(9, 8)])
+    assert taxed(1, 2) - bag == TaxedMoneyBag([taxed(-9, -8)])
+    assert bag != Money(10, 'EUR')
+    with pytest.raises(TypeError):
+        bag + 1  # pylint: disable=pointless-statement
+    with pytest.raises(TypeError):
+        hash(bag)
+
+
+def test_money_bag_conversion():
+    bag = MoneyBag([Money('10.00', 'EUR'), Money('1.00', 'USD'), Money(3, 'JPY')])
+    rates = {'USD': '0.9', 'JPY': Decimal('0.0061')}
+    assert bag.to_money('EUR', rates) == Money('10.92', 'EUR')
+    assert str(bag.to_money('EUR', rates).amount) == '10.92'
+    table = RateTable('EUR', {'USD': '1.25', 'JPY': '160'})
+    assert bag.to_money('USD', table) == Money('13.52', 'USD')
+    with pytest.raises(ValueError):
+        bag.to_money('EUR', {'USD': 1})
+
+
+def test_money_bag_quantize():
+    bag = MoneyBag([Money('1.005', 'EUR'), Money('1.5', 'JPY')])
+    assert list(bag.quantize()) == [Money('1.01', 'EUR'), Money(2, 'JPY')]
+
+
+def test_taxed_money_bag():
+    bag = TaxedMoneyBag([taxed(10, 12), taxed(1, 1, 'USD'), Money(1, 'EUR')])
+    assert bag['EUR'] == taxed(11, 13)
+    assert bag['GBP'] == taxed(0, 0, 'GBP')
+    assert bag.net == MoneyBag([Money(11, 'EUR'), Money(1, 'USD')])
+    assert bag.gross == MoneyBag([Money(13, 'EUR'), Money(1, 'USD')])
+    assert list(bag) == [taxed(11, 13), taxed(1, 1, 'USD')]
+    bag.add(taxed(1, 2), 2)
+    bag += MoneyBag([Money(1, 'USD')])
+    bag -= taxed(1, 1)
+    assert bag == TaxedMoneyBag([taxed(12, 16), taxed(2, 2, 'USD')])
+    assert bag + TaxedMoneyBag([taxed(1, 1, 'GBP')]) == TaxedMoneyBag(
+        [taxed(12, 16), taxed(2, 2, 'USD'), taxed(1, 1, 'GBP')])
+    assert MoneyBag([Money(1, 'EUR')]) + bag == TaxedMoneyBag(
+        [taxed(13, 17), taxed(2, 2, 'USD')])
+    assert -bag - bag == TaxedMoneyBag(
+        [taxed(-24, -32), taxed(-4, -4, 'USD')])
+    with pytest.raises(TypeError):
+        bag.add(1)
+
+
+def test_taxed_money_bag_conversion():
+    bag = TaxedMoneyBag([taxed('10', '12.30'), taxed(1, 2, 'USD')])
+    assert bag.to_taxed_money('EUR', {'USD': '0.5'}) == taxed('10.50', '13.30')
+    assert bag.quantize() == TaxedMoneyBag(
+        [taxed('10.00', '12.30'), taxed(1, 2, 'USD')])
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from prices import Money, MoneyRange
@@ -145,3 +147,35 @@ def test_repr():
     price_range = MoneyRange(price1, price2)
     assert repr(price_range) == (
         "MoneyRange(Money('10', 'EUR'), Money('30', 'EUR'))")
+
+
+def test_immutability():
+    price_range = MoneyRange(Money(1, 'USD'), Money(2, 'USD'))
+    with pytest.raises(AttributeError):
+        price_range.start = Money(2, 'USD')
+    with pytest.raises(AttributeError):
+        del price_range.stop
+
+
+def test_hash():
+    price_range = MoneyRange(Money('1.0', 'USD'), Money(2, 'USD'))
+    other = MoneyRange(Money(1, 'USD'), Money('2.00', 'USD'))
+    assert hash(price_range) == hash(other)
+    assert len({price_range, other}) == 1
+
+
+def test_pickle():
+    price_range = MoneyRange(Money(1, 'USD'), Money(2, 'USD'))
+    assert pickle.loads(pickle.dumps(price_range)) == price_range
+    assert pickle.dumps(price_range).count(b'USD') == 1
+
+
+class PriceRange(MoneyRange):
+    __slots__ = ()
+
+
+def test_pickle_subclass():
+    price_range = PriceRange(Money(1, 'USD'), Money(2, 'USD'))
+    result = pickle.loads(pickle.dumps(price_range))
+    assert type(result) is PriceRange
+    assert result == price_range
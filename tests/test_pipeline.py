@@ -0,0 +1,116 @@
+import random
+from decimal import ROUND_HALF_UP, Decimal
+from functools import partial
+
+import pytest
+
+from prices import (
+    IntegerMoney, Money, MoneyRange, PricingPipeline, TaxedMoney,
+    TaxedMoneyRange, TaxRate, fixed_discount, flat_tax, fractional_discount,
+    percentage_discount)
+
+STEPS = [
+    partial(percentage_discount, percentage=15),
+    partial(fractional_discount, fraction=Decimal('0.1'), from_gross=False,
+            rounding=ROUND_HALF_UP),
+    partial(fixed_discount, discount=Money('2.50', 'USD')),
+    partial(flat_tax, tax_rate=Decimal('0.23')),
+    partial(flat_tax, tax_rate=Decimal('0.08'), keep_gross=True),
+    partial(flat_tax, tax_rate=TaxRate('0.05')),
+    partial(flat_tax, tax_rate=TaxRate('0.25'), keep_gross=True),
+    partial(percentage_discount, percentage=Decimal('12.5'), from_gross=False),
+    partial(fixed_discount, discount=Money(1, 'USD'))]
+
+
+def apply_steps(steps, value):
+    for step in steps:
+        value = step(value)
+    return value
+
+
+def random_prices(rng):
+    amount = Decimal(rng.randint(0, 10 ** 5)).scaleb(-2)
+    other = amount + Decimal(rng.randint(0, 10 ** 4)).scaleb(-2)
+    money = Money(amount, 'USD')
+    taxed = TaxedMoney(money, Money(other, 'USD'))
+    return [
+        money, taxed, MoneyRange(money, Money(other, 'USD')),
+        TaxedMoneyRange(taxed, TaxedMoney(Money(other, 'USD'), Money(other * 2, 'USD')))]
+
+
+def assert_identical(result, expected):
+    assert type(result) is type(expected)
+    assert repr(result) == repr(expected)
+
+
+def test_matches_functions():
+    rng = random.Random(0)
+    for _ in range(200):
+        steps = rng.sample(STEPS, rng.randint(1, len(STEPS)))
+        pipeline = PricingPipeline(*steps)
+        for value in random_prices(rng):
+            assert_identical(pipeline(value), apply_steps(steps, value))
+
+
+def test_apply_many():
+    rng = random.Random(1)
+    pipeline = PricingPipeline(*STEPS)
+    values = [value for _ in range(50) for value in random_prices(rng)]
+    results = pipeline.apply_many(values)
+    for value, result in zip(values, results):
+        assert_identical(result, apply_steps(STEPS, value))
+
+
+def test_other_callables():
+    steps = [
+        partial(percentage_discount, percentage=10),
+        lambda price: price * 2,
+        partial(flat_tax, tax_rate=Decimal('0.5'))]
+    pipeline = PricingPipeline(*steps)
+    assert len(pipeline.segments) == 3
+    assert pipeline(Money(10, 'EUR')) == apply_steps(steps, Money(10, 'EUR'))
+    assert pipeline.apply_many([Money(10, 'EUR')]) == [
+        apply_steps(steps, Money(10, 'EUR'))]
+
+
+def test_subclasses_use_functions():
+    pipeline = PricingPipeline(*STEPS)
+    assert pipeline(IntegerMoney(10000, 'USD')) == pipeline(Money(100, 'USD'))
+    pipeline = PricingPipeline(partial(flat_tax, tax_rate=Decimal('0.23')))
+    assert isinstance(pipeline(IntegerMoney(10000, 'USD')).gross, IntegerMoney)
+
+
+def test_overriding_registrations_are_used():
+    pipeline = PricingPipeline(*STEPS)
+    builtin = fixed_discount.dispatcher.handlers[Money]
+
+    def free(base, _discount):
+        return Money(0, base.currency)
+
+    fixed_discount.register(Money, free)
+    try:
+        assert pipeline(Money(100, 'USD')) == TaxedMoney(
+            Money(0, 'USD'), Money(0, 'USD'))
+        assert pipeline(Money(100, 'USD')) == apply_steps(
+            STEPS, Money(100, 'USD'))
+        later = PricingPipeline(partial(fixed_discount, discount=Money(1, 'USD')))
+        assert later(Money(100, 'USD')) == Money(0, 'USD')
+        taxed = TaxedMoney(Money(100, 'USD'), Money(123, 'USD'))
+        assert_identical(pipeline(taxed), apply_steps(STEPS, taxed))
+    finally:
+        fixed_discount.register(Money, builtin)
+    assert pipeline(Money(100, 'USD')) == apply_steps(STEPS, Money(100, 'USD'))
+    assert len(pipeline.segments[0].handlers) == 4
+
+
+def test_errors():
+    pipeline = PricingPipeline(partial(fixed_discount, discount=Money(1, 'USD')))
+    with pytest.raises(ValueError):
+        pipeline(Money(10, 'EUR'))
+    with pytest.raises(TypeError):
+        pipeline(10)
+
+
+def test_repr():
+    pipeline = PricingPipeline(partial(flat_tax, tax_rate=1))
+    assert repr(pipeline).startswith('PricingPipeline(functools.partial(')
@@ -0,0 +1,63 @@
+import pytest
+
+from prices import (
+    IntegerMoney, Money, MoneyRange, RangeBuilder, TaxedMoney,
+    TaxedMoneyRange, build_ranges)
+
+
+def test_build_ranges():
+    ranges = build_ranges([
+        ('a', Money(10, 'USD')), ('b', Money(3, 'EUR')),
+        ('a', Money(5, 'USD')), ('a', Money(15, 'USD')),
+        ('a', Money(12, 'USD'))])
+    assert list(ranges) == ['a', 'b']
+    assert ranges['a'] == MoneyRange(Money(5, 'USD'), Money(15, 'USD'))
+    assert ranges['b'] == MoneyRange(Money(3, 'EUR'), Money(3, 'EUR'))
+
+
+def test_matches_min_and_max():
+    prices = [Money('1.0', 'USD'), Money('1', 'USD'), Money('1.00', 'USD')]
+    price_range = build_ranges(('a', price) for price in prices)['a']
+    assert str(price_range.start.amount) == str(min(prices).amount)
+    assert str(price_range.stop.amount) == str(max(prices).amount)
+
+
+def test_taxed_money():
+    prices = [
+        TaxedMoney(Money(10, 'USD'), Money(12, 'USD')),
+        TaxedMoney(Money(8, 'USD'), Money(10, 'USD')),
+        TaxedMoney(Money(9, 'USD'), Money(10, 'USD')),
+        TaxedMoney(Money(11, 'USD'), Money(14, 'USD'))]
+    price_range = build_ranges(('a', price) for price in prices)['a']
+    assert price_range == TaxedMoneyRange(min(prices), max(prices))
+    assert price_range.start.net == Money(8, 'USD')
+
+
+def test_money_subclasses():
+    ranges = build_ranges([
+        ('a', IntegerMoney(500, 'USD')), ('a', Money(1, 'USD'))])
+    assert ranges['a'] == MoneyRange(Money(1, 'USD'), Money(5, 'USD'))
+
+
+def test_incremental():
+    builder = RangeBuilder()
+    builder.add('a', Money(1, 'USD'))
+    builder.update([('a', Money(3, 'USD'))])
+    builder.add('a', Money(2, 'USD'))
+    assert len(builder) == 1
+    assert builder.ranges() == {
+        'a': MoneyRange(Money(1, 'USD'), Money(3, 'USD'))}
+
+
+def test_mixed_currencies():
+    with pytest.raises(ValueError):
+        build_ranges([('a', Money(1, 'USD')), ('a', Money(1, 'EUR'))])
+
+
+def test_invalid_prices():
+    with pytest.raises(TypeError):
+        build_ranges([
+            ('a', Money(1, 'USD')),
+            ('a', TaxedMoney(Money(1, 'USD'), Money(1, 'USD')))])
+    with pytest.raises(TypeError):
+        build_ranges([('a', 1)])
@@ -0,0 +1,124 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from prices import Money, MoneyRange, RangeIndex, TaxedMoney, TaxedMoneyRange
+
+
+def _range(start, stop, currency='USD'):
+    return MoneyRange(Money(start, currency), Money(stop, currency))
+
+
+def test_containing():
+    index = RangeIndex({
+        'a': _range(10, 20), 'b': _range(15, 30), 'c': _range(20, 20),
+        'd': _range(10, 20, 'EUR')})
+    assert index.containing(Money(5, 'USD')) == []
+    assert index.containing(Money(10, 'USD')) == ['a']
+    assert index.containing(Money(20, 'USD')) == ['a', 'b', 'c']
+    assert index.containing(Money(25, 'USD')) == ['b']
+    assert index.containing(Money(15, 'EUR')) == ['d']
+    assert index.containing(Money(15, 'GBP')) == []
+
+
+def test_overlapping():
+    index = RangeIndex([
+        ('a', _range(10, 20)), ('b', _range(15, 30)), ('c', _range(40, 50))])
+    assert index.overlapping(_range(0, 9)) == []
+    assert index.overlapping(_range(0, 10)) == ['a']
+    assert index.overlapping(_range(20, 40)) == ['a', 'b', 'c']
+    assert index.overlapping(_range(31, 39)) == []
+
+
+def test_contains_many():
+    index = RangeIndex({'a': _range(10, 20), 'b': _range(15, 30)})
+    assert index.contains_many([
+        Money(12, 'USD'), Money(16, 'USD'), Money(40, 'USD')]) == [
+            ['a'], ['a', 'b'], []]
+
+
+def test_taxed_ranges_use_gross():
+    index = RangeIndex({
+        'a': TaxedMoneyRange(
+            TaxedMoney(Money(10, 'USD'), Money(12, 'USD')),
+            TaxedMoney(Money(20, 'USD'), Money(24, 'USD')))})
+    assert index.containing(
+        TaxedMoney(Money(10, 'USD'), Money(13, 'USD'))) == ['a']
+    assert index.containing(
+        TaxedMoney(Money(11, 'USD'), Money(11, 'USD'))) == []
+
+
+def test_taxed_bounds_compare_net_like_contains():
+    start = TaxedMoney(Money(10, 'USD'), Money(12, 'USD'))
+    stop = TaxedMoney(Money(20, 'USD'), Money(24, 'USD'))
+    taxed_range = TaxedMoneyRange(start, stop)
+    index = RangeIndex({'a': taxed_range})
+    for price in [
+            start, stop, TaxedMoney(Money(11, 'USD'), Money(12, 'USD')),
+            TaxedMoney(Money(19, 'USD'), Money(24, 'USD'))]:
+        expected = ['a'] if price in taxed_range else []
+        assert index.containing(price) == expected
+    assert index.containing(
+        TaxedMoney(Money(11, 'USD'), Money(12, 'USD'))) == []
+    assert index.containing(Money(12, 'USD')) == ['a']
+    assert index.overlapping(TaxedMoneyRange(
+        TaxedMoney(Money(21, 'USD'), Money(24, 'USD')),
+        TaxedMoney(Money(25, 'USD'), Money(30, 'USD')))) == []
+    assert index.overlapping(TaxedMoneyRange(
+        stop, TaxedMoney(Money(25, 'USD'), Money(30, 'USD')))) == ['a']
+    assert index.overlapping(_range(24, 30)) == ['a']
+
+
+def test_insert_and_remove():
+    index = RangeIndex()
+    index.insert('a', _range(10, 20))
+    index.insert('b', _range(10, 20))
+    assert len(index) == 2
+    assert index.containing(Money(10, 'USD')) == ['a', 'b']
+    index.insert('a', _range(30, 40))
+    assert index.containing(Money(10, 'USD')) == ['b']
+    index.remove('b')
+    assert 'b' not in index
+    assert index.containing(Money(10, 'USD')) == []
+    index.remove('a')
+    assert len(index) == 0
+    with pytest.raises(KeyError):
+        index.remove('a')
+
+
+def test_invalid_arguments():
+    with pytest.raises(TypeError):
+        RangeIndex({'a': Money(1, 'USD')})
+    with pytest.raises(KeyError):
+        RangeIndex([('a', _range(1, 2)), ('a', _range(1, 2))])
+    with pytest.raises(TypeError):
+        RangeIndex().containing(Decimal(1))
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    ranges = {}
+    for key in range(300):
+        start = rng.randint(0, 1000)
+        ranges[key] = _range(start, start + rng.randint(0, 100))
+    index = RangeIndex(ranges)
+    for key in range(300, 400):
+        start = rng.randint(0, 1000)
+        ranges[key] = _range(start, start + rng.randint(0, 100))
+        index.insert(key, ranges[key])
+    for key in rng.sample(sorted(ranges), 150):
+        del ranges[key]
+        index.remove(key)
+    for _ in range(100):
+        start = rng.randint(0, 1100)
+        query = _range(start, start + rng.randint(0, 50))
+        expected = {
+            key for key, price_range in ranges.items()
+            if price_range.start <= query.stop and
+            query.start <= price_range.stop}
+        assert set(index.overlapping(query)) == expected
+        price = query.start
+        assert set(index.containing(price)) == {
+            key for key, price_range in ranges.items()
+            if price in price_range}
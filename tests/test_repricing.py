@@ -0,0 +1,62 @@
+from decimal import Decimal
+from functools import partial
+from operator import methodcaller
+
+import pytest
+
+from prices import (
+    Money, MoneyRange, PricingPipeline, Repricer, TaxedMoney, TaxedMoneyRange,
+    fixed_discount, flat_tax, percentage_discount, reprice)
+
+STEPS = (
+    partial(percentage_discount, percentage=10),
+    partial(flat_tax, tax_rate=Decimal('0.23')))
+
+
+def catalog(size):
+    values = []
+    for index in range(size):
+        money = Money(Decimal(index).scaleb(-2), 'USD')
+        values.append(money)
+        values.append(TaxedMoney(money, money * 2))
+        values.append(MoneyRange(money, money * 3))
+    return values
+
+
+def test_matches_pipeline():
+    values = catalog(100)
+    expected = PricingPipeline(*STEPS).apply_many(values)
+    with Repricer(*STEPS, processes=2, chunk_size=7, max_pending=3) as repricer:
+        assert list(repricer.map(values)) == expected
+        assert list(repricer.map(iter(values[:5]))) == expected[:5]
+        assert list(repricer.map([])) == []
+
+
+def test_reprice():
+    values = catalog(10)
+    steps = STEPS + (methodcaller('quantize'),)
+    results = list(reprice(values, *steps, processes=2, chunk_size=4))
+    assert results == PricingPipeline(*steps).apply_many(values)
+    assert isinstance(results[-1].start, TaxedMoney)
+    assert isinstance(results[-1], TaxedMoneyRange)
+
+
+def test_values_are_sent_exactly():
+    taxed = TaxedMoney(Money('-0.00', 'XYZ'), Money('1.5E+3', 'XYZ'))
+    values = [
+        Money('1.000', 'USD'), taxed, TaxedMoneyRange(taxed, taxed),
+        MoneyRange(Money(1, 'JPY'), Money('2.0', 'JPY'))]
+    results = list(reprice(values, processes=1))
+    assert list(map(repr, results)) == list(map(repr, values))
+
+
+def test_errors_are_raised():
+    steps = (partial(fixed_discount, discount=Money(1, 'EUR')),)
+    with pytest.raises(ValueError):
+        list(reprice(catalog(3), *steps, processes=1))
+    with pytest.raises(TypeError):
+        list(reprice([1], processes=1))
+    with pytest.raises(ValueError):
+        Repricer(chunk_size=0)
+    with pytest.raises(ValueError):
+        Repricer(max_pending=0)
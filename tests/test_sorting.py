@@ -0,0 +1,55 @@
+import pytest
+
+from prices import (
+    IntegerMoney, Money, TaxedMoney, sort_by_currency, sort_key, sort_prices)
+
+
+def taxed(net, gross, currency='EUR'):
+    return TaxedMoney(Money(net, currency), Money(gross, currency))
+
+
+def test_sort_key():
+    assert sort_key(Money('1.50', 'USD')) == ('USD', Money('1.50', 'USD').amount)
+    price = taxed(10, 12)
+    assert sort_key(price) == ('EUR', 12)
+    assert sort_key(price, 'net') == ('EUR', 10)
+    values = [Money(3, 'USD'), Money(2, 'EUR'), Money(1, 'USD')]
+    assert sorted(values, key=sort_key) == [
+        Money(2, 'EUR'), Money(1, 'USD'), Money(3, 'USD')]
+    with pytest.raises(TypeError):
+        sort_key(5)
+    with pytest.raises(ValueError):
+        sort_key(price, 'tax')
+
+
+def test_sort_prices_matches_sorted():
+    values = [Money(amount, 'USD') for amount in ('3', '1.5', '2', '1.50', '0')]
+    assert sort_prices(values) == sorted(values)
+    assert sort_prices(values, reverse=True) == sorted(values, reverse=True)
+    assert sort_prices([]) == []
+    values.append(IntegerMoney(1, 'USD'))
+    assert sort_prices(values) == sorted(values)
+
+
+def test_sort_prices_taxed():
+    values = [taxed(10, 13), taxed(11, 12), taxed(9, 14)]
+    assert sort_prices(values) == [taxed(11, 12), taxed(10, 13), taxed(9, 14)]
+    assert sort_prices(values, by='net') == [
+        taxed(9, 14), taxed(10, 13), taxed(11, 12)]
+
+
+def test_sort_prices_rejects_mixed_values():
+    with pytest.raises(ValueError):
+        sort_prices([Money(1, 'USD'), Money(1, 'EUR')])
+    with pytest.raises(TypeError):
+        sort_prices([taxed(1, 1), Money(1, 'EUR')])
+    with pytest.raises(TypeError):
+        sort_prices([Money(1, 'EUR'), taxed(1, 1)])
+
+
+def test_sort_by_currency():
+    values = [Money(3, 'USD'), Money(2, 'EUR'), Money(1, 'USD')]
+    groups = sort_by_currency(values, reverse=True)
+    assert list(groups) == ['USD', 'EUR']
+    assert groups['USD'] == [Money(3, 'USD'), Money(1, 'USD')]
+    assert groups['EUR'] == [Money(2, 'EUR')]
@@ -1,6 +1,9 @@
+import pickle
+from decimal import Decimal
+
 import pytest
 
-from prices import Money, TaxedMoney, sum
+from prices import IntegerMoney, Money, TaxedMoney, sum
 
 
 def test_construction():
@@ -54,6 +57,8 @@ def test_division():
     assert price / 2 == TaxedMoney(Money(5, 'EUR'), Money(10, 'EUR'))
     with pytest.raises(TypeError):
         price / price
+    with pytest.raises(TypeError):
+        price / Money(2, 'EUR')
 
 
 def test_comparison():
@@ -104,3 +109,45 @@ def test_sum():
     assert sum([Money(5, 'USD'), Money(10, 'USD')]) == Money(15, 'USD')
     with pytest.raises(TypeError):
         sum([])
+
+
+def test_from_rows():
+    rows = [(Decimal('10.00'), Decimal('12.30'), 'USD'), (1, '1.23', 'EUR')]
+    values = TaxedMoney.from_rows(rows)
+    assert values == [
+        TaxedMoney(Money(10, 'USD'), Money('12.30', 'USD')),
+        TaxedMoney(Money(1, 'EUR'), Money('1.23', 'EUR'))]
+    assert values[1].net.amount == Decimal(1)
+
+
+def test_immutability():
+    price = TaxedMoney(Money(1, 'USD'), Money(2, 'USD'))
+    with pytest.raises(AttributeError):
+        price.net = Money(2, 'USD')
+    with pytest.raises(AttributeError):
+        del price.gross
+
+
+def test_hash():
+    price = TaxedMoney(Money('1.0', 'USD'), Money('1.20', 'USD'))
+    assert hash(price) == hash(TaxedMoney(Money(1, 'USD'), Money('1.2', 'USD')))
+    assert len({price, TaxedMoney(Money(1, 'USD'), Money('1.2', 'USD'))}) == 1
+
+
+def test_pickle():
+    price = TaxedMoney(Money(1, 'USD'), Money('1.23', 'USD'))
+    assert pickle.loads(pickle.dumps(price)) == price
+    data = pickle.dumps(price, pickle.HIGHEST_PROTOCOL)
+    assert data.count(b'USD') == 1
+
+
+class Price(TaxedMoney):
+    __slots__ = ()
+
+
+def test_pickle_subclass():
+    price = Price(IntegerMoney(100, 'USD'), Money('1.23', 'USD'))
+    result = pickle.loads(pickle.dumps(price))
+    assert type(result) is Price
+    assert type(result.net) is IntegerMoney
+    assert result == price
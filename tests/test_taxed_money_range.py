@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
@@ -202,3 +204,40 @@ def test_repr():
     price_range = TaxedMoneyRange(price1, price2)
     assert repr(price_range) == (
         "TaxedMoneyRange(TaxedMoney(net=Money('10', 'EUR'), gross=Money('15', 'EUR')), TaxedMoney(net=Money('30', 'EUR'), gross=Money('45', 'EUR')))")
+
+
+def test_immutability():
+    price = TaxedMoney(Money(1, 'USD'), Money(1, 'USD'))
+    price_range = TaxedMoneyRange(price, price)
+    with pytest.raises(AttributeError):
+        price_range.start = price
+    with pytest.raises(AttributeError):
+        del price_range.stop
+
+
+def test_hash():
+    price = TaxedMoney(Money(1, 'USD'), Money(1, 'USD'))
+    other = TaxedMoney(Money('1.00', 'USD'), Money('1.0', 'USD'))
+    assert hash(TaxedMoneyRange(price, price)) == hash(TaxedMoneyRange(other, other))
+    assert len({TaxedMoneyRange(price, price), TaxedMoneyRange(other, other)}) == 1
+
+
+def test_pickle():
+    price = TaxedMoney(Money(1, 'USD'), Money(2, 'USD'))
+    price_range = TaxedMoneyRange(price, price)
+    assert pickle.loads(pickle.dumps(price_range)) == price_range
+    data = pickle.dumps(price_range, pickle.HIGHEST_PROTOCOL)
+    assert data.count(b'USD') == 1
+    assert len(data) < 120
+
+
+class PriceRange(TaxedMoneyRange):
+    __slots__ = ()
+
+
+def test_pickle_subclass():
+    price = TaxedMoney(Money(1, 'USD'), Money(2, 'USD'))
+    price_range = PriceRange(price, price)
+    result = pickle.loads(pickle.dumps(price_range))
+    assert type(result) is PriceRange
+    assert result == price_range
@@ -0,0 +1,65 @@
+from decimal import Decimal
+
+import pytest
+
+from prices import (
+    IntegerMoney, Money, MoneyRange, TaxedMoney, TaxedMoneyRange, sum)
+
+
+def test_sum_money():
+    values = [Money('1.50', 'USD'), Money(2, 'USD'), Money('0.25', 'USD')]
+    total = sum(values)
+    assert type(total) is Money  # pylint: disable=unidiomatic-typecheck
+    assert str(total.amount) == '3.75'
+    assert sum(iter(values)) == Money('3.75', 'USD')
+    assert sum([Money(1, 'USD')]) == Money(1, 'USD')
+    with pytest.raises(ValueError):
+        sum([Money(1, 'USD'), Money(1, 'EUR')])
+
+
+def test_sum_taxed_money():
+    values = [
+        TaxedMoney(Money(10, 'USD'), Money(12, 'USD')),
+        Money(1, 'USD'),
+        TaxedMoney(Money(5, 'USD'), Money(6, 'USD'))]
+    assert sum(values) == TaxedMoney(Money(16, 'USD'), Money(19, 'USD'))
+    with pytest.raises(ValueError):
+        sum([values[0], TaxedMoney(Money(1, 'EUR'), Money(1, 'EUR'))])
+    with pytest.raises(ValueError):
+        sum([values[0], Money(1, 'EUR')])
+
+
+def test_sum_with_start():
+    assert sum([], start=Money(0, 'USD')) == Money(0, 'USD')
+    assert sum([Money(1, 'USD')], Money(2, 'USD')) == Money(3, 'USD')
+    zero = TaxedMoney(Money(0, 'USD'), Money(0, 'USD'))
+    assert sum([], zero) is zero
+    with pytest.raises(TypeError):
+        sum([])
+
+
+def test_sum_mixed_types():
+    total = sum([Money(1, 'USD'), IntegerMoney(150, 'USD'), Money(1, 'USD')])
+    assert total == Money('3.50', 'USD')
+    price = TaxedMoney(Money(1, 'USD'), Money(2, 'USD'))
+    total = sum([Money(1, 'USD'), price], start=price)
+    assert total == TaxedMoney(Money(3, 'USD'), Money(5, 'USD'))
+    with pytest.raises(TypeError):
+        sum([Money(1, 'USD'), price])
+
+
+def test_sum_ranges():
+    money_range = MoneyRange(Money(1, 'USD'), Money(2, 'USD'))
+    assert sum([money_range, money_range, Money(1, 'USD')]) == MoneyRange(
+        Money(3, 'USD'), Money(5, 'USD'))
+    price = TaxedMoney(Money(1, 'USD'), Money(1, 'USD'))
+    taxed_range = TaxedMoneyRange(price, price)
+    assert sum([taxed_range, price]).start == price + price
+
+
+def test_sum_matches_addition():
+    values = [Money(Decimal(i).scaleb(-3), 'EUR') for i in range(1000)]
+    expected = values[0]
+    for value in values[1:]:
+        expected += value
+    assert repr(sum(values)) == repr(expected)